@@ -18,7 +18,9 @@ charmcraft fetch-lib charms.sdcore_nms_k8s.v0.fiveg_core_gnb
 
 Add the following libraries to the charm's `requirements.txt` file:
 - pydantic
-- pytest-interface-tester
+
+`pytest-interface-tester` is only required to load `ProviderSchema` and `RequirerSchema`, which
+are used by the interface tests.
 
 Charms providing the `fiveg_core_gnb` relation should use `FivegCoreGnbProvides`.
 The class `PLMNConfig` represents the configuration of a PLMN for the CU/gNodeB. It is composed by
@@ -58,6 +60,55 @@ Typical usage of this class would look something like:
             )
     ```
 
+    The names of all the related CUs/gNodeBs are indexed by `gnb_registry()`, which also
+    resolves a name back to its relation ID:
+
+    ```python
+            registry = self.fiveg_core_gnb_provider.gnb_registry()
+            relation_id = registry.get_relation_id("gnb001")
+    ```
+
+    Large PLMN lists can be published in shards of `shard_size` PLMNs, under the `plmns.0` to
+    `plmns.N` keys, with a `plmns-manifest` listing the digest of every shard. Only the shards
+    which change are written again, and requirers only decode these shards. Requirers using a
+    version of this library older than LIBPATCH 18 cannot read sharded PLMNs:
+
+    ```python
+            self.fiveg_core_gnb_provider.publish_gnb_config_information(
+                relation_id=relation_id, tac=tac, plmns=plmns, shard_size=256
+            )
+    ```
+
+    With many related CUs/gNodeBs, `validate_all_requirers` reads all the requirer databags at
+    once and validates them in batches, optionally on a `concurrent.futures` executor. The
+    results also refresh `gnb_registry`:
+
+    ```python
+            with concurrent.futures.ProcessPoolExecutor(max_workers=4) as executor:
+                results = self.fiveg_core_gnb_provider.validate_all_requirers(executor=executor)
+            invalid = {relation_id for relation_id, result in results.items() if result.error}
+    ```
+
+    To fan the same config out to many CUs/gNodeBs, use `publish_gnb_config_bulk`, which only
+    writes to the relations whose data actually changes:
+
+    ```python
+            report = self.fiveg_core_gnb_provider.publish_gnb_config_bulk(
+                {relation.id: (tac, plmns) for relation in self.model.relations["fiveg_core_gnb"]}
+            )
+    ```
+
+    A single requirer application can also serve a fleet of CUs/gNodeBs, in which case it
+    publishes all their names, see `GnbNameRegistry.get_gnb_names`. Each of them gets its own
+    TAC and PLMNs with `publish_fleet_gnb_config`:
+
+    ```python
+            for relation_id, gnb_names in registry.fleet_gnb_names.items():
+                self.fiveg_core_gnb_provider.publish_fleet_gnb_config(
+                    relation_id, {gnb_name: (tac, plmns) for gnb_name in gnb_names}
+                )
+    ```
+
     And a corresponding section in charm's `charmcraft.yaml`:
     ```
     provides:
@@ -102,6 +153,91 @@ Typical usage of this class would look something like:
             # Do something with the TAC and PLMNs.
     ```
 
+    Charms which only need to react to actual changes of the TAC or the PLMNs can observe
+    `gnb_config_changed` instead of `relation_changed`. It is emitted when the digest of the TAC
+    and PLMNs differs from the last one seen, so rewrites of identical values are ignored:
+
+    ```python
+            self.framework.observe(
+                self.fiveg_core_gnb.on.gnb_config_changed, self._on_gnb_config_changed
+            )
+    ```
+
+    To apply incremental changes, observe `plmn_added`, `plmn_removed` and `tac_changed`
+    instead. The PLMN events only carry the PLMNs which were added or removed, each PLMN being
+    identified by its MCC, MNC, SST and SD:
+
+    ```python
+            self.framework.observe(self.fiveg_core_gnb.on.plmn_added, self._on_plmn_added)
+            self.framework.observe(self.fiveg_core_gnb.on.plmn_removed, self._on_plmn_removed)
+            self.framework.observe(self.fiveg_core_gnb.on.tac_changed, self._on_tac_changed)
+
+        def _on_plmn_added(self, event: PLMNAddedEvent):
+            for plmn in event.plmns:
+                # Configure the new slice, e.g. plmn["mcc"], plmn["mnc"], plmn["sst"], plmn["sd"]
+    ```
+
+    PLMNs published in shards are read transparently. Shards already validated by a previous
+    hook are not decoded again.
+
+    The remote application data is parsed and validated only once per hook. The validated
+    result is also kept across hooks, keyed by the digest of the raw databag, so that unchanged
+    data is not validated again. `tac` and `plmns` are both served from the same
+    `GnbConfigSnapshot`, which can also be read directly:
+
+    ```python
+        if snapshot := self.fiveg_core_gnb.snapshot():
+            tac, plmns = snapshot.tac, snapshot.plmns
+    ```
+
+    `plmns` returns the validated PLMNs as `PLMNConfig` objects, which are built again on every
+    access. The snapshot instead holds them as lightweight, immutable and hashable `PLMN`
+    objects, which compare equal to a `PLMNConfig` with the same fields and are cheaper to read
+    in every hook. For bulk access to a single field, `plmn_table` returns a columnar
+    `PLMNTable` view, e.g. `self.fiveg_core_gnb.plmn_table.sst`.
+
+    PLMNs also expose their 3GPP encodings, `plmn_id` (BCD PLMN identity) and `snssai`, which
+    are computed once per distinct value. `GnbConfigSnapshot.packed_plmns` packs the whole list
+    in fixed size records, which `unpack_plmns` decodes. 3GPP TS 23.003 reserves the SD
+    `NO_SD` (0xFFFFFF) to mean that there is no SD, so a `PLMN` built with it has no SD, and is
+    encoded and packed as such:
+
+    ```python
+        if snapshot := self.fiveg_core_gnb.snapshot():
+            gnb.set_plmns(snapshot.packed_plmns)
+    ```
+
+    When the charm sets an OpenTelemetry tracer provider, reading, validating and publishing the
+    relation data is traced. The spans record the relation ID, the number of PLMNs and whether
+    the validation cache was hit.
+
+    `validation_failures` counts the invalid data published by the provider, per
+    `ValidationFailureReason`, e.g. to be exported as metrics. Invalid provider data is logged
+    once as an error. As long as the provider keeps publishing the same data, the repeats are
+    only counted, and summarized in a warning at most once an hour.
+
+    The PLMNs are decoded and validated one at a time by `iter_plmns`, which stops at the first
+    invalid PLMN. Already decoded PLMNs can be validated with `validate_plmns`. Both only fall
+    back to pydantic to explain why a PLMN is invalid. To reject providers publishing too many
+    PLMNs, pass `max_plmns`:
+
+    ```python
+            self.fiveg_core_gnb = FivegCoreGnbRequires(
+                charm=self, relation_name="fiveg_core_gnb", max_plmns=1024
+            )
+    ```
+
+    To serve a fleet of CUs/gNodeBs from a single application, publish all their names at once.
+    The first one is also published as `gnb-name`, for providers which do not support fleets.
+    The TAC and PLMNs assigned to every CU/gNodeB are then returned by `gnb_configs`:
+
+    ```python
+            self.fiveg_core_gnb.publish_fleet_gnb_information(gnb_names=["gnb001", "gnb002"])
+            ...
+            if config := self.fiveg_core_gnb.gnb_configs().get("gnb002"):
+                tac, plmns = config.tac, config.plmns
+    ```
+
     And a corresponding section in charm's `charmcraft.yaml`:
     ```
     requires:
@@ -109,16 +245,44 @@ Typical usage of this class would look something like:
             interface: fiveg_core_gnb  # Relation interface
     ```
 """
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
 import json
 import logging
-from dataclasses import dataclass
-from json.decoder import JSONDecodeError
-from typing import Any, Dict, Optional
-
-from interface_tester.schema_base import DataBagSchema
-from ops.charm import CharmBase
-from ops.framework import Object
-from pydantic import BaseModel, Field, ValidationError, conlist
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from types import SimpleNamespace
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ops.charm import CharmBase, RelationBrokenEvent, RelationChangedEvent
+from ops.framework import EventBase, EventSource, Handle, Object, ObjectEvents, StoredState
+from ops.model import Relation
+
+try:
+    from opentelemetry import trace
+except ImportError:  # Older versions of ops do not depend on opentelemetry-api.
+    trace = None  # type: ignore[assignment]
 
 # The unique Charmhub library identifier, never change it
 LIBID = "196ff8f539ba4f2998209fbb50e2dbbf"
@@ -128,15 +292,98 @@ LIBAPI = 0
 
 # Increment this PATCH version before using `charmcraft publish-lib` or reset
 # to 0 if you are raising the major API version
-LIBPATCH = 1
+LIBPATCH = 31
 
 logger = logging.getLogger(__name__)
 
+# Spans are only recorded when the charm sets an OpenTelemetry tracer provider.
+_tracer = trace.get_tracer(__name__) if trace else None
+
+
+class _Truncated:
+    """Log argument only rendered, and truncated, when the record is emitted."""
+
+    def __init__(self, value: Any, max_length: int = 256):
+        self.value = value
+        self.max_length = max_length
+
+    def __str__(self) -> str:
+        text = str(self.value)
+        if len(text) <= self.max_length:
+            return text
+        return f"{text[:self.max_length]}... ({len(text)} characters)"
+
+
+def _plmns_asdict(plmns: Any) -> Optional[List[dict]]:
+    """Return the PLMNs as dictionaries, None if they are not a sequence of `PLMNConfig`."""
+    try:
+        return [plmn.asdict() for plmn in plmns]
+    except (AttributeError, TypeError):
+        return None
+
+
+def _plmns_summary(plmns_data: Optional[List[dict]]) -> str:
+    """Describe PLMNs to log by their number and digest, which bounds the size of the record.
+
+    Args:
+        plmns_data (list): PLMNs, as returned by `_plmns_asdict`.
+    """
+    if plmns_data is None:
+        return "PLMNs which are not PLMNConfig"
+    digest = hashlib.sha256(json.dumps(plmns_data).encode()).hexdigest()[:12]
+    return f"{len(plmns_data)} PLMNs (digest {digest})"
+
+
+# Number of times each invalid data was seen by the schema checks in this hook, by digest.
+_invalid_data_counts: Dict[str, int] = {}
+
+
+def _data_digest(data: Any) -> str:
+    """Return the digest of data, as shown in the logs about invalid data."""
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _log_schema_error(data: Any, error: Exception) -> None:
+    """Log invalid data at ERROR the first time it is seen in a hook, then at DEBUG."""
+    digest = _data_digest(data)
+    count = _invalid_data_counts.get(digest, 0) + 1
+    _invalid_data_counts[digest] = count
+    if count == 1:
+        logger.error("Invalid data %s: %s", digest[:12], _Truncated(error))
+    else:
+        logger.debug("Invalid data %s, already logged, seen %d times", digest[:12], count)
+
+
+class _NonRecordingSpan:
+    """Stand-in span used when opentelemetry-api is not installed."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Ignore the attribute."""
+
+
+def _start_span(name: str, attributes: Optional[Dict[str, Any]] = None) -> ContextManager:
+    """Start a span of the library, made the current span until the context is exited.
+
+    Args:
+        name (str): Name of the span.
+        attributes (dict): Attributes of the span.
+
+    Returns:
+        ContextManager: Context yielding the span.
+    """
+    if _tracer is None:
+        return contextlib.nullcontext(_NonRecordingSpan())
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
 """Schemas definition for the provider and requirer sides of the `fiveg_core_gnb` interface.
 It exposes two interfaces.schema_base.DataBagSchema subclasses called:
 - ProviderSchema
 - RequirerSchema
 
+The schemas and the pydantic models they are built from (`PLMNConfig`,
+`FivegCoreGnbProviderAppData` and `FivegCoreGnbRequirerAppData`) are loaded on first access, so
+importing this library does not import pydantic nor interface_tester.
+
 Examples:
     ProviderSchema:
         unit: <empty>
@@ -156,63 +403,209 @@ Examples:
         app: {
             "gnb-name": "gnb001",
         }
+
+    Sharded PLMNs replace `plmns` with the JSON encoded shards and their SHA-256 digests:
+
+    ProviderSchema:
+        unit: <empty>
+        app: {
+            "tac": 1,
+            "plmns.0": [{"mcc": "001", "mnc": "01", "sst": 1, "sd": 1}],
+            "plmns.1": [{"mcc": "001", "mnc": "01", "sst": 2}],
+            "plmns-manifest": ["<digest of plmns.0>", "<digest of plmns.1>"],
+        }
+
+    Fleets of CUs/gNodeBs additionally use `gnb-names` and `gnb-configs`, which are JSON
+    encoded in the databags, like `plmns`:
+
+    ProviderSchema:
+        unit: <empty>
+        app: {
+            "tac": 1,
+            "plmns": [{"mcc": "001", "mnc": "01", "sst": 1, "sd": 1}],
+            "gnb-configs": {
+                "gnb001": {"tac": 1, "plmns": [{"mcc": "001", "mnc": "01", "sst": 1, "sd": 1}]},
+                "gnb002": {"tac": 2, "plmns": [{"mcc": "001", "mnc": "01", "sst": 1}]},
+            },
+        }
+    RequirerSchema:
+        unit: <empty>
+        app: {
+            "gnb-name": "gnb001",
+            "gnb-names": ["gnb001", "gnb002"],
+        }
 """
 
 
-@dataclass
-class PLMNConfig(BaseModel):
-    """Dataclass representing the configuration for a PLMN."""
+def _build_models() -> SimpleNamespace:
+    """Build the pydantic models of the interface.
 
-    def __init__(self, mcc: str, mnc: str, sst: int, sd: Optional[int] = None) -> None:
-        super().__init__(mcc=mcc, mnc=mnc, sst=sst, sd=sd)
+    pydantic is only imported here, so that hooks which never validate relation data do not pay
+    for it. Use `_models()` to get the cached result.
 
-    mcc: str = Field(
-        description="Mobile Country Code",
-        examples=["001", "208", "302"],
-        pattern=r"^[0-9][0-9][0-9]$",
-    )
-    mnc: str = Field(
-        description="Mobile Network Code",
-        examples=["01", "001", "999"],
-        pattern=r"^[0-9][0-9][0-9]?$",
-    )
-    sst: int = Field(
-        description="Slice/Service Type",
-        strict=True,
-        examples=[1, 2, 3, 4],
-        ge=0,
-        le=255,
-    )
-    sd: Optional[int] = Field(
-        description="Slice Differentiator",
-        strict=True,
-        default=None,
-        examples=[1],
-        ge=0,
-        le=16777215,
-    )
+    Returns:
+        SimpleNamespace: The models and the type adapters used to validate relation data.
+    """
+    from pydantic import BaseModel, Field, TypeAdapter, conlist, model_validator
+
+    tac_type = Annotated[
+        int,
+        Field(
+            description="Tracking Area Code",
+            strict=True,
+            examples=[1],
+            ge=1,
+            le=16777215,
+        ),
+    ]
+
+    @dataclass
+    class PLMNConfig(BaseModel):
+        """Dataclass representing the configuration for a PLMN."""
+
+        def __init__(self, mcc: str, mnc: str, sst: int, sd: Optional[int] = None) -> None:
+            super().__init__(mcc=mcc, mnc=mnc, sst=sst, sd=sd)
+
+        mcc: str = Field(
+            description="Mobile Country Code",
+            examples=["001", "208", "302"],
+            pattern=r"^[0-9][0-9][0-9]$",
+        )
+        mnc: str = Field(
+            description="Mobile Network Code",
+            examples=["01", "001", "999"],
+            pattern=r"^[0-9][0-9][0-9]?$",
+        )
+        sst: int = Field(
+            description="Slice/Service Type",
+            strict=True,
+            examples=[1, 2, 3, 4],
+            ge=0,
+            le=255,
+        )
+        sd: Optional[int] = Field(
+            description="Slice Differentiator",
+            strict=True,
+            default=None,
+            examples=[1],
+            ge=0,
+            le=16777215,
+        )
 
-    def asdict(self):
-        """Convert the dataclass into a dictionary."""
-        return {"mcc": self.mcc, "mnc": self.mnc, "sst": self.sst, "sd": self.sd}
+        def asdict(self):
+            """Convert the dataclass into a dictionary."""
+            return {"mcc": self.mcc, "mnc": self.mnc, "sst": self.sst, "sd": self.sd}
+
+    class GnbConfig(BaseModel):
+        """TAC and PLMNs of a CU/gNB of a fleet."""
+        tac: tac_type  # type: ignore[valid-type]
+        plmns: conlist(PLMNConfig, min_length=1)  # type: ignore[reportInvalidTypeForm]
+
+    class FivegCoreGnbProviderAppData(BaseModel):
+        """Provider application data for fiveg_core_gnb."""
+        tac: tac_type  # type: ignore[valid-type]
+        plmns: Optional[conlist(PLMNConfig, min_length=1)] = None  # type: ignore[reportInvalidTypeForm]
+        plmns_manifest: Optional[conlist(str, min_length=1)] = Field(  # type: ignore[reportInvalidTypeForm]
+            alias="plmns-manifest",
+            description="SHA-256 digests of the `plmns.N` shards, when the PLMNs are sharded",
+            default=None,
+        )
+        gnb_configs: Optional[Dict[str, GnbConfig]] = Field(
+            alias="gnb-configs",
+            description="TAC and PLMNs of every CU/gNB of a fleet, keyed by CU/gNB name",
+            default=None,
+        )
 
+        @model_validator(mode="after")
+        def plmns_or_manifest(self):
+            """Require the PLMNs, either in a single list or sharded."""
+            if self.plmns is None and self.plmns_manifest is None:
+                raise ValueError("Either plmns or plmns-manifest must be set")
+            return self
+
+    class FivegCoreGnbRequirerAppData(BaseModel):
+        """Requirer application data for fiveg_core_gnb."""
+        gnb_name: str = Field(
+            alias="gnb-name",
+            description="CU/gNB unique identifier",
+            examples=["gnb001"],
+        )
+        gnb_names: Optional[conlist(str, min_length=1)] = Field(  # type: ignore[reportInvalidTypeForm]
+            alias="gnb-names",
+            description="Unique identifiers of all the CUs/gNBs of a fleet",
+            default=None,
+            examples=[["gnb001", "gnb002"]],
+        )
 
-class FivegCoreGnbProviderAppData(BaseModel):
-    """Provider application data for fiveg_core_gnb."""
-    tac: int = Field(
-        description="Tracking Area Code",
-        strict=True,
-        examples=[1],
-        ge=1,
-        le=16777215,
+    for model in (
+        PLMNConfig,
+        GnbConfig,
+        FivegCoreGnbProviderAppData,
+        FivegCoreGnbRequirerAppData,
+    ):
+        # Make the models resolvable from this module, e.g. when pickling.
+        model.__qualname__ = model.__name__
+
+    return SimpleNamespace(
+        PLMNConfig=PLMNConfig,
+        GnbConfig=GnbConfig,
+        FivegCoreGnbProviderAppData=FivegCoreGnbProviderAppData,
+        FivegCoreGnbRequirerAppData=FivegCoreGnbRequirerAppData,
+        provider_app_data_adapter=TypeAdapter(FivegCoreGnbProviderAppData),
+        tac_adapter=TypeAdapter(tac_type),
+        requirer_app_data_adapter=TypeAdapter(FivegCoreGnbRequirerAppData),
     )
-    plmns: conlist(PLMNConfig, min_length=1)  # type: ignore[reportInvalidTypeForm]
 
 
-class ProviderSchema(DataBagSchema):
-    """Provider schema for fiveg_core_gnb."""
+@functools.lru_cache(maxsize=None)
+def _models() -> SimpleNamespace:
+    """Return the pydantic models of the interface, building them on first use."""
+    with _start_span("fiveg_core_gnb.build_models"):
+        return _build_models()
+
+
+@functools.lru_cache(maxsize=None)
+def _schemas() -> SimpleNamespace:
+    """Return the interface schemas, building them on first use.
 
-    app_data: FivegCoreGnbProviderAppData
+    `interface_tester` is only needed to run the interface tests, so it is never imported by the
+    charm code paths.
+    """
+    from interface_tester.schema_base import DataBagSchema
+
+    models = _models()
+
+    class ProviderSchema(DataBagSchema):
+        """Provider schema for fiveg_core_gnb."""
+
+        app_data: models.FivegCoreGnbProviderAppData
+
+    class RequirerSchema(DataBagSchema):
+        """Requirer schema for fiveg_core_gnb."""
+
+        app_data: models.FivegCoreGnbRequirerAppData
+
+    for schema in (ProviderSchema, RequirerSchema):
+        schema.__qualname__ = schema.__name__
+
+    return SimpleNamespace(ProviderSchema=ProviderSchema, RequirerSchema=RequirerSchema)
+
+
+_LAZY_MODELS = ("PLMNConfig", "FivegCoreGnbProviderAppData", "FivegCoreGnbRequirerAppData")
+_LAZY_SCHEMAS = ("ProviderSchema", "RequirerSchema")
+
+if TYPE_CHECKING:
+    # Resolved at runtime by the module level `__getattr__`.
+    PLMNConfig = Any
+
+
+def __getattr__(name: str) -> Any:
+    """Load the pydantic models and interface schemas on first access."""
+    if name in _LAZY_MODELS:
+        return getattr(_models(), name)
+    if name in _LAZY_SCHEMAS:
+        return getattr(_schemas(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def data_matches_provider_schema(data: dict) -> bool:
@@ -224,138 +617,282 @@ def data_matches_provider_schema(data: dict) -> bool:
     Returns:
         bool: True if data matches provider schema, False otherwise.
     """
-    try:
-        ProviderSchema(app_data=FivegCoreGnbProviderAppData(**data))
-        return True
-    except ValidationError as e:
-        logger.error("Invalid data: %s", e)
+    with _start_span("fiveg_core_gnb.data_matches_provider_schema"):
+        if (error := _provider_data_error(data)) is None:
+            return True
+        _log_schema_error(data, error)
         return False
 
 
-class FivegCoreGnbProvides(Object):
-    """Class to be instantiated by provider of the `fiveg_core_gnb`."""
+def _provider_data_error(data: dict) -> Optional[ValueError]:
+    """Return why data does not match the provider schema, None if it does."""
+    try:
+        _models().provider_app_data_adapter.validate_python(data)
+    except ValueError as e:
+        return e
+    return None
 
-    def __init__(self, charm: CharmBase, relation_name: str):
-        """Create a new instance of the FivegCoreGnbProvides class.
+
+PLMNS_MANIFEST_KEY = "plmns-manifest"
+
+
+def _plmn_shard_key(index: int) -> str:
+    """Return the databag key of a PLMN shard."""
+    return f"plmns.{index}"
+
+
+def _is_plmns_key(key: str) -> bool:
+    """Return whether a databag key holds PLMNs, in either encoding."""
+    return key in ("plmns", PLMNS_MANIFEST_KEY) or key.startswith("plmns.")
+
+
+def _shard_digest(raw_shard: str) -> str:
+    """Return the digest of a raw PLMN shard, as listed in the manifest."""
+    return hashlib.sha256(raw_shard.encode()).hexdigest()
+
+
+def _encode_gnb_config(
+    tac: int, plmns_json: str, plmns: Sequence[Any], shard_size: Optional[int]
+) -> Dict[str, str]:
+    """Return the provider databag content for the given config.
+
+    Args:
+        tac (int): Tracking Area Code.
+        plmns_json (str): PLMNs, serialized as a single JSON list.
+        plmns (Sequence): PLMNs, as returned by `PLMNConfig.asdict()`.
+        shard_size (int): Number of PLMNs per shard, None to publish a single `plmns` key.
+
+    Returns:
+        Dict[str, str]: Databag content.
+
+    Raises:
+        ValueError: If the shard size is not positive.
+    """
+    if shard_size is None:
+        return {"tac": str(tac), "plmns": plmns_json}
+    if shard_size < 1:
+        raise ValueError(f"Invalid shard size: {shard_size}")
+    content = {"tac": str(tac)}
+    digests = []
+    for index, start in enumerate(range(0, len(plmns), shard_size)):
+        raw_shard = json.dumps(list(plmns[start:start + shard_size]))
+        content[_plmn_shard_key(index)] = raw_shard
+        digests.append(_shard_digest(raw_shard))
+    content[PLMNS_MANIFEST_KEY] = json.dumps(digests)
+    return content
+
+
+def _update_databag(databag: MutableMapping[str, str], content: Mapping[str, str]) -> bool:
+    """Write the changed keys of the gNB config, and remove the PLMN keys no longer used.
+
+    Args:
+        databag (MutableMapping[str, str]): Provider application databag.
+        content (Mapping[str, str]): Databag content, as returned by `_encode_gnb_config`.
+
+    Returns:
+        bool: Whether the databag was changed.
+    """
+    stale_keys = [key for key in databag if _is_plmns_key(key) and key not in content]
+    changed = {key: value for key, value in content.items() if databag.get(key) != value}
+    for key in stale_keys:
+        del databag[key]
+    if changed:
+        databag.update(changed)
+    return bool(stale_keys or changed)
+
+
+class GnbConfigPublishResult(str, Enum):
+    """Outcome of publishing the gNB config to a single relation."""
+
+    UPDATED = "updated"
+    UNCHANGED = "unchanged"
+    INVALID = "invalid"
+    NO_RELATION = "no-relation"
+
+
+@dataclass(frozen=True)
+class GnbNameRegistry:
+    """Index of the CU/gNodeB names published over all `fiveg_core_gnb` relations.
+
+    Attributes:
+        gnb_names: CU/gNodeB name, keyed by relation ID. Relations without a valid name are
+            left out.
+        relation_ids: Relation ID, keyed by CU/gNodeB name. Duplicated names are left out.
+        duplicates: IDs of the relations sharing the same CU/gNodeB name, keyed by name.
+        fleet_gnb_names: Names of all the CUs/gNodeBs of the relations serving a fleet, keyed by
+            relation ID.
+    """
+
+    gnb_names: Mapping[int, str]
+    relation_ids: Mapping[str, int]
+    duplicates: Mapping[str, Tuple[int, ...]]
+    fleet_gnb_names: Mapping[int, Tuple[str, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def from_gnb_names(
+        cls,
+        gnb_names: Mapping[int, str],
+        fleet_gnb_names: Optional[Mapping[int, Sequence[str]]] = None,
+    ) -> "GnbNameRegistry":
+        """Build the registry and its reverse index.
 
         Args:
-            charm: Juju charm
-            relation_name (str): Relation name
+            gnb_names (Mapping[int, str]): CU/gNodeB name, keyed by relation ID.
+            fleet_gnb_names (Mapping[int, Sequence[str]]): Names of all the CUs/gNodeBs of the
+                relations serving a fleet, keyed by relation ID.
+
+        Returns:
+            GnbNameRegistry: The registry.
         """
-        self.relation_name = relation_name
-        self.charm = charm
-        super().__init__(charm, relation_name)
+        fleet_gnb_names = {
+            relation_id: tuple(names) for relation_id, names in (fleet_gnb_names or {}).items()
+        }
+        owners: Dict[str, list] = {}
+        for relation_id in sorted(gnb_names):
+            for name in fleet_gnb_names.get(relation_id, (gnb_names[relation_id],)):
+                owners.setdefault(name, []).append(relation_id)
+        return cls(
+            gnb_names=dict(gnb_names),
+            relation_ids={
+                name: relation_ids[0]
+                for name, relation_ids in owners.items()
+                if len(relation_ids) == 1
+            },
+            duplicates={
+                name: tuple(relation_ids)
+                for name, relation_ids in owners.items()
+                if len(relation_ids) > 1
+            },
+            fleet_gnb_names=fleet_gnb_names,
+        )
 
-    def publish_gnb_config_information(
-        self, relation_id: int, tac: int, plmns: list[PLMNConfig]
-    ) -> None:
-        """Set TAC and PLMNs in the relation data.
+    def get_gnb_name(self, relation_id: int) -> Optional[str]:
+        """Return the name of the CU/gNodeB for the given relation.
 
         Args:
             relation_id (int): Relation ID.
-            tac (int): Tracking Area Code.
-            plmns (list[PLMNConfig]): Configured PLMNs.
+
+        Returns:
+            str: gNodeB name, or None if the relation has not published a valid name.
         """
-        if not self.charm.unit.is_leader():
-            raise RuntimeError("Unit must be leader to set application relation data.")
-        if not data_matches_provider_schema(
-            data={"tac": tac, "plmns": plmns}
-        ):
-            raise ValueError(f"Invalid gNB config: {tac}, {plmns}")
-        relation = self.model.get_relation(
-            relation_name=self.relation_name, relation_id=relation_id
-        )
-        if not relation:
-            raise RuntimeError(f"Relation {self.relation_name} not created yet.")
-        relation.data[self.charm.app].update(
-            {
-                "tac": str(tac),
-                "plmns": json.dumps([plmn.asdict() for plmn in plmns])
-            }
-        )
+        return self.gnb_names.get(relation_id)
 
-    def _get_remote_app_relation_data(self, relation_id: int) -> Optional[dict]:
-        """Get relation data for the remote application.
+    def get_gnb_names(self, relation_id: int) -> Tuple[str, ...]:
+        """Return the names of all the CUs/gNodeBs served by the given relation.
 
         Args:
             relation_id (int): Relation ID.
 
         Returns:
-        str: Relation data for the remote application
-            or None if the relation data is invalid.
+            Tuple[str, ...]: gNodeB names, empty if the relation has not published a valid name.
         """
-        relation = self.model.get_relation(
-            relation_name=self.relation_name,
-            relation_id=relation_id
-        )
+        if relation_id in self.fleet_gnb_names:
+            return self.fleet_gnb_names[relation_id]
+        if gnb_name := self.gnb_names.get(relation_id):
+            return (gnb_name,)
+        return ()
 
-        if not relation:
-            logger.error("No relation: %s", self.relation_name)
-            return None
+    def get_relation_id(self, gnb_name: str) -> Optional[int]:
+        """Return the ID of the relation over which the given CU/gNodeB name was published.
 
-        if not relation.app:
-            logger.warning("No remote application in relation: %s", self.relation_name)
-            return None
+        Args:
+            gnb_name (str): CU/gNodeB name.
 
-        remote_app_relation_data = dict(relation.data[relation.app])
+        Returns:
+            int: Relation ID, or None if the name is unknown or published over several relations.
+        """
+        return self.relation_ids.get(gnb_name)
 
-        if not data_matches_requirer_schema(remote_app_relation_data):
-            logger.error("Invalid relation data: %s", remote_app_relation_data)
-            return None
 
-        return remote_app_relation_data
+@dataclass(frozen=True)
+class RequirerValidationResult:
+    """Outcome of the validation of the data published by a requirer.
 
-    def get_gnb_name(self, relation_id: int) -> Optional[str]:
-        """Return the name of the CU/gNodeB for the given relation.
+    Attributes:
+        gnb_names: The `gnb-name`, followed by the other names of a fleet. Empty if invalid.
+        error: Why the data is invalid, None if it is valid.
+    """
 
-        Args:
-            relation_id (int): Relation ID.
+    gnb_names: Tuple[str, ...] = ()
+    error: Optional[str] = None
 
-        Returns:
-            str: gNodeB name.
-        """
-        if remote_relation_data := self._get_remote_app_relation_data(relation_id):
-            return remote_relation_data["gnb-name"]
-        return None
+    @property
+    def gnb_name(self) -> Optional[str]:
+        """Return the `gnb-name` published by the requirer, None if its data is invalid."""
+        return self.gnb_names[0] if self.gnb_names else None
 
 
-class FivegCoreGnbRequirerAppData(BaseModel):
-    """Requirer application data for fiveg_core_gnb."""
-    gnb_name: str = Field(
-        alias="gnb-name",
-        description="CU/gNB unique identifier",
-        examples=["gnb001"],
-    )
+def _validate_requirer_databag(databag: Mapping[str, str]) -> Tuple[str, ...]:
+    """Validate the raw application databag of a requirer.
 
+    Databag values are always strings, so valid data is recognized without pydantic, which is
+    only used to explain why data is invalid.
 
-class RequirerSchema(DataBagSchema):
-    """Requirer schema for fiveg_core_gnb."""
+    Args:
+        databag (Mapping[str, str]): Raw requirer application databag.
 
-    app_data: FivegCoreGnbRequirerAppData
+    Returns:
+        Tuple[str, ...]: The `gnb-name`, followed by the other names of a fleet.
 
+    Raises:
+        ValueError: If the data does not match the requirer schema.
+    """
+    data: Dict[str, Any] = dict(databag)
+    if "gnb-names" in data:
+        try:
+            data["gnb-names"] = json.loads(data["gnb-names"])
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid gnb-names: {e}") from e
+    gnb_name = data.get("gnb-name")
+    fleet_gnb_names = data.get("gnb-names")
+    if not isinstance(gnb_name, str) or not (
+        fleet_gnb_names is None
+        or (
+            isinstance(fleet_gnb_names, list)
+            and fleet_gnb_names
+            and all(isinstance(name, str) for name in fleet_gnb_names)
+        )
+    ):
+        _models().requirer_app_data_adapter.validate_python(data)
+        raise ValueError(f"Invalid requirer data: {data}")
+    return (gnb_name, *(name for name in fleet_gnb_names or () if name != gnb_name))
 
-def data_matches_requirer_schema(data: dict) -> bool:
-    """Return whether data matches requirer schema.
+
+def _validate_requirer_batch(
+    batch: Sequence[Tuple[int, Optional[Mapping[str, str]]]],
+) -> List[Tuple[int, RequirerValidationResult]]:
+    """Validate the databags of a batch of requirers.
+
+    This runs in the workers of `validate_all_requirers`, so it only takes and returns data
+    which can be pickled.
 
     Args:
-        data (dict): Data to be validated.
+        batch (Sequence): Relation ID and raw requirer application databag, None if the
+            relation has no remote application.
 
     Returns:
-        bool: True if data matches requirer schema, False otherwise.
+        List[Tuple[int, RequirerValidationResult]]: Relation ID and result, in batch order.
     """
-    try:
-        RequirerSchema(app_data=FivegCoreGnbRequirerAppData(**data))
-        return True
-    except ValidationError as e:
-        logger.error("Invalid data: %s", e)
-        return False
+    results = []
+    for relation_id, databag in batch:
+        if databag is None:
+            result = RequirerValidationResult(error="No remote application")
+        else:
+            try:
+                result = RequirerValidationResult(gnb_names=_validate_requirer_databag(databag))
+            except ValueError as e:
+                result = RequirerValidationResult(error=str(e))
+        results.append((relation_id, result))
+    return results
 
 
-class FivegCoreGnbRequires(Object):
-    """Class to be instantiated by requirer of the `fiveg_core_gnb`."""
+class FivegCoreGnbProvides(Object):
+    """Class to be instantiated by provider of the `fiveg_core_gnb`."""
+
+    _stored = StoredState()
 
     def __init__(self, charm: CharmBase, relation_name: str):
-        """Create a new instance of the FivegCoreGnbRequires class.
+        """Create a new instance of the FivegCoreGnbProvides class.
 
         Args:
             charm: Juju charm
@@ -364,59 +901,1413 @@ class FivegCoreGnbRequires(Object):
         self.relation_name = relation_name
         self.charm = charm
         super().__init__(charm, relation_name)
+        # Validated CU/gNodeB names are kept across hooks, keyed by relation ID, and only the
+        # relations which emitted events are read again. Names validated by another version of
+        # this library are all read again.
+        self._stored.set_default(gnb_names={}, gnb_names_version=None, invalid_data_log={})
+        self._registry: Optional[GnbNameRegistry] = None
+        self._outdated_relation_ids: Set[int] = set()
+        self.framework.observe(
+            charm.on[relation_name].relation_changed, self._invalidate_gnb_name
+        )
+        self.framework.observe(
+            charm.on[relation_name].relation_broken, self._invalidate_gnb_name
+        )
 
-    def publish_gnb_information(self, gnb_name: str) -> None:
-        """Set CU/gNB identifier in the relation data.
+    def _invalidate_gnb_name(self, event: Union[RelationChangedEvent, RelationBrokenEvent]):
+        """Mark the CU/gNodeB name of the relation which emitted the event as outdated."""
+        self._outdated_relation_ids.add(event.relation.id)
+        self._registry = None
 
-        Args:
-            gnb_name (str): CU/gNB unique identifier.
-        """
-        if not self.charm.unit.is_leader():
-            raise RuntimeError("Unit must be leader to set application relation data.")
+    def gnb_registry(self) -> GnbNameRegistry:
+        """Return the index of the CU/gNodeB names published over all relations.
 
-        if not data_matches_requirer_schema(
-            data={"gnb-name": gnb_name}
-        ):
-            raise ValueError(f"Invalid gNB name: {gnb_name}")
+        The registry is built once per hook. Only the relations which are new or which emitted
+        a `relation_changed` or `relation_broken` event are read and validated again, unless
+        the names were validated by another version of this library.
 
-        relation = self.model.get_relation(relation_name=self.relation_name)
-        if not relation:
+        Returns:
+            GnbNameRegistry: CU/gNodeB names with reverse lookup and duplicate detection.
+        """
+        if self._registry is not None:
+            return self._registry
+        stored_gnb_names = self._stored.gnb_names
+        if self._stored.gnb_names_version != _VALIDATION_CACHE_VERSION:
+            stored_gnb_names.clear()
+            self._stored.gnb_names_version = _VALIDATION_CACHE_VERSION
+        relations = self.model.relations[self.relation_name]
+        relation_keys = {str(relation.id) for relation in relations}
+        for key in [key for key in stored_gnb_names if key not in relation_keys]:
+            del stored_gnb_names[key]
+        for relation in relations:
+            key = str(relation.id)
+            if key not in stored_gnb_names or relation.id in self._outdated_relation_ids:
+                stored_gnb_names[key] = self._get_relation_gnb_names(relation)
+        self._outdated_relation_ids.clear()
+        gnb_names = {int(key): list(names) for key, names in stored_gnb_names.items() if names}
+        self._registry = GnbNameRegistry.from_gnb_names(
+            {relation_id: names[0] for relation_id, names in gnb_names.items()},
+            {relation_id: names for relation_id, names in gnb_names.items() if len(names) > 1},
+        )
+        for name, relation_ids in self._registry.duplicates.items():
+            logger.warning("gNB name %s is used by several relations: %s", name, relation_ids)
+        return self._registry
+
+    def publish_gnb_config_information(
+        self,
+        relation_id: int,
+        tac: int,
+        plmns: "list[PLMNConfig]",
+        shard_size: Optional[int] = None,
+    ) -> None:
+        """Set TAC and PLMNs in the relation data.
+
+        Args:
+            relation_id (int): Relation ID.
+            tac (int): Tracking Area Code.
+            plmns (list[PLMNConfig]): Configured PLMNs.
+            shard_size (int): Number of PLMNs per shard, None to publish all the PLMNs under
+                the `plmns` key.
+        """
+        if not self.charm.unit.is_leader():
+            raise RuntimeError("Unit must be leader to set application relation data.")
+        if not self._data_matches_provider_schema(
+            data={"tac": tac, "plmns": plmns}
+        ):
+            raise ValueError(f"Invalid gNB config: {tac}, {plmns}")
+        relation = self.model.get_relation(
+            relation_name=self.relation_name, relation_id=relation_id
+        )
+        if not relation:
             raise RuntimeError(f"Relation {self.relation_name} not created yet.")
+        plmns_data = [plmn.asdict() for plmn in plmns]
+        _update_databag(
+            relation.data[self.charm.app],
+            _encode_gnb_config(tac, json.dumps(plmns_data), plmns_data, shard_size),
+        )
 
-        relation.data[self.charm.app].update({"gnb-name": gnb_name})
+    def publish_gnb_config_bulk(
+        self,
+        assignments: "Mapping[int, Tuple[int, Sequence[PLMNConfig]]]",
+        shard_size: Optional[int] = None,
+    ) -> Dict[int, GnbConfigPublishResult]:
+        """Set TAC and PLMNs in the relation data of many relations at once.
 
-    def _get_remote_app_relation_data(self) -> Optional[dict]:
-        """Get relation data for the remote application.
+        Each distinct config is validated and encoded only once, and only the keys whose value
+        differs from the config assigned to a relation are written to. Configs whose PLMNs are
+        not `PLMNConfig` are reported as invalid.
+
+        Args:
+            assignments (Mapping[int, Tuple[int, Sequence[PLMNConfig]]]): TAC and PLMNs to
+                publish, keyed by relation ID.
+            shard_size (int): Number of PLMNs per shard, None to publish all the PLMNs under
+                the `plmns` key.
 
         Returns:
-        str: Relation data for the remote application
-            or None if the relation data is invalid.
+            Dict[int, GnbConfigPublishResult]: Outcome of the publish, keyed by relation ID.
         """
-        relation = self.model.get_relation(self.relation_name)
+        if not self.charm.unit.is_leader():
+            raise RuntimeError("Unit must be leader to set application relation data.")
+        relations = {
+            relation.id: relation for relation in self.model.relations[self.relation_name]
+        }
+        encoded_configs: Dict[Tuple[int, str], Optional[Dict[str, str]]] = {}
+        # Keeps a reference to each PLMN list so that its id is not reused during the call.
+        serialized_plmns: Dict[int, Tuple[Sequence, Optional[List[dict]], str]] = {}
+        report: Dict[int, GnbConfigPublishResult] = {}
+        for relation_id, (tac, plmns) in assignments.items():
+            # Callers fanning out one config usually assign the same list to every relation.
+            if id(plmns) not in serialized_plmns:
+                plmns_data = _plmns_asdict(plmns)
+                serialized_plmns[id(plmns)] = (plmns, plmns_data, json.dumps(plmns_data))
+            _, plmns_data, plmns_json = serialized_plmns[id(plmns)]
+            if (tac, plmns_json) not in encoded_configs:
+                encoded_configs[(tac, plmns_json)] = (
+                    _encode_gnb_config(tac, plmns_json, plmns_data, shard_size)
+                    if plmns_data is not None
+                    and self._data_matches_provider_schema(
+                        data={"tac": tac, "plmns": plmns_data}
+                    )
+                    else None
+                )
+            if (content := encoded_configs[(tac, plmns_json)]) is None:
+                logger.error(
+                    "Invalid gNB config for relation %s: TAC %s, %s",
+                    relation_id,
+                    tac,
+                    _plmns_summary(plmns_data),
+                )
+                report[relation_id] = GnbConfigPublishResult.INVALID
+                continue
+            if not (relation := relations.get(relation_id)):
+                logger.warning("Relation %s %s not created yet.", self.relation_name, relation_id)
+                report[relation_id] = GnbConfigPublishResult.NO_RELATION
+                continue
+            if not _update_databag(relation.data[self.charm.app], content):
+                report[relation_id] = GnbConfigPublishResult.UNCHANGED
+                continue
+            report[relation_id] = GnbConfigPublishResult.UPDATED
+        return report
+
+    def publish_fleet_gnb_config(
+        self, relation_id: int, gnb_configs: "Mapping[str, Tuple[int, Sequence[PLMNConfig]]]"
+    ) -> GnbConfigPublishResult:
+        """Set the TAC and PLMNs of every CU/gNodeB of a fleet in the relation data.
+
+        The config of the CU/gNodeB published as `gnb-name` is also set as `tac` and `plmns`,
+        for requirers which do not support fleets. The relation is only written to when its
+        current data differs.
+
+        Args:
+            relation_id (int): Relation ID.
+            gnb_configs (Mapping[str, Tuple[int, Sequence[PLMNConfig]]]): TAC and PLMNs, keyed
+                by CU/gNodeB name.
 
+        Returns:
+            GnbConfigPublishResult: Outcome of the publish.
+        """
+        if not self.charm.unit.is_leader():
+            raise RuntimeError("Unit must be leader to set application relation data.")
+        serialized_configs = {}
+        for gnb_name, (tac, plmns) in gnb_configs.items():
+            plmns_data = _plmns_asdict(plmns)
+            if plmns_data is None or not self._data_matches_provider_schema(
+                data={"tac": tac, "plmns": plmns_data}
+            ):
+                logger.error(
+                    "Invalid config for gNB %s: TAC %s, %s",
+                    gnb_name,
+                    tac,
+                    _plmns_summary(plmns_data),
+                )
+                return GnbConfigPublishResult.INVALID
+            serialized_configs[gnb_name] = {"tac": tac, "plmns": plmns_data}
+        relation = self.model.get_relation(
+            relation_name=self.relation_name, relation_id=relation_id
+        )
         if not relation:
-            logger.error("No relation: %s", self.relation_name)
-            return None
+            logger.warning("Relation %s %s not created yet.", self.relation_name, relation_id)
+            return GnbConfigPublishResult.NO_RELATION
+        local_app_data = relation.data[self.charm.app]
+        changed = False
+        gnb_name = self.gnb_registry().get_gnb_name(relation_id)
+        if gnb_name in serialized_configs:
+            # Also removes the PLMN shards of a previous sharded publish.
+            plmns_data = serialized_configs[gnb_name]["plmns"]
+            changed = _update_databag(
+                local_app_data,
+                _encode_gnb_config(
+                    serialized_configs[gnb_name]["tac"],
+                    json.dumps(plmns_data),
+                    plmns_data,
+                    shard_size=None,
+                ),
+            )
+        raw_gnb_configs = json.dumps(serialized_configs, sort_keys=True)
+        if local_app_data.get("gnb-configs") != raw_gnb_configs:
+            local_app_data["gnb-configs"] = raw_gnb_configs
+            changed = True
+        if not changed:
+            return GnbConfigPublishResult.UNCHANGED
+        return GnbConfigPublishResult.UPDATED
+
+    def _data_matches_provider_schema(self, data: dict) -> bool:
+        """Return whether data matches the provider schema.
+
+        Each invalid data is logged at ERROR once, then at DEBUG with the number of times it
+        was seen, across hooks. Only the most recent invalid data are remembered.
+
+        Args:
+            data (dict): Data to be validated.
 
+        Returns:
+            bool: True if data matches provider schema, False otherwise.
+        """
+        with _start_span("fiveg_core_gnb.data_matches_provider_schema"):
+            if (error := _provider_data_error(data)) is None:
+                return True
+            digest = _data_digest(data)
+            entries = self._stored.invalid_data_log
+            if (count := entries.get(digest)) is None:
+                logger.error("Invalid data %s: %s", digest[:12], _Truncated(error))
+                log = dict(list(entries.items())[-(_MAX_INVALID_DATA_LOG_ENTRIES - 1):])
+                log[digest] = 1
+                self._stored.invalid_data_log = log
+            else:
+                entries[digest] = count + 1
+                logger.debug(
+                    "Invalid data %s, already logged, seen %d times", digest[:12], count + 1
+                )
+            return False
+
+    def _get_relation_gnb_names(self, relation: Relation) -> Optional[List[str]]:
+        """Return the validated CU/gNodeB names published over the given relation.
+
+        Returns:
+            List[str]: The `gnb-name`, followed by the other names of a fleet, or None if the
+                relation data is invalid.
+        """
         if not relation.app:
             logger.warning("No remote application in relation: %s", self.relation_name)
             return None
+        [(_, result)] = _validate_requirer_batch([(relation.id, relation.data[relation.app])])
+        if result.error:
+            logger.error("Invalid relation data: %s", _Truncated(result.error))
+            return None
+        return list(result.gnb_names)
 
-        remote_app_relation_data: Dict[str, Any] = dict(relation.data[relation.app])
-        plmns = remote_app_relation_data.get("plmns", "")
-        try:
-            remote_app_relation_data["tac"] = int(remote_app_relation_data.get("tac", ""))
-            remote_app_relation_data["plmns"] = [
-                PLMNConfig(**data) for data in json.loads(plmns)
+    def validate_all_requirers(
+        self,
+        executor: Optional[concurrent.futures.Executor] = None,
+        batch_size: int = 256,
+    ) -> Dict[int, RequirerValidationResult]:
+        """Validate the data published by every requirer at once.
+
+        The databags of all the relations are read first, in the charm, then validated in
+        batches of `batch_size` relations. The batches are only submitted to the executor when
+        there are several of them. Results are ordered by relation ID whatever the executor,
+        and also refresh the CU/gNodeB names of `gnb_registry`.
+
+        Args:
+            executor (concurrent.futures.Executor): Executor validating the batches, e.g. a
+                `ProcessPoolExecutor`. None to validate them in the charm.
+            batch_size (int): Number of relations per batch.
+
+        Returns:
+            Dict[int, RequirerValidationResult]: Validation result, keyed by relation ID.
+        """
+        if batch_size < 1:
+            raise ValueError(f"Invalid batch size: {batch_size}")
+        with _start_span("fiveg_core_gnb.validate_all_requirers") as span:
+            databags = [
+                (relation.id, dict(relation.data[relation.app]) if relation.app else None)
+                for relation in sorted(
+                    self.model.relations[self.relation_name], key=lambda relation: relation.id
+                )
             ]
-        except (JSONDecodeError, ValidationError, ValueError):
-            logger.error("Invalid relation data: %s", remote_app_relation_data)
-            return None
-        if not data_matches_provider_schema(remote_app_relation_data):
-            logger.error("Invalid relation data: %s", remote_app_relation_data)
-            return None
+            batches = [
+                databags[start:start + batch_size]
+                for start in range(0, len(databags), batch_size)
+            ]
+            span.set_attribute("fiveg_core_gnb.relation_count", len(databags))
+            span.set_attribute("fiveg_core_gnb.batch_count", len(batches))
+            if executor is None or len(batches) <= 1:
+                batch_results = map(_validate_requirer_batch, batches)
+            else:
+                batch_results = executor.map(_validate_requirer_batch, batches)
+            results = {
+                relation_id: result
+                for batch_result in batch_results
+                for relation_id, result in batch_result
+            }
+        self._stored.gnb_names = {
+            str(relation_id): list(result.gnb_names) or None
+            for relation_id, result in results.items()
+        }
+        self._stored.gnb_names_version = _VALIDATION_CACHE_VERSION
+        self._outdated_relation_ids.clear()
+        self._registry = None
+        return results
+
+    def get_gnb_name(self, relation_id: int) -> Optional[str]:
+        """Return the name of the CU/gNodeB for the given relation.
+
+        Args:
+            relation_id (int): Relation ID.
+
+        Returns:
+            str: gNodeB name.
+        """
+        return self.gnb_registry().get_gnb_name(relation_id)
+
+
+def data_matches_requirer_schema(data: dict) -> bool:
+    """Return whether data matches requirer schema.
+
+    Args:
+        data (dict): Data to be validated.
+
+    Returns:
+        bool: True if data matches requirer schema, False otherwise.
+    """
+    with _start_span("fiveg_core_gnb.data_matches_requirer_schema"):
+        try:
+            _models().requirer_app_data_adapter.validate_python(data)
+            return True
+        except ValueError as e:
+            _log_schema_error(data, e)
+            return False
+
+
+# SD value meaning that no SD is associated with the SST (3GPP TS 23.003).
+NO_SD = 0xFFFFFF
+# Size of a PLMN in `PLMNTable.pack()`: PLMN ID, SST and SD.
+PACKED_PLMN_SIZE = 7
+
+
+@functools.lru_cache(maxsize=None)
+def _encode_plmn_id(mcc: str, mnc: str) -> bytes:
+    """Encode the MCC and MNC as a PLMN identity, in BCD (3GPP TS 24.008, 10.5.1.13).
+
+    The same few MCCs and MNCs are repeated over many PLMNs, so each one is only encoded once.
+    """
+    mnc3 = int(mnc[2]) if len(mnc) == 3 else 0xF
+    return bytes(
+        (
+            int(mcc[1]) << 4 | int(mcc[0]),
+            mnc3 << 4 | int(mcc[2]),
+            int(mnc[1]) << 4 | int(mnc[0]),
+        )
+    )
+
+
+def _decode_plmn_id(plmn_id: bytes) -> Tuple[str, str]:
+    if len(plmn_id) != 3:
+        raise ValueError(f"PLMN ID must be 3 bytes long, got {len(plmn_id)}")
+    digits = [plmn_id[0] & 0xF, plmn_id[0] >> 4, plmn_id[1] & 0xF, plmn_id[2] & 0xF]
+    digits.append(plmn_id[2] >> 4)
+    if plmn_id[1] >> 4 != 0xF:
+        digits.append(plmn_id[1] >> 4)
+    if any(digit > 9 for digit in digits):
+        raise ValueError(f"Invalid BCD PLMN ID: {plmn_id.hex()}")
+    return "".join(map(str, digits[:3])), "".join(map(str, digits[3:]))
+
+
+@functools.lru_cache(maxsize=None)
+def _encode_snssai(sst: int, sd: Optional[int]) -> bytes:
+    """Encode the SST and SD as the value of an S-NSSAI (3GPP TS 24.501, 9.11.2.8)."""
+    if sd is None:
+        return bytes((sst,))
+    return bytes((sst,)) + sd.to_bytes(3, "big")
+
+
+def _decode_snssai(snssai: bytes) -> Tuple[int, Optional[int]]:
+    if len(snssai) not in (1, 4):
+        raise ValueError(f"S-NSSAI must be 1 or 4 bytes long, got {len(snssai)}")
+    if len(snssai) == 1:
+        return snssai[0], None
+    sd = int.from_bytes(snssai[1:], "big")
+    return snssai[0], _normalize_sd(sd)
+
+
+def _normalize_sd(sd: Optional[int]) -> Optional[int]:
+    """Return None for the SD reserved to mean that there is no SD (3GPP TS 23.003)."""
+    return None if sd == NO_SD else sd
+
+
+def _is_plmn_config(value: object) -> bool:
+    """Return whether the value is a `PLMNConfig`, without loading the pydantic models."""
+    # No `PLMNConfig` can exist before the models are built.
+    return _models.cache_info().currsize > 0 and isinstance(value, _models().PLMNConfig)
+
+
+class PLMN:
+    """Lightweight, immutable and hashable view of a validated PLMN.
 
-        return remote_app_relation_data
+    This is how `GnbConfigSnapshot` holds the PLMNs published by the provider. Unlike
+    `PLMNConfig`, it does not validate its fields, so it must only be built from validated
+    data. It compares equal to a `PLMNConfig` with the same fields.
+
+    An SD of `NO_SD` means that there is no SD (3GPP TS 23.003), so it is stored as None.
+    """
+
+    __slots__ = ("mcc", "mnc", "sst", "sd")
+
+    mcc: str
+    mnc: str
+    sst: int
+    sd: Optional[int]
+
+    def __init__(self, mcc: str, mnc: str, sst: int, sd: Optional[int] = None) -> None:
+        # The same few MCCs and MNCs are repeated over many PLMNs.
+        object.__setattr__(self, "mcc", sys.intern(mcc))
+        object.__setattr__(self, "mnc", sys.intern(mnc))
+        object.__setattr__(self, "sst", sst)
+        object.__setattr__(self, "sd", _normalize_sd(sd))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Prevent modifying the fields."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """Prevent deleting the fields."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        """Rebuild the PLMN from its fields when unpickling."""
+        return type(self), (self.mcc, self.mnc, self.sst, self.sd)
+
+    def _key(self) -> Tuple[str, str, int, Optional[int]]:
+        return self.mcc, self.mnc, self.sst, self.sd
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the PLMNs by MCC, MNC, SST and SD, also to a `PLMNConfig`."""
+        if isinstance(other, PLMN):
+            return self._key() == other._key()
+        if _is_plmn_config(other):
+            return self._key() == (
+                other.mcc,  # type: ignore[attr-defined]
+                other.mnc,  # type: ignore[attr-defined]
+                other.sst,  # type: ignore[attr-defined]
+                _normalize_sd(other.sd),  # type: ignore[attr-defined]
+            )
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash the PLMN by MCC, MNC, SST and SD."""
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        """Return the representation of the PLMN."""
+        return f"PLMN(mcc={self.mcc!r}, mnc={self.mnc!r}, sst={self.sst!r}, sd={self.sd!r})"
+
+    def asdict(self) -> dict:
+        """Convert the PLMN into a dictionary."""
+        return {"mcc": self.mcc, "mnc": self.mnc, "sst": self.sst, "sd": self.sd}
+
+    @property
+    def plmn_id(self) -> bytes:
+        """Return the 3 bytes BCD encoded PLMN identity (3GPP TS 24.008, 10.5.1.13)."""
+        return _encode_plmn_id(self.mcc, self.mnc)
+
+    @property
+    def plmn_id_hex(self) -> str:
+        """Return the BCD encoded PLMN identity, in hex, e.g. `00f110` for 001-01."""
+        return _encode_plmn_id(self.mcc, self.mnc).hex()
+
+    @property
+    def snssai(self) -> bytes:
+        """Return the S-NSSAI: 1 byte of SST, followed by 3 bytes of SD if there is one."""
+        return _encode_snssai(self.sst, self.sd)
+
+    @property
+    def snssai_hex(self) -> str:
+        """Return the S-NSSAI, in hex, e.g. `01102030` for SST 1 and SD 0x102030."""
+        return _encode_snssai(self.sst, self.sd).hex()
+
+    @classmethod
+    def from_encoded(cls, plmn_id: bytes, snssai: bytes) -> "PLMN":
+        """Build a PLMN from its BCD encoded identity and its S-NSSAI.
+
+        Args:
+            plmn_id (bytes): PLMN identity, as returned by `plmn_id`.
+            snssai (bytes): S-NSSAI, as returned by `snssai`. An SD of `NO_SD` means no SD.
+
+        Returns:
+            PLMN: The decoded PLMN.
+
+        Raises:
+            ValueError: If the PLMN identity or the S-NSSAI cannot be decoded.
+        """
+        return cls(*_decode_plmn_id(plmn_id), *_decode_snssai(snssai))
+
+
+class PLMNTable:
+    """Columnar, read-only view of a list of PLMNs, for bulk access to a single field."""
+
+    __slots__ = ("mcc", "mnc", "sst", "sd")
+
+    mcc: Tuple[str, ...]
+    mnc: Tuple[str, ...]
+    sst: Tuple[int, ...]
+    sd: Tuple[Optional[int], ...]
+
+    def __init__(self, plmns: Sequence[PLMN]) -> None:
+        columns = tuple(zip(*(plmn._key() for plmn in plmns))) or ((), (), (), ())
+        for name, column in zip(self.__slots__, columns):
+            object.__setattr__(self, name, column)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Prevent modifying the fields."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __len__(self) -> int:
+        """Return the number of PLMNs."""
+        return len(self.mcc)
+
+    def __getitem__(self, index: int) -> PLMN:
+        """Return the PLMN at the given index."""
+        return PLMN(self.mcc[index], self.mnc[index], self.sst[index], self.sd[index])
+
+    def __iter__(self) -> Iterator[PLMN]:
+        """Iterate over the PLMNs."""
+        return map(PLMN, self.mcc, self.mnc, self.sst, self.sd)
+
+    def pack(self) -> bytes:
+        """Pack the PLMNs in 3GPP encodings, for gNB software which consumes them in bulk.
+
+        Every PLMN takes `PACKED_PLMN_SIZE` bytes: the BCD encoded PLMN identity, the SST and
+        the SD on 3 bytes, `NO_SD` if there is none.
+
+        Returns:
+            bytes: The packed PLMNs, in order.
+        """
+        return b"".join(
+            _encode_plmn_id(mcc, mnc) + _encode_snssai(sst, NO_SD if sd is None else sd)
+            for mcc, mnc, sst, sd in zip(self.mcc, self.mnc, self.sst, self.sd)
+        )
+
+
+def unpack_plmns(packed: bytes) -> Tuple[PLMN, ...]:
+    """Unpack PLMNs packed by `PLMNTable.pack()`.
+
+    Args:
+        packed (bytes): Packed PLMNs.
+
+    Returns:
+        Tuple[PLMN, ...]: The PLMNs, in order.
+
+    Raises:
+        ValueError: If the PLMNs cannot be unpacked.
+    """
+    if len(packed) % PACKED_PLMN_SIZE:
+        raise ValueError(
+            f"Packed PLMNs must be a multiple of {PACKED_PLMN_SIZE} bytes long, got {len(packed)}"
+        )
+    return tuple(
+        PLMN.from_encoded(packed[offset : offset + 3], packed[offset + 3 : offset + 7])
+        for offset in range(0, len(packed), PACKED_PLMN_SIZE)
+    )
+
+
+class ValidationFailureReason(str, Enum):
+    """Why the data published by the provider failed validation."""
+
+    JSON_DECODE = "json-decode"
+    SCHEMA = "schema"
+    MISSING_KEYS = "missing-keys"
+
+
+class PLMNDecodeError(ValueError):
+    """Raised when the PLMNs published by the provider cannot be decoded."""
+
+    def __init__(
+        self,
+        message: str,
+        index: Optional[int] = None,
+        reason: ValidationFailureReason = ValidationFailureReason.SCHEMA,
+    ):
+        """Create a new PLMNDecodeError.
+
+        Args:
+            message (str): Description of the error.
+            index (int): Index of the offending PLMN, None if the error is not about an entry.
+            reason (ValidationFailureReason): Whether the PLMNs are not valid JSON or do not
+                match the schema.
+        """
+        super().__init__(message if index is None else f"PLMN at index {index}: {message}")
+        self.index = index
+        self.reason = reason
+
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Same constraints as `PLMNConfig` and `FivegCoreGnbProviderAppData`, checked without pydantic.
+_MCC_PATTERN = re.compile(r"[0-9]{3}")
+_MNC_PATTERN = re.compile(r"[0-9]{2,3}")
+_MAX_SST = 255
+_MAX_SD = 16777215
+_MAX_TAC = 16777215
+
+
+def _skip_whitespace(raw: str, idx: int) -> int:
+    return _JSON_WHITESPACE.match(raw, idx).end()  # type: ignore[union-attr]
+
+
+def _fast_plmn(entry: Any) -> Optional[PLMN]:
+    """Return the PLMN if the decoded entry is plainly valid, None if pydantic must decide."""
+    if type(entry) is not dict:
+        return None
+    mcc = entry.get("mcc")
+    mnc = entry.get("mnc")
+    sst = entry.get("sst")
+    sd = entry.get("sd")
+    if (
+        type(mcc) is str
+        and _MCC_PATTERN.fullmatch(mcc)
+        and type(mnc) is str
+        and _MNC_PATTERN.fullmatch(mnc)
+        and type(sst) is int
+        and 0 <= sst <= _MAX_SST
+        and (sd is None or (type(sd) is int and 0 <= sd <= _MAX_SD))
+    ):
+        return PLMN(mcc, mnc, sst, sd)
+    return None
+
+
+def _validate_plmn_with_pydantic(entry: Any, index: int) -> PLMN:
+    """Validate a decoded entry with `PLMNConfig`, which explains why it is invalid.
+
+    Raises:
+        PLMNDecodeError: If the entry is not a valid PLMN.
+    """
+    try:
+        plmn = _models().PLMNConfig.model_validate(entry)
+    # `PLMNConfig.__init__` raises TypeError for missing and unknown fields.
+    except (TypeError, ValueError) as e:
+        raise PLMNDecodeError(str(e), index) from e
+    return PLMN(plmn.mcc, plmn.mnc, plmn.sst, plmn.sd)
+
+
+def validate_plmns(plmns: Iterable[Any]) -> Tuple[PLMN, ...]:
+    """Validate a list of decoded PLMNs in a single pass.
+
+    Entries are checked with precompiled patterns and plain bound checks. pydantic is only used
+    for an entry failing these checks, to report the detailed error.
+
+    Args:
+        plmns (Iterable): Decoded PLMNs, e.g. the result of `json.loads`.
+
+    Returns:
+        Tuple[PLMN, ...]: The validated PLMNs, in order.
+
+    Raises:
+        PLMNDecodeError: If an entry is not a valid PLMN.
+    """
+    validated = []
+    for index, entry in enumerate(plmns):
+        plmn = _fast_plmn(entry)
+        validated.append(plmn or _validate_plmn_with_pydantic(entry, index))
+    return tuple(validated)
+
+
+def iter_plmns(raw: str, max_length: Optional[int] = None) -> Iterator[PLMN]:
+    """Decode and validate a JSON list of PLMNs one entry at a time.
+
+    Only the entry being validated is decoded, so memory does not grow with the length of the
+    list and decoding stops at the first invalid entry.
+
+    Args:
+        raw (str): JSON list of PLMNs, as published in the provider databag.
+        max_length (int): Maximum number of PLMNs, None for no limit.
+
+    Yields:
+        PLMN: The validated PLMNs, in order.
+
+    Raises:
+        PLMNDecodeError: If `raw` is not a non-empty JSON list of valid PLMNs, or if it holds
+            more than `max_length` PLMNs.
+    """
+    idx = _skip_whitespace(raw, 0)
+    if not raw.startswith("[", idx):
+        raise PLMNDecodeError(
+            "Expected a JSON list of PLMNs", reason=ValidationFailureReason.JSON_DECODE
+        )
+    idx = _skip_whitespace(raw, idx + 1)
+    if raw.startswith("]", idx):
+        raise PLMNDecodeError("At least one PLMN is required")
+    index = 0
+    while True:
+        if max_length is not None and index >= max_length:
+            raise PLMNDecodeError(f"More than {max_length} PLMNs", index)
+        try:
+            entry, idx = _JSON_DECODER.raw_decode(raw, idx)
+        except ValueError as e:
+            raise PLMNDecodeError(str(e), index, ValidationFailureReason.JSON_DECODE) from e
+        yield _fast_plmn(entry) or _validate_plmn_with_pydantic(entry, index)
+        idx = _skip_whitespace(raw, idx)
+        if raw.startswith("]", idx):
+            break
+        if not raw.startswith(",", idx):
+            raise PLMNDecodeError(
+                "Expected ',' or ']' after the PLMN", index, ValidationFailureReason.JSON_DECODE
+            )
+        idx = _skip_whitespace(raw, idx + 1)
+        index += 1
+    if _skip_whitespace(raw, idx + 1) != len(raw):
+        raise PLMNDecodeError(
+            "Unexpected data after the list of PLMNs", reason=ValidationFailureReason.JSON_DECODE
+        )
+
+
+def _iter_sharded_plmns(
+    databag: Dict[str, str],
+    max_plmns: Optional[int],
+    known_shards: Dict[str, Tuple[PLMN, ...]],
+) -> Iterator[PLMN]:
+    """Decode and validate the PLMN shards listed in the manifest of the provider databag.
+
+    Args:
+        databag (dict): Raw provider application databag.
+        max_plmns (int): Maximum number of PLMNs, None for no limit.
+        known_shards (dict): Already validated PLMNs, keyed by shard digest. Shards found in
+            it are not decoded again, and the newly validated shards are added to it.
+
+    Yields:
+        PLMN: The validated PLMNs, in order.
+
+    Raises:
+        PLMNDecodeError: If the manifest or a shard is invalid.
+    """
+    try:
+        digests = json.loads(databag[PLMNS_MANIFEST_KEY])
+    except json.JSONDecodeError as e:
+        raise PLMNDecodeError(
+            f"Invalid PLMNs manifest: {e}", reason=ValidationFailureReason.JSON_DECODE
+        ) from e
+    if not isinstance(digests, list) or not digests:
+        raise PLMNDecodeError("Expected a non empty list of PLMN shard digests")
+    count = 0
+    for index, digest in enumerate(digests):
+        raw_shard = databag.get(_plmn_shard_key(index))
+        if raw_shard is None:
+            raise PLMNDecodeError(
+                f"Missing PLMN shard {index}", reason=ValidationFailureReason.MISSING_KEYS
+            )
+        if _shard_digest(raw_shard) != digest:
+            raise PLMNDecodeError(f"PLMN shard {index} does not match its digest")
+        if (shard := known_shards.get(digest)) is None:
+            remaining = None if max_plmns is None else max_plmns - count
+            try:
+                shard = tuple(iter_plmns(raw_shard, max_length=remaining))
+            except PLMNDecodeError as e:
+                raise PLMNDecodeError(f"PLMN shard {index}: {e}", reason=e.reason) from e
+            known_shards[digest] = shard
+        count += len(shard)
+        if max_plmns is not None and count > max_plmns:
+            raise PLMNDecodeError(f"More than {max_plmns} PLMNs", max_plmns)
+        yield from shard
+
+
+def _parse_provider_databag(
+    databag: Dict[str, str],
+    max_plmns: Optional[int] = None,
+    known_shards: Optional[Dict[str, Tuple[PLMN, ...]]] = None,
+) -> Tuple[int, Tuple[PLMN, ...]]:
+    """Decode and validate the raw provider databag.
+
+    Args:
+        databag (dict): Raw provider application databag.
+        max_plmns (int): Maximum number of PLMNs, None for no limit.
+        known_shards (dict): Already validated PLMNs, keyed by shard digest, when the PLMNs
+            are sharded. The newly validated shards are added to it.
+
+    Returns:
+        Tuple[int, Tuple[PLMN, ...]]: Validated TAC and PLMNs.
+
+    Raises:
+        ValueError: If the TAC is not an integer or the data does not match the provider schema.
+    """
+    with _start_span("fiveg_core_gnb.parse_provider_databag") as span:
+        tac = int(databag.get("tac", ""))
+        if not 1 <= tac <= _MAX_TAC:
+            _models().tac_adapter.validate_python(tac)
+        if PLMNS_MANIFEST_KEY in databag:
+            plmns = tuple(
+                _iter_sharded_plmns(
+                    databag, max_plmns, known_shards if known_shards is not None else {}
+                )
+            )
+        else:
+            plmns = tuple(iter_plmns(databag.get("plmns", ""), max_length=max_plmns))
+        span.set_attribute("fiveg_core_gnb.plmn_count", len(plmns))
+        return tac, plmns
+
+
+def _validation_failure_reason(
+    databag: Dict[str, str], error: ValueError
+) -> ValidationFailureReason:
+    """Return why the raw provider databag failed validation.
+
+    Args:
+        databag (dict): Raw provider application databag.
+        error (ValueError): Error raised by `_parse_provider_databag`.
+
+    Returns:
+        ValidationFailureReason: Reason of the failure.
+    """
+    if "tac" not in databag or ("plmns" not in databag and PLMNS_MANIFEST_KEY not in databag):
+        return ValidationFailureReason.MISSING_KEYS
+    if isinstance(error, PLMNDecodeError):
+        return error.reason
+    return ValidationFailureReason.SCHEMA
+
+
+def _parse_fleet_gnb_config(entry: Any) -> "GnbConfigSnapshot":
+    """Validate the decoded TAC and PLMNs of a CU/gNodeB of a fleet.
+
+    Args:
+        entry (Any): Decoded config, e.g. `{"tac": 1, "plmns": [...]}`.
+
+    Returns:
+        GnbConfigSnapshot: Validated TAC and PLMNs.
+
+    Raises:
+        ValueError: If the config does not match the provider schema.
+    """
+    if not isinstance(entry, dict) or "tac" not in entry or not entry.get("plmns"):
+        raise PLMNDecodeError("Expected a TAC and a non empty list of PLMNs")
+    tac = entry["tac"]
+    if type(tac) is not int or not 1 <= tac <= _MAX_TAC:
+        _models().tac_adapter.validate_python(tac)
+    if not isinstance(entry["plmns"], list):
+        raise PLMNDecodeError("Expected a list of PLMNs")
+    return GnbConfigSnapshot(tac=tac, plmns=validate_plmns(entry["plmns"]))
+
+
+@dataclass(frozen=True)
+class GnbConfigSnapshot:
+    """Immutable view of the validated TAC and PLMNs published by the provider."""
+
+    tac: int
+    plmns: Tuple[PLMN, ...]
+
+    @functools.cached_property
+    def plmn_table(self) -> PLMNTable:
+        """Return the columnar view of the PLMNs."""
+        return PLMNTable(self.plmns)
+
+    @functools.cached_property
+    def packed_plmns(self) -> bytes:
+        """Return the PLMNs in 3GPP encodings, see `PLMNTable.pack()`."""
+        return self.plmn_table.pack()
+
+    @functools.cached_property
+    def digest(self) -> str:
+        """Return a canonical digest of the TAC and PLMNs, independent of the PLMNs order.
+
+        Returns:
+            str: SHA-256 hex digest.
+        """
+        # SD is never negative, so -1 unambiguously stands for a missing SD.
+        plmns = sorted(
+            (plmn.mcc, plmn.mnc, plmn.sst, -1 if plmn.sd is None else plmn.sd)
+            for plmn in self.plmns
+        )
+        return hashlib.sha256(json.dumps([self.tac, plmns]).encode()).hexdigest()
+
+
+class GnbConfigChangedEvent(EventBase):
+    """Charm event emitted when the TAC or the PLMNs published by the provider change."""
+
+    def __init__(self, handle: Handle, digest: str):
+        """Init.
+
+        Args:
+            handle (Handle): Handle of the event.
+            digest (str): Digest of the new TAC and PLMNs, empty if they are not available.
+        """
+        super().__init__(handle)
+        self.digest = digest
+
+    def snapshot(self) -> dict:
+        """Return snapshot."""
+        return {"digest": self.digest}
+
+    def restore(self, snapshot: dict) -> None:
+        """Restore snapshot."""
+        self.digest = snapshot["digest"]
+
+
+class _PLMNsDeltaEvent(EventBase):
+    """Base class for the events carrying the PLMNs added or removed by the provider."""
+
+    def __init__(self, handle: Handle, plmns: List[dict]):
+        """Init.
+
+        Args:
+            handle (Handle): Handle of the event.
+            plmns (List[dict]): PLMNs, as returned by `PLMN.asdict()`.
+        """
+        super().__init__(handle)
+        self.plmns = plmns
+
+    def snapshot(self) -> dict:
+        """Return snapshot."""
+        return {"plmns": self.plmns}
+
+    def restore(self, snapshot: dict) -> None:
+        """Restore snapshot."""
+        self.plmns = snapshot["plmns"]
+
+
+class PLMNAddedEvent(_PLMNsDeltaEvent):
+    """Charm event emitted when the provider adds PLMNs."""
+
+
+class PLMNRemovedEvent(_PLMNsDeltaEvent):
+    """Charm event emitted when the provider removes PLMNs."""
+
+
+class TACChangedEvent(EventBase):
+    """Charm event emitted when the TAC published by the provider changes."""
+
+    def __init__(self, handle: Handle, previous_tac: Optional[int], tac: Optional[int]):
+        """Init.
+
+        Args:
+            handle (Handle): Handle of the event.
+            previous_tac (int): Previous TAC, None if it was not available.
+            tac (int): New TAC, None if it is not available anymore.
+        """
+        super().__init__(handle)
+        self.previous_tac = previous_tac
+        self.tac = tac
+
+    def snapshot(self) -> dict:
+        """Return snapshot."""
+        return {"previous_tac": self.previous_tac, "tac": self.tac}
+
+    def restore(self, snapshot: dict) -> None:
+        """Restore snapshot."""
+        self.previous_tac = snapshot["previous_tac"]
+        self.tac = snapshot["tac"]
+
+
+class FivegCoreGnbRequirerCharmEvents(ObjectEvents):
+    """List of events that the `fiveg_core_gnb` requirer can emit."""
+
+    gnb_config_changed = EventSource(GnbConfigChangedEvent)
+    plmn_added = EventSource(PLMNAddedEvent)
+    plmn_removed = EventSource(PLMNRemovedEvent)
+    tac_changed = EventSource(TACChangedEvent)
+
+
+def _plmn_key(plmn: dict) -> Tuple[str, str, int, Optional[int]]:
+    """Return the key identifying a PLMN in the diff between two PLMN lists."""
+    return plmn["mcc"], plmn["mnc"], plmn["sst"], plmn["sd"]
+
+
+def _diff_plmns(
+    previous_plmns: List[dict], plmns: List[dict]
+) -> Tuple[List[dict], List[dict]]:
+    """Return the PLMNs added and removed between two PLMN lists.
+
+    Args:
+        previous_plmns (List[dict]): Previous PLMNs, as returned by `PLMN.asdict()`.
+        plmns (List[dict]): New PLMNs, as returned by `PLMN.asdict()`.
+
+    Returns:
+        Tuple[List[dict], List[dict]]: Added and removed PLMNs, in their original order.
+    """
+    previous_keys = {_plmn_key(plmn) for plmn in previous_plmns}
+    keys = {_plmn_key(plmn) for plmn in plmns}
+    added = [plmn for plmn in plmns if _plmn_key(plmn) not in previous_keys]
+    removed = [plmn for plmn in previous_plmns if _plmn_key(plmn) not in keys]
+    return added, removed
+
+
+_UNSET = object()
+
+# Results validated by another version of this library are not trusted.
+_VALIDATION_CACHE_VERSION = f"{LIBAPI}.{LIBPATCH}"
+
+# Minimum time between two warnings about the same invalid provider data.
+_INVALID_DATA_SUMMARY_INTERVAL_S = 3600
+# Number of distinct invalid data remembered, to keep the stored state bounded.
+_MAX_INVALID_DATA_LOG_ENTRIES = 16
+
+
+def _raw_provider_data_digest(databag: Dict[str, str]) -> str:
+    """Return the digest of the raw TAC and PLMNs in the provider databag.
+
+    Args:
+        databag (dict): Raw provider application databag.
+
+    Returns:
+        str: SHA-256 hex digest.
+    """
+    raw_data = [databag.get("tac"), databag.get("plmns")]
+    if PLMNS_MANIFEST_KEY in databag:
+        # The manifest holds the digest of every shard.
+        raw_data.append(databag[PLMNS_MANIFEST_KEY])
+    return hashlib.sha256(json.dumps(raw_data).encode()).hexdigest()
+
+
+class FivegCoreGnbRequires(Object):
+    """Class to be instantiated by requirer of the `fiveg_core_gnb`."""
+
+    on = FivegCoreGnbRequirerCharmEvents()  # type: ignore[reportAssignmentType]
+
+    _stored = StoredState()
+
+    def __init__(
+        self, charm: CharmBase, relation_name: str, max_plmns: Optional[int] = None
+    ):
+        """Create a new instance of the FivegCoreGnbRequires class.
+
+        Args:
+            charm: Juju charm
+            relation_name (str): Relation name
+            max_plmns (int): Maximum number of PLMNs accepted from the provider, None for no
+                limit.
+        """
+        self.relation_name = relation_name
+        self.charm = charm
+        self.max_plmns = max_plmns
+        super().__init__(charm, relation_name)
+        self._stored.set_default(
+            gnb_config_digest="",
+            tac=None,
+            validation_cache={},
+            plmn_shards_cache={},
+            validation_failures={},
+            invalid_data_log={},
+            fleet_validation_cache={},
+        )
+        self._snapshot: Union[Optional[GnbConfigSnapshot], object] = _UNSET
+        self._gnb_configs: Optional[Dict[str, GnbConfigSnapshot]] = None
+        self.framework.observe(
+            charm.on[relation_name].relation_changed, self._on_relation_changed_or_broken
+        )
+        self.framework.observe(
+            charm.on[relation_name].relation_broken, self._on_relation_changed_or_broken
+        )
+
+    def _on_relation_changed_or_broken(
+        self, _: Union[RelationChangedEvent, RelationBrokenEvent]
+    ) -> None:
+        """Drop the memoized remote application data and emit events for actual changes."""
+        self._snapshot = _UNSET
+        self._gnb_configs = None
+        snapshot = self.snapshot()
+        digest = snapshot.digest if snapshot else ""
+        if digest == self._stored.gnb_config_digest:
+            logger.debug("TAC and PLMNs in relation %s are unchanged", self.relation_name)
+            return
+        previous_tac = self._stored.tac
+        tac = snapshot.tac if snapshot else None
+        plmns = [plmn.asdict() for plmn in snapshot.plmns] if snapshot else []
+        added, removed = _diff_plmns(self._announced_plmns(), plmns)
+        self._stored.gnb_config_digest = digest
+        self._stored.tac = tac
+        self._stored.validation_cache.pop("announced_plmns", None)
+        if tac != previous_tac:
+            self.on.tac_changed.emit(previous_tac=previous_tac, tac=tac)
+        if removed:
+            self.on.plmn_removed.emit(plmns=removed)
+        if added:
+            self.on.plmn_added.emit(plmns=added)
+        self.on.gnb_config_changed.emit(digest=digest)
+
+    def _announced_plmns(self) -> List[dict]:
+        """Return the PLMNs of the last `gnb_config_changed` event, from the validation cache.
+
+        Returns:
+            List[dict]: PLMNs, as returned by `PLMN.asdict()`. Empty if they are unknown, e.g.
+                when they were announced by another version of this library.
+        """
+        cache = self._stored.validation_cache
+        if "announced_plmns" in cache:
+            return json.loads(cache["announced_plmns"])
+        if cache.get("digest") == self._stored.gnb_config_digest:
+            return json.loads(cache.get("plmns", "[]"))
+        return []
+
+    def publish_gnb_information(self, gnb_name: str) -> None:
+        """Set CU/gNB identifier in the relation data.
+
+        Args:
+            gnb_name (str): CU/gNB unique identifier.
+        """
+        with _start_span("fiveg_core_gnb.publish_gnb_information") as span:
+            if not self.charm.unit.is_leader():
+                raise RuntimeError("Unit must be leader to set application relation data.")
+
+            if not data_matches_requirer_schema(
+                data={"gnb-name": gnb_name}
+            ):
+                raise ValueError(f"Invalid gNB name: {gnb_name}")
+
+            relation = self.model.get_relation(relation_name=self.relation_name)
+            if not relation:
+                raise RuntimeError(f"Relation {self.relation_name} not created yet.")
+            span.set_attribute("fiveg_core_gnb.relation_id", relation.id)
+
+            local_app_data = relation.data[self.charm.app]
+            local_app_data.update({"gnb-name": gnb_name})
+            # The application no longer serves the fleet it may have served before.
+            local_app_data.pop("gnb-names", None)
+
+    def publish_fleet_gnb_information(self, gnb_names: Sequence[str]) -> None:
+        """Set the identifiers of all the CUs/gNBs of a fleet in the relation data.
+
+        The first name is also published as `gnb-name`, for providers which do not support
+        fleets.
+
+        Args:
+            gnb_names (Sequence[str]): CU/gNB unique identifiers.
+        """
+        with _start_span("fiveg_core_gnb.publish_fleet_gnb_information") as span:
+            if not self.charm.unit.is_leader():
+                raise RuntimeError("Unit must be leader to set application relation data.")
+
+            gnb_names = list(gnb_names)
+            if len(set(gnb_names)) != len(gnb_names) or not data_matches_requirer_schema(
+                data={"gnb-name": gnb_names[0] if gnb_names else "", "gnb-names": gnb_names}
+            ):
+                raise ValueError(f"Invalid gNB names: {gnb_names}")
+
+            relation = self.model.get_relation(relation_name=self.relation_name)
+            if not relation:
+                raise RuntimeError(f"Relation {self.relation_name} not created yet.")
+            span.set_attribute("fiveg_core_gnb.relation_id", relation.id)
+            span.set_attribute("fiveg_core_gnb.gnb_count", len(gnb_names))
+
+            relation.data[self.charm.app].update(
+                {"gnb-name": gnb_names[0], "gnb-names": json.dumps(gnb_names)}
+            )
+
+    def gnb_configs(self) -> Dict[str, GnbConfigSnapshot]:
+        """Return the validated TAC and PLMNs assigned to every CU/gNodeB of the fleet.
+
+        Like `snapshot`, the configs are validated once per hook, and unchanged configs are not
+        validated again in the next hooks. Invalid configs are left out.
+
+        Returns:
+            Dict[str, GnbConfigSnapshot]: TAC and PLMNs, keyed by CU/gNodeB name.
+        """
+        if self._gnb_configs is None:
+            with _start_span("fiveg_core_gnb.get_remote_gnb_configs") as span:
+                self._gnb_configs = self._get_remote_gnb_configs()
+                span.set_attribute("fiveg_core_gnb.gnb_count", len(self._gnb_configs))
+        return self._gnb_configs
+
+    def _get_remote_gnb_configs(self) -> Dict[str, GnbConfigSnapshot]:
+        """Read and validate the configs of the fleet published by the provider.
+
+        Returns:
+            Dict[str, GnbConfigSnapshot]: Valid TAC and PLMNs, keyed by CU/gNodeB name.
+        """
+        relation = self.model.get_relation(self.relation_name)
+        if not relation or not relation.app:
+            return {}
+        raw = relation.data[relation.app].get("gnb-configs")
+        if not raw:
+            return {}
+        raw_digest = hashlib.sha256(raw.encode()).hexdigest()
+        cache = self._stored.fleet_validation_cache
+        if (
+            cache.get("version") == _VALIDATION_CACHE_VERSION
+            and cache.get("raw_digest") == raw_digest
+        ):
+            if not cache["gnb_names"]:
+                return {}
+            decoded = json.loads(raw)
+            # The configs of the cached names were validated by a previous hook.
+            return {
+                gnb_name: GnbConfigSnapshot(
+                    tac=decoded[gnb_name]["tac"],
+                    plmns=tuple(
+                        PLMN(plmn["mcc"], plmn["mnc"], plmn["sst"], plmn.get("sd"))
+                        for plmn in decoded[gnb_name]["plmns"]
+                    ),
+                )
+                for gnb_name in cache["gnb_names"]
+            }
+        gnb_configs = {}
+        try:
+            decoded = json.loads(raw)
+        except json.JSONDecodeError:
+            decoded = None
+        if not isinstance(decoded, dict):
+            logger.error("Invalid gNB configs in relation %s: %s", relation.id, _Truncated(raw))
+            decoded = {}
+        for gnb_name, entry in decoded.items():
+            try:
+                gnb_configs[gnb_name] = _parse_fleet_gnb_config(entry)
+            except (TypeError, ValueError) as e:
+                logger.error("Invalid config for gNB %s: %s", gnb_name, _Truncated(e))
+        self._stored.fleet_validation_cache = {
+            "version": _VALIDATION_CACHE_VERSION,
+            "raw_digest": raw_digest,
+            "gnb_names": sorted(gnb_configs),
+        }
+        return gnb_configs
+
+    def _get_remote_app_relation_data(self) -> Optional[dict]:
+        """Get relation data for the remote application.
+
+        Returns:
+        str: Relation data for the remote application
+            or None if the relation data is invalid.
+        """
+        with _start_span("fiveg_core_gnb.get_remote_app_relation_data") as span:
+            relation = self.model.get_relation(self.relation_name)
+
+            if not relation:
+                logger.error("No relation: %s", self.relation_name)
+                return None
+
+            if not relation.app:
+                logger.warning("No remote application in relation: %s", self.relation_name)
+                return None
+            span.set_attribute("fiveg_core_gnb.relation_id", relation.id)
+
+            remote_app_relation_data: Dict[str, Any] = dict(relation.data[relation.app])
+            raw_digest = _raw_provider_data_digest(remote_app_relation_data)
+            cache = self._stored.validation_cache
+            if (
+                cache.get("version") == _VALIDATION_CACHE_VERSION
+                and cache.get("raw_digest") == raw_digest
+                and cache.get("max_plmns") == self.max_plmns
+            ):
+                span.set_attribute("fiveg_core_gnb.validation_cache", "hit")
+                if cache["tac"] is None:
+                    self._log_invalid_data(raw_digest, relation.id, cache.get("reason"))
+                    return None
+                remote_app_relation_data["tac"] = cache["tac"]
+                # The cached PLMNs were validated by a previous hook.
+                remote_app_relation_data["plmns"] = tuple(
+                    PLMN(**plmn) for plmn in json.loads(cache["plmns"])
+                )
+                span.set_attribute(
+                    "fiveg_core_gnb.plmn_count", len(remote_app_relation_data["plmns"])
+                )
+                return remote_app_relation_data
+
+            span.set_attribute("fiveg_core_gnb.validation_cache", "miss")
+            known_shards = {
+                digest: tuple(PLMN(**plmn) for plmn in json.loads(plmns_json))
+                for digest, plmns_json in self._stored.plmn_shards_cache.items()
+            }
+            try:
+                tac, plmns = _parse_provider_databag(
+                    remote_app_relation_data, self.max_plmns, known_shards
+                )
+            except ValueError as e:
+                reason = _validation_failure_reason(remote_app_relation_data, e).value
+                self._log_invalid_data(raw_digest, relation.id, reason, e)
+                failures = self._stored.validation_failures
+                failures[reason] = failures.get(reason, 0) + 1
+                self._store_validation_result(raw_digest, tac=None, plmns=[], reason=reason)
+                return None
+
+            self._store_validation_result(
+                raw_digest,
+                tac=tac,
+                plmns=[plmn.asdict() for plmn in plmns],
+                digest=GnbConfigSnapshot(tac=tac, plmns=tuple(plmns)).digest,
+            )
+            self._store_plmn_shards(remote_app_relation_data, known_shards)
+            remote_app_relation_data["tac"] = tac
+            remote_app_relation_data["plmns"] = plmns
+            span.set_attribute("fiveg_core_gnb.plmn_count", len(plmns))
+            return remote_app_relation_data
+
+    def _log_invalid_data(
+        self,
+        raw_digest: str,
+        relation_id: int,
+        reason: Optional[str] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Log invalid provider data once, then count the repeats and periodically summarize them.
+
+        Args:
+            raw_digest (str): Digest of the raw provider data.
+            relation_id (int): ID of the relation.
+            reason (str): `ValidationFailureReason` value.
+            error (Exception): Validation error, None if the data was validated by a previous
+                hook.
+        """
+        now = time.time()
+        entries = self._stored.invalid_data_log
+        entry = entries.get(raw_digest)
+        if entry is None:
+            logger.error(
+                "Invalid data in relation %s:%s (digest %s, %s): %s",
+                self.relation_name,
+                relation_id,
+                raw_digest[:12],
+                reason,
+                _Truncated(error) if error else "validated by a previous hook",
+            )
+            newest = sorted(entries.items(), key=lambda item: item[1]["logged_at"], reverse=True)
+            log = dict(newest[: _MAX_INVALID_DATA_LOG_ENTRIES - 1])
+            log[raw_digest] = {"reason": reason, "logged_at": now, "suppressed": 0}
+            self._stored.invalid_data_log = log
+            return
+        suppressed = entry["suppressed"] + 1
+        if now - entry["logged_at"] < _INVALID_DATA_SUMMARY_INTERVAL_S:
+            logger.debug("Invalid data in relation %s, already logged", raw_digest[:12])
+            entries[raw_digest] = {**entry, "suppressed": suppressed}
+            return
+        logger.warning(
+            "Data in relation %s:%s (digest %s, %s) is still invalid, seen %d more times",
+            self.relation_name,
+            relation_id,
+            raw_digest[:12],
+            entry["reason"],
+            suppressed,
+        )
+        entries[raw_digest] = {**entry, "logged_at": now, "suppressed": 0}
+
+    def _store_plmn_shards(
+        self, databag: Dict[str, Any], known_shards: Dict[str, Tuple[PLMN, ...]]
+    ) -> None:
+        """Keep the validated PLMN shards listed in the current manifest for the next hooks.
+
+        Args:
+            databag (dict): Provider application databag.
+            known_shards (dict): Validated PLMNs, keyed by shard digest.
+        """
+        digests = json.loads(databag[PLMNS_MANIFEST_KEY]) if PLMNS_MANIFEST_KEY in databag else []
+        self._stored.plmn_shards_cache = {
+            digest: json.dumps([plmn.asdict() for plmn in known_shards[digest]])
+            for digest in digests
+        }
+
+    def _store_validation_result(
+        self,
+        raw_digest: str,
+        tac: Optional[int],
+        plmns: List[dict],
+        digest: str = "",
+        reason: Optional[str] = None,
+    ) -> None:
+        """Keep the validated provider data for the next hooks.
+
+        The cache also holds the last announced PLMNs, which `PLMNAddedEvent` and
+        `PLMNRemovedEvent` are computed from. When the provider data is validated by a hook
+        other than `relation_changed` or `relation_broken`, they are kept aside, under
+        `announced_plmns`, until the change is announced.
+
+        Args:
+            raw_digest (str): Digest of the raw provider data.
+            tac (int): Validated TAC, None if the provider data is invalid.
+            plmns (List[dict]): Validated PLMNs, as returned by `PLMN.asdict()`.
+            digest (str): `GnbConfigSnapshot.digest` of the validated data, empty if the
+                provider data is invalid.
+            reason (str): `ValidationFailureReason` value if the provider data is invalid.
+        """
+        previous = self._stored.validation_cache
+        cache = {
+            "version": _VALIDATION_CACHE_VERSION,
+            "raw_digest": raw_digest,
+            "max_plmns": self.max_plmns,
+            "tac": tac,
+            # Large PLMN lists are much cheaper to persist as a single string.
+            "plmns": json.dumps(plmns),
+            "digest": digest,
+            "reason": reason,
+        }
+        if digest != self._stored.gnb_config_digest:
+            if "announced_plmns" in previous:
+                cache["announced_plmns"] = previous["announced_plmns"]
+            elif previous.get("digest") == self._stored.gnb_config_digest:
+                cache["announced_plmns"] = previous["plmns"]
+        self._stored.validation_cache = cache
+
+    def snapshot(self) -> Optional[GnbConfigSnapshot]:
+        """Return the validated TAC and PLMNs published by the provider.
+
+        The remote application data is read and validated on first use and memoized until the
+        relation changes or is broken, so that `tac` and `plmns` share a single parse per hook.
+
+        Returns:
+            GnbConfigSnapshot: TAC and PLMNs, or None if the relation data is missing or invalid.
+        """
+        if self._snapshot is _UNSET:
+            snapshot = None
+            if remote_relation_data := self._get_remote_app_relation_data():
+                snapshot = GnbConfigSnapshot(
+                    tac=remote_relation_data["tac"],
+                    plmns=tuple(remote_relation_data["plmns"]),
+                )
+            self._snapshot = snapshot
+        return self._snapshot  # type: ignore[return-value]
 
     @property
     def tac(self) -> Optional[int]:
@@ -425,17 +2316,44 @@ class FivegCoreGnbRequires(Object):
         Returns:
             int: TAC.
         """
-        if remote_relation_data := self._get_remote_app_relation_data():
-            return remote_relation_data["tac"]
+        if snapshot := self.snapshot():
+            return snapshot.tac
         return None
 
     @property
-    def plmns(self) -> Optional[list[PLMNConfig]]:
+    def plmns(self) -> "Optional[List[PLMNConfig]]":
         """Return the configured PLMNs for the CU/gNodeB.
 
+        Use `snapshot().plmns` to read them as `PLMN` objects, without building pydantic
+        models.
+
         Returns:
             list: PLMNs.
         """
-        if remote_relation_data := self._get_remote_app_relation_data():
-            return remote_relation_data["plmns"]
+        if snapshot := self.snapshot():
+            plmn_config = _models().PLMNConfig
+            return [plmn_config(**plmn.asdict()) for plmn in snapshot.plmns]
+        return None
+
+    @property
+    def validation_failures(self) -> Dict[ValidationFailureReason, int]:
+        """Return how many times the provider data failed validation, per reason.
+
+        Unchanged provider data is only validated once, so it is only counted once.
+
+        Returns:
+            dict: Number of validation failures, for every reason.
+        """
+        failures = self._stored.validation_failures
+        return {reason: failures.get(reason.value, 0) for reason in ValidationFailureReason}
+
+    @property
+    def plmn_table(self) -> Optional[PLMNTable]:
+        """Return the configured PLMNs for the CU/gNodeB as columns.
+
+        Returns:
+            PLMNTable: PLMNs.
+        """
+        if snapshot := self.snapshot():
+            return snapshot.plmn_table
         return None
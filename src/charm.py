@@ -4,82 +4,379 @@
 
 """Integrator charm to provide a fiveg_gnb_identity."""
 
+import hashlib
+import json
 import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional
 
 import ops
-from charms.sdcore_nms_k8s.v0.fiveg_core_gnb import FivegCoreGnbRequires
-from ops import ActiveStatus, BlockedStatus, CollectStatusEvent, EventBase, WaitingStatus
+from charms.sdcore_nms_k8s.v0.fiveg_core_gnb import FivegCoreGnbRequires, GnbConfigSnapshot
+from opentelemetry import trace
+from ops import (
+    ActionEvent,
+    ActiveStatus,
+    BlockedStatus,
+    CollectStatusEvent,
+    EventBase,
+    Relation,
+    StoredState,
+    WaitingStatus,
+)
+
+from gnb_config_export import gnb_config_digest, render_gnb_config, write_gnb_config
+from hook_tools import HookToolAccounting, budget_from_env
+from metrics import observe_hook_duration, render_metrics, write_metrics
+from tracing import HookTracing
 
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
 
 CORE_GNB_RELATION_NAME = "fiveg_core_gnb"
+# Length of the digest prefix of the TAC and PLMNs shown in the unit status.
+STATUS_DIGEST_LENGTH = 12
+
+
+@dataclass(frozen=True)
+class CoreGnbRelationData:
+    """The `fiveg_core_gnb` relation and this application's databag, read once per hook.
+
+    The remote databag is read by the requirer, which validates it.
+    """
+
+    relation: Optional[Relation]
+    # None when the unit is not allowed to read its own application databag.
+    local_app_data: Optional[Mapping[str, str]]
 
 
 class SdcoreGnbIntegratorCharm(ops.CharmBase):
     """Charm for gNB Integrator Service."""
 
+    _stored = StoredState()
+
     def __init__(self, *args):
+        self._hook_start_time = time.perf_counter()
         super().__init__(*args)
+        self._tracing = HookTracing(self, str(self.config.get("tracing-endpoint", "")))
+        hook_tool_stats_path = str(self.config.get("hook-tool-stats-path", ""))
+        hook_tool_call_budget = budget_from_env()
+        self._hook_tools: Optional[HookToolAccounting] = None
+        # Hook tools are only accounted for on demand, as it wraps every hook tool call.
+        if hook_tool_stats_path or hook_tool_call_budget is not None:
+            self._hook_tools = HookToolAccounting(
+                self,
+                stats_path=Path(hook_tool_stats_path) if hook_tool_stats_path else None,
+                budget=hook_tool_call_budget,
+            )
+        self._stored.set_default(
+            published_gnb_fingerprint=None,
+            published_relation_id=None,
+            last_publish_timestamp=None,
+            hook_durations={},
+            exported_gnb_config_digest=None,
+            exported_gnb_config_path=None,
+            gnb_config_generation=0,
+            gnb_config_validated_at={},
+        )
         self._core_gnb_requirer = FivegCoreGnbRequires(self, CORE_GNB_RELATION_NAME)
+        self._core_gnb_relation_data_cache: Optional[CoreGnbRelationData] = None
         self.framework.observe(self.on.collect_unit_status, self._on_collect_unit_status)
+        # Runs after collect-status, and changes made in pre-commit are still stored.
+        self.framework.observe(self.framework.on.pre_commit, self._update_metrics)
+        self.framework.observe(self.framework.on.pre_commit, self._export_gnb_config)
+        self.framework.observe(self.framework.on.pre_commit, self._record_gnb_config_digests)
+        self.framework.observe(self.on.get_gnb_config_action, self._on_get_gnb_config_action)
         self.framework.observe(self.on.update_status, self._configure)
+        self.framework.observe(self.on.config_changed, self._configure)
         self.framework.observe(
             self.on[CORE_GNB_RELATION_NAME].relation_changed,
             self._configure,
         )
 
+    @tracer.start_as_current_span("SdcoreGnbIntegratorCharm._on_collect_unit_status")
     def _on_collect_unit_status(self, event: CollectStatusEvent):
         """Check the unit status and set it when CollectStatusEvent is fired.
 
         Args:
             event: CollectStatusEvent
         """
-        if not self._relation_created(CORE_GNB_RELATION_NAME):
+        relation_data = self._core_gnb_relation_data
+        if not relation_data.relation:
             event.add_status(
                 BlockedStatus(f"Waiting for {CORE_GNB_RELATION_NAME} relation to be created")
             )
             logger.info("Waiting for %s relation to be created", CORE_GNB_RELATION_NAME)
             return
-        if not self._core_gnb_requirer.tac or not self._core_gnb_requirer.plmns:
+        if self._fleet_gnb_names:
+            self._collect_fleet_status(event, relation_data)
+            return
+        snapshot = self._core_gnb_requirer.snapshot()
+        if not snapshot or not snapshot.tac or not snapshot.plmns:
             event.add_status(WaitingStatus("Waiting for TAC and PLMNs configuration"))
             return
-        if not self._is_gnb_name_published():
+        if not self._is_gnb_name_published(relation_data):
             event.add_status(
                 BlockedStatus(
                     "Invalid configuration: gNB name is missing from the relation"
                 )
             )
             return
+        # The PLMNs are only summarized, they are returned by the `get-gnb-config` action.
         event.add_status(
             ActiveStatus(
-                f"PLMNs: {','.join([str(plmn.asdict()) for plmn in self._core_gnb_requirer.plmns])}, "  # noqa: E501
-                f"TAC: {self._core_gnb_requirer.tac}"
+                f"PLMNs: {len(snapshot.plmns)}, TAC: {snapshot.tac}, "
+                f"digest: {snapshot.digest[:STATUS_DIGEST_LENGTH]}"
             )
         )
 
+    def _collect_fleet_status(
+        self, event: CollectStatusEvent, relation_data: CoreGnbRelationData
+    ) -> None:
+        """Set the unit status from the TAC and PLMNs assigned to every gNB of the fleet.
+
+        Args:
+            event: CollectStatusEvent
+            relation_data: Both sides of the `fiveg_core_gnb` relation.
+        """
+        gnb_configs = self._gnb_configs()
+        unconfigured = [name for name in self._fleet_gnb_names if name not in gnb_configs]
+        if unconfigured:
+            event.add_status(
+                WaitingStatus(
+                    "Waiting for TAC and PLMNs configuration of "
+                    f"{len(unconfigured)}/{len(self._fleet_gnb_names)} gNBs"
+                )
+            )
+            return
+        if not self._is_gnb_name_published(relation_data, key="gnb-names"):
+            event.add_status(
+                BlockedStatus(
+                    "Invalid configuration: gNB names are missing from the relation"
+                )
+            )
+            return
+        event.add_status(ActiveStatus(f"{len(self._fleet_gnb_names)} gNBs configured"))
+
+    @tracer.start_as_current_span("SdcoreGnbIntegratorCharm._configure")
     def _configure(self, _: EventBase) -> None:
-        """Publish gNB name `fiveg_core_gnb` relation data bag."""
+        """Publish gNB name `fiveg_core_gnb` relation data bag.
+
+        The gNB information is only published when it differs from what was last published
+        to the same relation, or when it is no longer in the relation data.
+        """
         if not self.unit.is_leader():
             return
-        if not self._relation_created(CORE_GNB_RELATION_NAME):
+        relation_data = self._core_gnb_relation_data
+        relation = relation_data.relation
+        if not relation:
             logger.info("No %s relations found.", CORE_GNB_RELATION_NAME)
             return
+        trace.get_current_span().set_attribute("fiveg_core_gnb.relation_id", relation.id)
+
+        fingerprint = self._gnb_information_fingerprint()
+        if (
+            self._stored.published_relation_id == relation.id
+            and self._stored.published_gnb_fingerprint == fingerprint
+            and self._is_gnb_information_in_relation_data(relation_data)
+        ):
+            logger.debug("gNB information already published to relation %s", relation.id)
+            trace.get_current_span().set_attribute("gnb_integrator.published", False)
+            return
 
         try:
-            self._core_gnb_requirer.publish_gnb_information(gnb_name=self._gnb_name)
+            if self._fleet_gnb_names:
+                self._core_gnb_requirer.publish_fleet_gnb_information(
+                    gnb_names=self._fleet_gnb_names
+                )
+            else:
+                self._core_gnb_requirer.publish_gnb_information(gnb_name=self._gnb_name)
         except ValueError:
+            logger.error("Invalid gNB names: %s", self._fleet_gnb_names or self._gnb_name)
             return
+        self._invalidate_core_gnb_relation_data()
+        self._stored.published_relation_id = relation.id
+        self._stored.published_gnb_fingerprint = fingerprint
+        self._stored.last_publish_timestamp = time.time()
+        trace.get_current_span().set_attribute("gnb_integrator.published", True)
 
-    def _relation_created(self, relation_name: str) -> bool:
-        """Return whether a given Juju relation was created.
+    def _update_metrics(self, _: EventBase) -> None:
+        """Record the duration of the hook and write the metrics of the charm.
+
+        Nothing is recorded when no `metrics-path` is configured.
+        """
+        if not (metrics_path := self._metrics_path):
+            return
+        event = os.environ.get("JUJU_DISPATCH_PATH", "").rpartition("/")[2] or "unknown"
+        self._stored.hook_durations = observe_hook_duration(
+            self._stored.hook_durations,
+            event,
+            time.perf_counter() - self._hook_start_time,
+        )
+        snapshot = None
+        if self._core_gnb_relation_data.relation:
+            snapshot = self._core_gnb_requirer.snapshot()
+        metrics = render_metrics(
+            hook_durations=self._stored.hook_durations,
+            validation_failures={
+                reason.value: count
+                for reason, count in self._core_gnb_requirer.validation_failures.items()
+            },
+            last_publish_timestamp=self._stored.last_publish_timestamp,
+            tac=snapshot.tac if snapshot else None,
+            plmn_count=len(snapshot.plmns) if snapshot else None,
+        )
+        write_metrics(metrics_path, metrics)
+
+    def _export_gnb_config(self, _: EventBase) -> None:
+        """Write the gNB configuration to the configured `gnb-config-path`.
+
+        The file is only written when its content changes, or when it is missing, and every
+        new content gets the next generation.
+        """
+        gnb_config_path = str(self.config.get("gnb-config-path", ""))
+        if not gnb_config_path:
+            return
+        gnb_config = render_gnb_config(self._gnb_configs())
+        digest = gnb_config_digest(gnb_config)
+        if (
+            self._stored.exported_gnb_config_digest == digest
+            and self._stored.exported_gnb_config_path == gnb_config_path
+            and os.path.exists(gnb_config_path)
+        ):
+            return
+        generation = self._stored.gnb_config_generation + 1
+        if not write_gnb_config(Path(gnb_config_path), gnb_config, generation, digest):
+            return
+        logger.info("Exported generation %d of the gNB configuration", generation)
+        self._stored.gnb_config_generation = generation
+        self._stored.exported_gnb_config_digest = digest
+        self._stored.exported_gnb_config_path = gnb_config_path
+
+    def _on_get_gnb_config_action(self, event: ActionEvent) -> None:
+        """Return the TAC and PLMNs of a gNB, from the validated relation data.
 
         Args:
-            relation_name (str): Relation name
+            event: ActionEvent
+        """
+        gnb_name = str(event.params.get("gnb-name", ""))
+        if not gnb_name:
+            if self._fleet_gnb_names:
+                event.fail("The gnb-name parameter is required when gnb-names is configured")
+                return
+            gnb_name = self._gnb_name
+        gnb_configs = self._gnb_configs()
+        if gnb_name not in gnb_configs:
+            event.fail(f"TAC and PLMNs of gNB {gnb_name} are not available")
+            return
+        snapshot = gnb_configs[gnb_name]
+        validated_at = self._stored.gnb_config_validated_at.get(gnb_name, {})
+        if validated_at.get("digest") == snapshot.digest:
+            age_s = time.time() - validated_at["timestamp"]
+        else:
+            # Validated in this hook, it is recorded at the end of the hook.
+            age_s = 0.0
+        event.set_results(
+            {
+                "gnb-name": gnb_name,
+                "tac": snapshot.tac,
+                "plmns": json.dumps([plmn.asdict() for plmn in snapshot.plmns]),
+                "plmn-count": len(snapshot.plmns),
+                "digest": snapshot.digest,
+                "age-seconds": round(age_s, 3),
+            }
+        )
+
+    def _record_gnb_config_digests(self, _: EventBase) -> None:
+        """Record when the TAC and PLMNs of every gNB were first validated."""
+        validated_at = self._stored.gnb_config_validated_at
+        records = {}
+        for gnb_name, snapshot in self._gnb_configs().items():
+            record = validated_at.get(gnb_name)
+            if record and record["digest"] == snapshot.digest:
+                records[gnb_name] = record
+            else:
+                records[gnb_name] = {"digest": snapshot.digest, "timestamp": time.time()}
+        if records != validated_at:
+            self._stored.gnb_config_validated_at = records
+
+    def _gnb_configs(self) -> Dict[str, GnbConfigSnapshot]:
+        """Return the validated TAC and PLMNs of the gNBs served by this application.
 
         Returns:
-            bool: Whether the relation was created.
+            Dict[str, GnbConfigSnapshot]: TAC and PLMNs per gNB name, only for the gNBs which
+                are configured.
+        """
+        if not self._core_gnb_relation_data.relation:
+            return {}
+        if self._fleet_gnb_names:
+            gnb_configs = self._core_gnb_requirer.gnb_configs()
+            primary_gnb_name = self._fleet_gnb_names[0]
+            if primary_gnb_name not in gnb_configs and (
+                snapshot := self._core_gnb_requirer.snapshot()
+            ):
+                # NMS without fleet support only publish the TAC and PLMNs of the `gnb-name`.
+                gnb_configs = {**gnb_configs, primary_gnb_name: snapshot}
+            return {
+                name: gnb_configs[name] for name in self._fleet_gnb_names if name in gnb_configs
+            }
+        snapshot = self._core_gnb_requirer.snapshot()
+        return {self._gnb_name: snapshot} if snapshot else {}
+
+    @property
+    def _metrics_path(self) -> Optional[Path]:
+        """Return the file the metrics are written to.
+
+        Returns:
+            Path: The configured `metrics-path`, or None when metrics are disabled.
+        """
+        if metrics_path := self.config.get("metrics-path"):
+            return Path(str(metrics_path))
+        return None
+
+    def _gnb_information_fingerprint(self) -> str:
+        """Return a stable digest of the gNB information published by this charm.
+
+        Returns:
+            str: SHA-256 hex digest of the gNB information.
+        """
+        if self._fleet_gnb_names:
+            gnb_information = json.dumps({"gnb-names": self._fleet_gnb_names}, sort_keys=True)
+        else:
+            gnb_information = json.dumps({"gnb-name": self._gnb_name}, sort_keys=True)
+        return hashlib.sha256(gnb_information.encode()).hexdigest()
+
+    @property
+    def _core_gnb_relation_data(self) -> CoreGnbRelationData:
+        """Read the `fiveg_core_gnb` relation and this application's databag.
+
+        They are loaded once per hook, so that later checks are served from memory instead of
+        running hook tools again, until `_invalidate_core_gnb_relation_data` is called.
+
+        Returns:
+            CoreGnbRelationData: The relation and this application's databag.
+        """
+        if self._core_gnb_relation_data_cache is not None:
+            return self._core_gnb_relation_data_cache
+        relation = self.model.get_relation(CORE_GNB_RELATION_NAME)
+        if not relation:
+            relation_data = CoreGnbRelationData(relation=None, local_app_data={})
+        else:
+            relation_data = CoreGnbRelationData(
+                relation=relation,
+                local_app_data=dict(relation.data[self.app]) if self.unit.is_leader() else None,
+            )
+        self._core_gnb_relation_data_cache = relation_data
+        return relation_data
+
+    def _invalidate_core_gnb_relation_data(self) -> None:
+        """Drop the memoized relation data, e.g. after this charm wrote to the databag.
+
+        It is read again, from the ops cache, when next needed.
         """
-        return bool(self.model.relations.get(relation_name))
+        self._core_gnb_relation_data_cache = None
 
     @property
     def _gnb_name(self) -> str:
@@ -90,11 +387,50 @@ class SdcoreGnbIntegratorCharm(ops.CharmBase):
         """
         return f"{self.model.name}-gnb-{self.app.name}"
 
-    def _is_gnb_name_published(self) -> bool:
-        relation = self.model.get_relation(CORE_GNB_RELATION_NAME)
-        if not relation:
+    @property
+    def _fleet_gnb_names(self) -> List[str]:
+        """The names of the gNBs served by this application in fleet mode.
+
+        Returns:
+            List[str]: the configured `gnb-names`, empty unless running in fleet mode.
+        """
+        gnb_names = str(self.config.get("gnb-names", ""))
+        return [name.strip() for name in gnb_names.split(",") if name.strip()]
+
+    def _is_gnb_information_in_relation_data(self, relation_data: CoreGnbRelationData) -> bool:
+        """Return whether the relation data holds the gNB information of this charm.
+
+        Args:
+            relation_data: Both sides of the `fiveg_core_gnb` relation.
+
+        Returns:
+            bool: Whether the published gNB name, or names in fleet mode, are the configured ones.
+        """
+        local_app_data = relation_data.local_app_data or {}
+        if not self._fleet_gnb_names:
+            return (
+                local_app_data.get("gnb-name") == self._gnb_name
+                and "gnb-names" not in local_app_data
+            )
+        try:
+            published_gnb_names = json.loads(local_app_data.get("gnb-names", "null"))
+        except json.JSONDecodeError:
+            return False
+        return (
+            published_gnb_names == self._fleet_gnb_names
+            and local_app_data.get("gnb-name") == self._fleet_gnb_names[0]
+        )
+
+    @staticmethod
+    def _is_gnb_name_published(
+        relation_data: CoreGnbRelationData, key: str = "gnb-name"
+    ) -> bool:
+        if not relation_data.relation:
             return False
-        return relation.data[self.app].get("gnb-name") is not None
+        if relation_data.local_app_data is None:
+            # Only the leader can read the application databag, and it reports the gNB name.
+            return True
+        return relation_data.local_app_data.get(key) is not None
 
 
 if __name__ == "__main__":  # pragma: nocover
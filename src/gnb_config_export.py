@@ -0,0 +1,92 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Export of the gNB configuration to a local file.
+
+The TAC and PLMNs assigned by the NMS are rendered, with the name of their gNB, to a JSON file
+which gNB processes on the same host can read without querying Juju. The file is atomically
+replaced, and only when its content changes, so that file watchers only reload on actual
+changes. Every new content gets the next `generation`, which readers can compare to the last
+one they loaded.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Mapping
+
+from charms.sdcore_nms_k8s.v0.fiveg_core_gnb import GnbConfigSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+def render_gnb_config(gnb_configs: Mapping[str, GnbConfigSnapshot]) -> dict:
+    """Render the configuration of the gNBs.
+
+    Args:
+        gnb_configs (dict): Validated TAC and PLMNs, per gNB name.
+
+    Returns:
+        dict: TAC and PLMNs per gNB name. Every PLMN also has its BCD encoded PLMN identity and
+            its S-NSSAI, in hex.
+    """
+    return {
+        gnb_name: {
+            "tac": snapshot.tac,
+            "plmns": [
+                {
+                    **plmn.asdict(),
+                    "plmn_id": plmn.plmn_id_hex,
+                    "snssai": plmn.snssai_hex,
+                }
+                for plmn in snapshot.plmns
+            ],
+        }
+        for gnb_name, snapshot in gnb_configs.items()
+    }
+
+
+def gnb_config_digest(gnb_config: Mapping[str, dict]) -> str:
+    """Return a digest of the gNB configuration, independent of the generation.
+
+    Args:
+        gnb_config (dict): Configuration, as returned by `render_gnb_config`.
+
+    Returns:
+        str: SHA-256 hex digest.
+    """
+    return hashlib.sha256(json.dumps(gnb_config, sort_keys=True).encode()).hexdigest()
+
+
+def write_gnb_config(
+    path: Path, gnb_config: Mapping[str, dict], generation: int, digest: str
+) -> bool:
+    """Atomically replace the gNB configuration file, so that it is never read half-written.
+
+    Args:
+        path (Path): gNB configuration file.
+        gnb_config (dict): Configuration, as returned by `render_gnb_config`.
+        generation (int): Generation of the configuration.
+        digest (str): Digest of the configuration, as returned by `gnb_config_digest`.
+
+    Returns:
+        bool: Whether the file was written.
+    """
+    content = json.dumps(
+        {"generation": generation, "digest": digest, "gnbs": gnb_config},
+        indent=2,
+        sort_keys=True,
+    )
+    temporary_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(temporary_path, "w") as temporary_file:
+            temporary_file.write(content + "\n")
+            temporary_file.flush()
+            os.fsync(temporary_file.fileno())
+        os.replace(temporary_path, path)
+    except OSError as e:
+        logger.warning("Failed to write the gNB configuration to %s: %s", path, e)
+        return False
+    return True
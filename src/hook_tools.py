@@ -0,0 +1,145 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Accounting of the Juju hook tools invoked by the charm.
+
+Every relation data read or write and every leadership check may run a Juju hook tool in a
+subprocess. `HookToolAccounting` counts and times these calls for the duration of a hook, logs a
+summary and writes it to a JSON file. When given a budget, it fails the hook if a hook tool was
+called more often than allowed, so that redundant round-trips are caught by the tests. The
+budget is read from the `HOOK_TOOL_CALL_BUDGET` environment variable by `budget_from_env`.
+
+Calls are accounted at the `ops` model backend, so an `is-leader` call answered from the ops
+leadership cache is counted although it does not run the hook tool.
+"""
+
+import functools
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from ops import CharmBase, Object
+
+logger = logging.getLogger(__name__)
+
+# Hook tools accounted for, and the `ops` model backend method invoking each of them.
+HOOK_TOOLS = {
+    "relation-get": "relation_get",
+    "relation-set": "relation_set",
+    "relation-ids": "relation_ids",
+    "is-leader": "is_leader",
+}
+
+
+# Environment variable holding the hook tool budget, as a JSON object, e.g. `{"relation-get": 2}`.
+HOOK_TOOL_CALL_BUDGET_ENV = "HOOK_TOOL_CALL_BUDGET"
+
+
+def budget_from_env() -> Optional[Dict[str, int]]:
+    """Return the maximum number of calls per hook tool set in the environment.
+
+    Returns:
+        dict: Maximum number of calls per hook tool, None if no valid budget is set.
+    """
+    raw_budget = os.environ.get(HOOK_TOOL_CALL_BUDGET_ENV)
+    if not raw_budget:
+        return None
+    try:
+        budget = json.loads(raw_budget)
+    except json.JSONDecodeError as e:
+        logger.warning("Invalid %s: %s", HOOK_TOOL_CALL_BUDGET_ENV, e)
+        return None
+    if not isinstance(budget, dict):
+        logger.warning("Invalid %s: not a JSON object", HOOK_TOOL_CALL_BUDGET_ENV)
+        return None
+    return budget
+
+
+class HookToolBudgetExceededError(Exception):
+    """Raised when a hook calls a hook tool more often than its budget allows."""
+
+
+class HookToolAccounting(Object):
+    """Count and time the hook tools called by the charm during a hook."""
+
+    def __init__(
+        self,
+        charm: CharmBase,
+        stats_path: Optional[Path] = None,
+        budget: Optional[Mapping[str, int]] = None,
+    ):
+        """Start accounting for the hook tools called by the charm.
+
+        Args:
+            charm: Juju charm
+            stats_path (Path): File the summary of the hook is written to, None to only log it.
+            budget (dict): Maximum number of calls per hook tool, None for no limit.
+        """
+        super().__init__(charm, "hook-tool-accounting")
+        self._stats_path = stats_path
+        self._budget = budget
+        self._calls: Dict[str, Dict[str, Any]] = {
+            tool: {"count": 0, "total_ms": 0.0, "max_ms": 0.0} for tool in HOOK_TOOLS
+        }
+        backend = self.framework.model._backend
+        for tool, method_name in HOOK_TOOLS.items():
+            setattr(backend, method_name, self._accounted(tool, getattr(backend, method_name)))
+        self.framework.observe(self.framework.on.commit, self._on_commit)
+
+    def _accounted(self, tool: str, method: Callable) -> Callable:
+        calls = self._calls[tool]
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                calls["count"] += 1
+                calls["total_ms"] += elapsed_ms
+                calls["max_ms"] = max(calls["max_ms"], elapsed_ms)
+
+        return wrapper
+
+    def summary(self) -> dict:
+        """Return the hook tool calls made so far in this hook.
+
+        Returns:
+            dict: The hook name and, per hook tool, the number of calls and their durations.
+        """
+        return {
+            "hook": os.environ.get("JUJU_DISPATCH_PATH", ""),
+            "calls": {
+                tool: {
+                    "count": calls["count"],
+                    "total_ms": round(calls["total_ms"], 3),
+                    "max_ms": round(calls["max_ms"], 3),
+                }
+                for tool, calls in self._calls.items()
+            },
+        }
+
+    def _on_commit(self, _) -> None:
+        summary = self.summary()
+        logger.debug("Hook tool calls: %s", summary)
+        if self._stats_path:
+            try:
+                self._stats_path.write_text(json.dumps(summary, indent=2))
+            except OSError as e:
+                logger.warning("Failed to write hook tool calls to %s: %s", self._stats_path, e)
+        if self._budget is None:
+            return
+        over_budget = {
+            tool: calls["count"]
+            for tool, calls in summary["calls"].items()
+            if calls["count"] > self._budget.get(tool, calls["count"])
+        }
+        if over_budget:
+            raise HookToolBudgetExceededError(
+                f"{summary['hook']} exceeded its hook tool budget {dict(self._budget)}: "
+                f"{over_budget}"
+            )
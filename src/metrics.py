@@ -0,0 +1,172 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Prometheus metrics of the gNB Integrator charm.
+
+Hooks are short-lived processes, so there is no exporter to scrape. Instead, the metrics are
+rendered in the Prometheus text exposition format and written to a file at the end of every
+hook, for a textfile collector or a `metrics-endpoint` exporter to serve. Cumulative metrics are
+kept in the stored state of the charm between hooks.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+METRICS_PREFIX = "gnb_integrator"
+# Upper bounds, in seconds, of the hook duration histogram buckets.
+HOOK_DURATION_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def observe_hook_duration(
+    hook_durations: Mapping[str, Mapping], event: str, duration_s: float
+) -> Dict[str, dict]:
+    """Return the hook duration histograms with the duration of one more hook.
+
+    Args:
+        hook_durations (dict): Histograms per event, as returned by this function.
+        event (str): Juju event of the hook, e.g. `update-status`.
+        duration_s (float): Duration of the hook, in seconds.
+
+    Returns:
+        dict: Histograms per event, with the cumulative count of every bucket, the sum and the
+            count of the observed durations.
+    """
+    histograms = {
+        name: {
+            "buckets": list(histogram["buckets"]),
+            "sum": histogram["sum"],
+            "count": histogram["count"],
+        }
+        for name, histogram in hook_durations.items()
+    }
+    histogram = histograms.setdefault(
+        event, {"buckets": [0] * len(HOOK_DURATION_BUCKETS), "sum": 0.0, "count": 0}
+    )
+    for index, upper_bound in enumerate(HOOK_DURATION_BUCKETS):
+        if duration_s <= upper_bound:
+            histogram["buckets"][index] += 1
+    histogram["sum"] += duration_s
+    histogram["count"] += 1
+    return histograms
+
+
+def _format_labels(labels: Mapping[str, str]) -> str:
+    if not labels:
+        return ""
+    formatted = (
+        '{}="{}"'.format(
+            name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for name, value in labels.items()
+    )
+    return "{" + ",".join(formatted) + "}"
+
+
+def _format_metric(
+    name: str, metric_type: str, description: str, samples: List[Tuple[str, dict, float]]
+) -> List[str]:
+    lines = [f"# HELP {name} {description}", f"# TYPE {name} {metric_type}"]
+    lines.extend(
+        f"{sample_name}{_format_labels(labels)} {value!r}"
+        for sample_name, labels, value in samples
+    )
+    return lines
+
+
+def render_metrics(
+    hook_durations: Mapping[str, Mapping],
+    validation_failures: Mapping[str, int],
+    last_publish_timestamp: Optional[float],
+    tac: Optional[int],
+    plmn_count: Optional[int],
+) -> str:
+    """Render the metrics of the charm in the Prometheus text exposition format.
+
+    Args:
+        hook_durations (dict): Hook duration histograms, as returned by `observe_hook_duration`.
+        validation_failures (dict): Number of invalid provider data, per reason.
+        last_publish_timestamp (float): Unix time the gNB information was last published.
+        tac (int): TAC published by the provider, None if unavailable or invalid.
+        plmn_count (int): Number of PLMNs published by the provider, None if unavailable or
+            invalid.
+
+    Returns:
+        str: The metrics.
+    """
+    hook_duration = f"{METRICS_PREFIX}_hook_duration_seconds"
+    hook_duration_samples: List[Tuple[str, dict, float]] = []
+    for event, histogram in sorted(hook_durations.items()):
+        for upper_bound, count in zip(HOOK_DURATION_BUCKETS, histogram["buckets"]):
+            hook_duration_samples.append(
+                (f"{hook_duration}_bucket", {"event": event, "le": str(upper_bound)}, count)
+            )
+        hook_duration_samples.extend(
+            [
+                (f"{hook_duration}_bucket", {"event": event, "le": "+Inf"}, histogram["count"]),
+                (f"{hook_duration}_sum", {"event": event}, histogram["sum"]),
+                (f"{hook_duration}_count", {"event": event}, histogram["count"]),
+            ]
+        )
+    validation_failures_total = f"{METRICS_PREFIX}_validation_failures_total"
+    last_publish = f"{METRICS_PREFIX}_last_publish_timestamp_seconds"
+    gnb_config_valid = f"{METRICS_PREFIX}_gnb_config_valid"
+    plmns = f"{METRICS_PREFIX}_plmns"
+    tac_metric = f"{METRICS_PREFIX}_tac"
+    lines = [
+        *_format_metric(
+            hook_duration, "histogram", "Duration of the charm hooks.", hook_duration_samples
+        ),
+        *_format_metric(
+            validation_failures_total,
+            "counter",
+            "Number of times the TAC and PLMNs published by the NMS failed validation.",
+            [
+                (validation_failures_total, {"reason": reason}, count)
+                for reason, count in sorted(validation_failures.items())
+            ],
+        ),
+        *_format_metric(
+            last_publish,
+            "gauge",
+            "Unix time the gNB information was last published, 0 if it never was.",
+            [(last_publish, {}, last_publish_timestamp or 0)],
+        ),
+        *_format_metric(
+            gnb_config_valid,
+            "gauge",
+            "Whether the NMS published a valid TAC and PLMNs.",
+            [(gnb_config_valid, {}, int(tac is not None and plmn_count is not None))],
+        ),
+        *_format_metric(
+            plmns,
+            "gauge",
+            "Number of PLMNs published by the NMS.",
+            [(plmns, {}, plmn_count or 0)],
+        ),
+        *_format_metric(
+            tac_metric,
+            "gauge",
+            "TAC published by the NMS, 0 if unavailable.",
+            [(tac_metric, {}, tac or 0)],
+        ),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics(path: Path, metrics: str) -> None:
+    """Atomically replace the metrics file, so that it is never scraped half-written.
+
+    Args:
+        path (Path): Metrics file.
+        metrics (str): Metrics, as returned by `render_metrics`.
+    """
+    temporary_path = path.with_name(f".{path.name}.tmp")
+    try:
+        temporary_path.write_text(metrics)
+        os.replace(temporary_path, path)
+    except OSError as e:
+        logger.warning("Failed to write metrics to %s: %s", path, e)
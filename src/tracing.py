@@ -0,0 +1,87 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Opt-in OpenTelemetry tracing of the charm hooks.
+
+The charm and the `fiveg_core_gnb` library create spans through the OpenTelemetry API. These
+spans do nothing unless a tracer provider is set, so tracing costs nothing by default.
+
+When a tracing endpoint is configured, `HookTracing` sets the tracer provider of the
+OpenTelemetry SDK, which exports the spans with OTLP over HTTP. The SDK is only imported then.
+Spans are exported by background threads, and the end of the hook waits at most
+`FLUSH_TIMEOUT_SECONDS` for the last ones, so that an unreachable collector does not hold the
+hook back.
+"""
+
+import os
+import threading
+import time
+from typing import Optional
+
+from opentelemetry import trace
+from ops import CharmBase, Object
+
+# Timeout of every export request.
+EXPORT_TIMEOUT_SECONDS = 1
+# Longest time the end of the hook waits for the remaining spans to be exported.
+FLUSH_TIMEOUT_SECONDS = 0.25
+
+
+class HookTracing(Object):
+    """Trace the hook when a tracing endpoint is configured."""
+
+    def __init__(self, charm: CharmBase, endpoint: Optional[str]):
+        """Start tracing the hook.
+
+        Args:
+            charm: Juju charm
+            endpoint (str): URL of the OTLP/HTTP traces endpoint, e.g.
+                `http://collector:4318/v1/traces`. None or empty to disable tracing.
+        """
+        super().__init__(charm, "hook-tracing")
+        self._span: Optional[trace.Span] = None
+        if not endpoint:
+            return
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+        # Not shut down on exit, which would wait for the exports without a time limit.
+        self._provider = TracerProvider(
+            resource=Resource.create(
+                {
+                    "service.name": charm.app.name,
+                    "service.instance.id": charm.unit.name,
+                    "juju_model": charm.model.name,
+                }
+            ),
+            shutdown_on_exit=False,
+        )
+        self._provider.add_span_processor(
+            BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint, timeout=EXPORT_TIMEOUT_SECONDS))
+        )
+        trace.set_tracer_provider(self._provider)
+        dispatch_path = os.environ.get("JUJU_DISPATCH_PATH", "")
+        self._span = self._provider.get_tracer(__name__).start_span(
+            dispatch_path or "hook",
+            attributes={
+                "juju.dispatch_path": dispatch_path,
+                # CPU time spent starting Python and importing the charm, before the hook runs.
+                "process.startup_cpu_seconds": time.process_time(),
+            },
+        )
+        self._span_scope = trace.use_span(self._span)
+        self._span_scope.__enter__()
+        self.framework.observe(self.framework.on.commit, self._on_commit)
+
+    def _on_commit(self, _) -> None:
+        if self._span is None:
+            return
+        self._span_scope.__exit__(None, None, None)
+        self._span.end()
+        self._span = None
+        # The SDK does not bound the flush by its timeout, so it is only waited for that long.
+        flush = threading.Thread(target=self._provider.force_flush, daemon=True)
+        flush.start()
+        flush.join(FLUSH_TIMEOUT_SECONDS)
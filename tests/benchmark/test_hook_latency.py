@@ -0,0 +1,121 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Hook latency and memory benchmarks for the gNB Integrator charm.
+
+The hooks are run through `ops.testing` against real `fiveg_core_gnb` relation data, so that
+parsing and validation of the provider data are measured. The state is first primed with one
+`relation_changed` hook, so that hooks are measured in the steady state of a long-running unit.
+
+Timings depend on the machine, so results are compared against a baseline recorded on the same
+machine. It is stored in `BENCHMARK_BASELINE_PATH` (default `.benchmark-baseline.json`, which is
+not committed) and recorded on the first run, or on any run with `BENCHMARK_UPDATE_BASELINE=1`.
+"""
+
+import json
+import os
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+from ops import testing
+
+from charm import SdcoreGnbIntegratorCharm
+
+BASELINE_PATH = Path(os.environ.get("BENCHMARK_BASELINE_PATH", ".benchmark-baseline.json"))
+UPDATE_BASELINE = os.environ.get("BENCHMARK_UPDATE_BASELINE") == "1" or not BASELINE_PATH.exists()
+ITERATIONS = int(os.environ.get("BENCHMARK_ITERATIONS", "20"))
+# A result regresses when it is this many times worse than the baseline.
+TOLERANCE = float(os.environ.get("BENCHMARK_TOLERANCE", "2.0"))
+PLMN_LIST_SIZES = [1, 10, 100, 1000]
+
+
+def build_plmns(size: int) -> list[dict]:
+    """Return `size` distinct, valid PLMNs as published by the provider."""
+    return [
+        {"mcc": "001", "mnc": f"{index % 100:02d}", "sst": index % 256, "sd": index}
+        for index in range(size)
+    ]
+
+
+def build_state(size: int) -> tuple[testing.State, testing.Relation]:
+    core_gnb_relation = testing.Relation(
+        endpoint="fiveg_core_gnb",
+        interface="fiveg_core_gnb",
+        local_app_data={"gnb-name": "my-model-gnb-sdcore-gnb-integrator"},
+        remote_app_data={"tac": "1", "plmns": json.dumps(build_plmns(size))},
+    )
+    state = testing.State(
+        leader=True,
+        relations=[core_gnb_relation],
+        model=testing.Model(name="my-model"),
+    )
+    return state, core_gnb_relation
+
+
+EVENTS: dict[str, Callable[[testing.Context, testing.Relation], Any]] = {
+    "update_status": lambda ctx, _: ctx.on.update_status(),
+    "relation_changed": lambda ctx, relation: ctx.on.relation_changed(relation),
+    "collect_unit_status": lambda ctx, _: ctx.on.collect_unit_status(),
+}
+
+
+def measure(event_name: str, size: int) -> dict:
+    """Run the hook `ITERATIONS` times and return its latency percentiles and peak memory."""
+    ctx = testing.Context(charm_type=SdcoreGnbIntegratorCharm)
+    state, relation = build_state(size)
+    state = ctx.run(ctx.on.relation_changed(relation), state)
+    relation = state.get_relation(relation.id)
+    event = EVENTS[event_name]
+    latencies_ms = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        ctx.run(event(ctx, relation), state)
+        latencies_ms.append((time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    try:
+        ctx.run(event(ctx, relation), state)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    percentiles = statistics.quantiles(latencies_ms, n=100, method="inclusive")
+    return {
+        "p50_ms": round(percentiles[49], 3),
+        "p95_ms": round(percentiles[94], 3),
+        "p99_ms": round(percentiles[98], 3),
+        "peak_kib": round(peak_bytes / 1024, 1),
+    }
+
+
+def load_baseline() -> dict:
+    if UPDATE_BASELINE:
+        return {}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    baseline = load_baseline()
+    yield baseline
+    if UPDATE_BASELINE:
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"\nRecorded the benchmark baseline in {BASELINE_PATH.resolve()}")
+
+
+@pytest.mark.parametrize("size", PLMN_LIST_SIZES)
+@pytest.mark.parametrize("event_name", list(EVENTS))
+def test_hook_latency_and_memory_within_baseline(baseline, event_name, size):
+    result = measure(event_name, size)
+    print(f"\n{event_name} plmns={size}: {json.dumps(result)}")
+
+    if UPDATE_BASELINE:
+        baseline.setdefault(event_name, {})[str(size)] = result
+        return
+    expected = baseline.get(event_name, {}).get(str(size))
+    if expected is None:
+        pytest.skip(f"No baseline recorded for {event_name} with {size} PLMNs")
+    assert result["p50_ms"] <= expected["p50_ms"] * TOLERANCE, (result, expected)
+    assert result["peak_kib"] <= expected["peak_kib"] * TOLERANCE, (result, expected)
@@ -0,0 +1,62 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Throughput benchmark of the PLMN validation fast path.
+
+`validate_plmns` is compared against validating the same PLMNs through
+`FivegCoreGnbProviderAppData`, which is how they were validated before the fast path existed.
+"""
+
+import json
+import os
+import time
+from typing import Any, Callable
+
+import pytest
+from charms.sdcore_nms_k8s.v0.fiveg_core_gnb import PLMN, _models, validate_plmns
+
+ITERATIONS = int(os.environ.get("BENCHMARK_ITERATIONS", "20"))
+PLMN_LIST_SIZES = [1, 10, 100, 1000, 10000]
+
+
+def build_plmns(size: int) -> list[dict]:
+    """Return `size` distinct, valid PLMNs as decoded from the provider databag."""
+    return [
+        {"mcc": "001", "mnc": f"{index % 100:02d}", "sst": index % 256, "sd": index}
+        for index in range(size)
+    ]
+
+
+def validate_plmns_with_pydantic(plmns: list[dict]) -> tuple[PLMN, ...]:
+    provider_data = _models().provider_app_data_adapter.validate_python(
+        {"tac": 1, "plmns": plmns}
+    )
+    return tuple(PLMN(plmn.mcc, plmn.mnc, plmn.sst, plmn.sd) for plmn in provider_data.plmns)
+
+
+def best_time_ms(validate: Callable[[list[dict]], Any], plmns: list[dict]) -> float:
+    """Return the fastest of `ITERATIONS` runs, which is the least noisy estimate."""
+    validate(plmns)
+    timings = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        validate(plmns)
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+@pytest.mark.parametrize("size", PLMN_LIST_SIZES)
+def test_validate_plmns_is_faster_than_pydantic(size):
+    plmns = build_plmns(size)
+    assert validate_plmns(plmns) == validate_plmns_with_pydantic(plmns)
+
+    fast_path_ms = best_time_ms(validate_plmns, plmns)
+    pydantic_ms = best_time_ms(validate_plmns_with_pydantic, plmns)
+    result = {
+        "fast_path_ms": round(fast_path_ms, 4),
+        "pydantic_ms": round(pydantic_ms, 4),
+        "speedup": round(pydantic_ms / fast_path_ms, 2),
+    }
+    print(f"\nvalidate_plmns plmns={size}: {json.dumps(result)}")
+
+    assert fast_path_ms < pydantic_ms, result
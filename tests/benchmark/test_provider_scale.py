@@ -0,0 +1,252 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Provider side scale simulation of a fleet of gNB integrators.
+
+A simulated NMS charm using `FivegCoreGnbProvides` is run through `ops.testing` with `N`
+synthetic `fiveg_core_gnb` relations, each one with the databag a gNB integrator publishes. One
+relation in ten serves a fleet of gNBs. Event storms are then replayed against it:
+
+- `mass_join`: integrators publish their gNB names, one `relation_changed` hook each.
+- `config_push`: the operator changes the PLMNs, and one `config_changed` hook publishes the new
+  config to every relation.
+- `rename`: integrators rename their gNBs, one `relation_changed` hook each.
+
+For every storm, the latency of the hooks, the peak memory of a hook and the bytes written to the
+databags are printed, to find the number of relations a single NMS stops keeping up with.
+
+Storms of many hooks replay `BENCHMARK_STORM_HOOKS` of them. Relation counts are set with
+`BENCHMARK_RELATION_COUNTS`, e.g. `BENCHMARK_RELATION_COUNTS=10,100,1000,10000`.
+"""
+
+import dataclasses
+import json
+import os
+import statistics
+import time
+import tracemalloc
+from typing import Callable, List
+
+import ops
+import pytest
+from charms.sdcore_nms_k8s.v0.fiveg_core_gnb import FivegCoreGnbProvides, PLMNConfig
+from ops import testing
+
+RELATION_COUNTS = [
+    int(count) for count in os.environ.get("BENCHMARK_RELATION_COUNTS", "10,100,1000").split(",")
+]
+STORM_HOOKS = int(os.environ.get("BENCHMARK_STORM_HOOKS", "10"))
+FLEET_SIZE = 8
+CORE_GNB_RELATION_NAME = "fiveg_core_gnb"
+METADATA = {
+    "name": "simulated-nms",
+    "provides": {CORE_GNB_RELATION_NAME: {"interface": "fiveg_core_gnb"}},
+}
+DEFAULT_PLMNS = [{"mcc": "001", "mnc": "01", "sst": 1}]
+CONFIG = {
+    "options": {
+        "tac": {"type": "int", "default": 1},
+        "plmns": {"type": "string", "default": json.dumps(DEFAULT_PLMNS)},
+    }
+}
+
+
+class SimulatedNmsCharm(ops.CharmBase):
+    """Publishes the configured TAC and PLMNs to every gNB integrator, like the NMS does."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.fiveg_core_gnb_provider = FivegCoreGnbProvides(self, CORE_GNB_RELATION_NAME)
+        self.framework.observe(self.on.config_changed, self._on_config_changed)
+        self.framework.observe(
+            self.on[CORE_GNB_RELATION_NAME].relation_changed, self._on_relation_changed
+        )
+
+    @property
+    def _gnb_config(self) -> tuple:
+        plmns = [PLMNConfig(**plmn) for plmn in json.loads(str(self.config["plmns"]))]
+        return int(self.config["tac"]), plmns
+
+    def _on_config_changed(self, _: ops.ConfigChangedEvent) -> None:
+        gnb_config = self._gnb_config
+        registry = self.fiveg_core_gnb_provider.gnb_registry()
+        self.fiveg_core_gnb_provider.publish_gnb_config_bulk(
+            dict.fromkeys(registry.gnb_names, gnb_config)
+        )
+
+    def _on_relation_changed(self, event: ops.RelationChangedEvent) -> None:
+        registry = self.fiveg_core_gnb_provider.gnb_registry()
+        gnb_names = registry.get_gnb_names(event.relation.id)
+        if not gnb_names:
+            return
+        tac, plmns = self._gnb_config
+        if len(gnb_names) > 1:
+            self.fiveg_core_gnb_provider.publish_fleet_gnb_config(
+                event.relation.id, dict.fromkeys(gnb_names, (tac, plmns))
+            )
+        else:
+            self.fiveg_core_gnb_provider.publish_gnb_config_bulk({event.relation.id: (tac, plmns)})
+
+
+def requirer_databag(index: int, generation: int = 0) -> dict:
+    """Return the databag of the `index`th gNB integrator."""
+    gnb_name = f"model-{index}-gnb-integrator-{generation}"
+    if index % 10:
+        return {"gnb-name": gnb_name}
+    gnb_names = [f"{gnb_name}-{gnb}" for gnb in range(FLEET_SIZE)]
+    return {"gnb-name": gnb_names[0], "gnb-names": json.dumps(gnb_names)}
+
+
+def build_state(relation_count: int, joined: bool) -> testing.State:
+    """Return the state of an NMS related to `relation_count` gNB integrators."""
+    relations = [
+        testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            remote_app_name=f"gnb-integrator-{index}",
+            remote_app_data=requirer_databag(index) if joined else {},
+        )
+        for index in range(relation_count)
+    ]
+    return testing.State(leader=True, relations=relations)
+
+
+def databag_bytes_written(state_in: testing.State, state_out: testing.State) -> int:
+    """Return the size of the keys and values written to the local application databags."""
+    written = 0
+    for relation in state_out.relations:
+        previous = state_in.get_relation(relation.id).local_app_data
+        for key, value in relation.local_app_data.items():
+            if previous.get(key) != value:
+                written += len(key) + len(value)
+    return written
+
+
+@dataclasses.dataclass
+class StormResult:
+    latencies_ms: List[float] = dataclasses.field(default_factory=list)
+    bytes_written: int = 0
+    peak_kib: float = 0.0
+
+    def summary(self) -> dict:
+        return {
+            "hooks": len(self.latencies_ms),
+            "p50_ms": round(statistics.median(self.latencies_ms), 3),
+            "max_ms": round(max(self.latencies_ms), 3),
+            "bytes_written": self.bytes_written,
+            "peak_kib": round(self.peak_kib, 1),
+        }
+
+
+def replay(
+    ctx: testing.Context, state: testing.State, events: List[Callable[[], testing.State]]
+) -> tuple[testing.State, StormResult]:
+    """Run the hooks of a storm one after the other, and measure them.
+
+    Args:
+        ctx: Context of the simulated NMS.
+        state: State before the storm.
+        events: For each hook, a function returning the state to run the hook on from the
+            current state, and the event.
+    """
+    result = StormResult()
+    first_hook = None
+    for build_hook in events:
+        event, state_in = build_hook(state)
+        first_hook = first_hook or (event, state_in)
+        start = time.perf_counter()
+        state_out = ctx.run(event, state_in)
+        result.latencies_ms.append((time.perf_counter() - start) * 1000)
+        result.bytes_written += databag_bytes_written(state_in, state_out)
+        state = state_out
+    # Tracing allocations slows hooks down, so memory is measured by running the first hook
+    # of the storm again.
+    tracemalloc.start()
+    try:
+        ctx.run(*first_hook)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    result.peak_kib = peak_bytes / 1024
+    return state, result
+
+
+def with_remote_app_data(state: testing.State, relation_id: int, databag: dict) -> testing.State:
+    relation = dataclasses.replace(state.get_relation(relation_id), remote_app_data=databag)
+    relations = [relation if r.id == relation_id else r for r in state.relations]
+    return dataclasses.replace(state, relations=relations)
+
+
+def storm_hook_indexes(relation_count: int) -> List[int]:
+    """Return the indexes of the relations replayed by a storm, spread over all of them."""
+    step = max(relation_count // STORM_HOOKS, 1)
+    return list(range(0, relation_count, step))[:STORM_HOOKS]
+
+
+def mass_join(ctx: testing.Context, relation_count: int) -> tuple[testing.State, StormResult]:
+    state = build_state(relation_count, joined=False)
+    # Every integrator but the replayed ones already joined.
+    replayed = storm_hook_indexes(relation_count)
+    relation_ids = [relation.id for relation in state.relations]
+    for index, relation_id in enumerate(relation_ids):
+        if index not in replayed:
+            state = with_remote_app_data(state, relation_id, requirer_databag(index))
+
+    def join(index: int) -> Callable:
+        def build_hook(current: testing.State):
+            current = with_remote_app_data(
+                current, relation_ids[index], requirer_databag(index)
+            )
+            relation = current.get_relation(relation_ids[index])
+            return ctx.on.relation_changed(relation, remote_unit=0), current
+        return build_hook
+
+    return replay(ctx, state, [join(index) for index in replayed])
+
+
+def config_push(ctx: testing.Context, relation_count: int) -> tuple[testing.State, StormResult]:
+    state = ctx.run(ctx.on.config_changed(), build_state(relation_count, joined=True))
+    plmns = [{"mcc": "001", "mnc": "01", "sst": sst, "sd": 1} for sst in range(1, 5)]
+
+    def push(current: testing.State):
+        current = dataclasses.replace(current, config={"plmns": json.dumps(plmns)})
+        return ctx.on.config_changed(), current
+
+    return replay(ctx, state, [push])
+
+
+def rename(ctx: testing.Context, relation_count: int) -> tuple[testing.State, StormResult]:
+    state = ctx.run(ctx.on.config_changed(), build_state(relation_count, joined=True))
+    relation_ids = [relation.id for relation in state.relations]
+
+    def rename_gnb(index: int) -> Callable:
+        def build_hook(current: testing.State):
+            current = with_remote_app_data(
+                current, relation_ids[index], requirer_databag(index, generation=1)
+            )
+            relation = current.get_relation(relation_ids[index])
+            return ctx.on.relation_changed(relation, remote_unit=0), current
+        return build_hook
+
+    return replay(
+        ctx, state, [rename_gnb(index) for index in storm_hook_indexes(relation_count)]
+    )
+
+
+STORMS = {"mass_join": mass_join, "config_push": config_push, "rename": rename}
+
+
+@pytest.mark.parametrize("relation_count", RELATION_COUNTS)
+@pytest.mark.parametrize("storm", list(STORMS))
+def test_provider_keeps_up_with_event_storm(storm, relation_count):
+    ctx = testing.Context(charm_type=SimulatedNmsCharm, meta=METADATA, config=CONFIG)
+
+    state, result = STORMS[storm](ctx, relation_count)
+    print(f"\n{storm} relations={relation_count}: {json.dumps(result.summary())}")
+
+    with ctx(ctx.on.update_status(), state) as manager:
+        registry = manager.charm.fiveg_core_gnb_provider.gnb_registry()
+        manager.run()
+    assert len(registry.gnb_names) == relation_count
+    assert registry.duplicates == {}
+    assert result.bytes_written > 0
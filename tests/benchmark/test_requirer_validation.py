@@ -0,0 +1,104 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Scaling benchmark of the bulk validation of requirer data on the provider side.
+
+`validate_all_requirers` is run against thousands of `fiveg_core_gnb` relations, serially and on
+thread and process pools of increasing size. It is compared against validating every databag
+with `data_matches_requirer_schema`, which is what `get_gnb_name` did for each relation before
+the bulk API existed.
+"""
+
+import concurrent.futures
+import json
+import os
+import time
+from typing import Callable, Optional
+
+import ops
+import pytest
+from charms.sdcore_nms_k8s.v0.fiveg_core_gnb import (
+    FivegCoreGnbProvides,
+    RequirerValidationResult,
+    data_matches_requirer_schema,
+)
+from ops import testing
+
+ITERATIONS = int(os.environ.get("BENCHMARK_ITERATIONS", "20"))
+RELATION_COUNTS = [100, 1000, 5000]
+WORKER_COUNTS = [2, 4]
+BATCH_SIZE = 256
+CORE_GNB_RELATION_NAME = "fiveg_core_gnb"
+METADATA = {
+    "name": "fiveg-core-gnb-provider",
+    "provides": {CORE_GNB_RELATION_NAME: {"interface": "fiveg_core_gnb"}},
+}
+EXECUTORS: dict[str, Callable[[int], Optional[concurrent.futures.Executor]]] = {
+    "serial": lambda _: None,
+    "threads": lambda workers: concurrent.futures.ThreadPoolExecutor(max_workers=workers),
+    "processes": lambda workers: concurrent.futures.ProcessPoolExecutor(max_workers=workers),
+}
+
+
+class ProviderCharm(ops.CharmBase):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.fiveg_core_gnb_provider = FivegCoreGnbProvides(self, CORE_GNB_RELATION_NAME)
+
+
+def build_state(relation_count: int) -> testing.State:
+    relations = [
+        testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            remote_app_data={"gnb-name": f"gnb{index:05d}"},
+        )
+        for index in range(relation_count)
+    ]
+    return testing.State(leader=True, relations=relations)
+
+
+def best_time_ms(run: Callable[[], object]) -> float:
+    """Return the fastest of `ITERATIONS` runs, which is the least noisy estimate."""
+    run()
+    timings = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def validate_one_by_one(provider: FivegCoreGnbProvides) -> dict:
+    results = {}
+    for relation in provider.model.relations[CORE_GNB_RELATION_NAME]:
+        data = dict(relation.data[relation.app])
+        results[relation.id] = data["gnb-name"] if data_matches_requirer_schema(data) else None
+    return results
+
+
+@pytest.mark.parametrize("relation_count", RELATION_COUNTS)
+def test_validate_all_requirers_scales_with_relations_and_workers(relation_count):
+    ctx = testing.Context(charm_type=ProviderCharm, meta=METADATA)
+    with ctx(ctx.on.update_status(), build_state(relation_count)) as manager:
+        provider = manager.charm.fiveg_core_gnb_provider
+        expected = {
+            relation_id: RequirerValidationResult(gnb_names=(gnb_name,))
+            for relation_id, gnb_name in validate_one_by_one(provider).items()
+        }
+        result = {"one_by_one_ms": round(best_time_ms(lambda: validate_one_by_one(provider)), 3)}
+        for executor_name, build_executor in EXECUTORS.items():
+            for workers in WORKER_COUNTS if executor_name != "serial" else [1]:
+                executor = build_executor(workers)
+                try:
+                    assert provider.validate_all_requirers(executor, BATCH_SIZE) == expected
+                    elapsed_ms = best_time_ms(
+                        lambda: provider.validate_all_requirers(executor, BATCH_SIZE)
+                    )
+                finally:
+                    if executor:
+                        executor.shutdown()
+                result[f"{executor_name}_{workers}_ms"] = round(elapsed_ms, 3)
+    print(f"\nvalidate_all_requirers relations={relation_count}: {json.dumps(result)}")
+
+    assert result["serial_1_ms"] < result["one_by_one_ms"], result
@@ -1,34 +1,34 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-from unittest.mock import PropertyMock, patch
+import json
+from unittest.mock import patch
 
 import pytest
 from ops import testing
 
 from charm import SdcoreGnbIntegratorCharm
 
+VALID_PLMNS = [
+    {"mcc": "001", "mnc": "01", "sst": 1, "sd": 1056816},
+    {"mcc": "001", "mnc": "01", "sst": 2, "sd": None},
+]
+VALID_REMOTE_APP_DATA = {"tac": "1", "plmns": json.dumps(VALID_PLMNS)}
+
 
 class GnbIntegratorUnitTestFixtures:
     patcher_publish_gnb_information = patch("charm.FivegCoreGnbRequires.publish_gnb_information")
-    patcher_gnb_core_remote_tac = patch(
-        "charm.FivegCoreGnbRequires.tac", new_callable=PropertyMock
-    )
-    patcher_gnb_core_remote_plmns = patch(
-        "charm.FivegCoreGnbRequires.plmns", new_callable=PropertyMock
-    )
+    patcher_gnb_core_snapshot = patch("charm.FivegCoreGnbRequires.snapshot")
 
     @pytest.fixture(autouse=True)
     def setup(self, request):
         self.mock_publish_gnb_information = (
             GnbIntegratorUnitTestFixtures.patcher_publish_gnb_information.start()
         )
-        self.mock_gnb_core_remote_tac = (
-            GnbIntegratorUnitTestFixtures.patcher_gnb_core_remote_tac.start()
-        )
-        self.mock_gnb_core_remote_plmns = (
-            GnbIntegratorUnitTestFixtures.patcher_gnb_core_remote_plmns.start()
+        self.mock_gnb_core_snapshot = (
+            GnbIntegratorUnitTestFixtures.patcher_gnb_core_snapshot.start()
         )
+        self.mock_gnb_core_snapshot.return_value = None
         yield
         request.addfinalizer(self.teardown)
 
@@ -41,3 +41,12 @@ class GnbIntegratorUnitTestFixtures:
         self.ctx = testing.Context(
             charm_type=SdcoreGnbIntegratorCharm,
         )
+
+
+class CharmRootTestFixtures:
+    """Run the charm in a temporary charm directory, for tests of the files it writes."""
+
+    @pytest.fixture(autouse=True)
+    def context(self, tmp_path):
+        self.charm_root = tmp_path
+        self.ctx = testing.Context(charm_type=SdcoreGnbIntegratorCharm, charm_root=tmp_path)
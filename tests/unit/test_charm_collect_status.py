@@ -1,9 +1,10 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+from unittest.mock import patch
 
 import pytest
-from charms.sdcore_nms_k8s.v0.fiveg_core_gnb import PLMNConfig
+from charms.sdcore_nms_k8s.v0.fiveg_core_gnb import PLMN, GnbConfigSnapshot
 from ops import ActiveStatus, BlockedStatus, WaitingStatus, testing
 
 from tests.unit.fixtures import GnbIntegratorUnitTestFixtures
@@ -13,8 +14,9 @@ class TestCharmCollectUnitStatus(GnbIntegratorUnitTestFixtures):
     def test_fiveg_core_gnb_relation_not_created_when_collect_unit_status_then_status_is_blocked(
         self
     ):
-        self.mock_gnb_core_remote_tac.return_value = 2
-        self.mock_gnb_core_remote_plmns.return_value = [PLMNConfig(mcc="001", mnc="01", sst=1)]
+        self.mock_gnb_core_snapshot.return_value = GnbConfigSnapshot(
+            tac=2, plmns=(PLMN(mcc="001", mnc="01", sst=1),)
+        )
         state_in = testing.State(leader=True)
 
         state_out = self.ctx.run(self.ctx.on.collect_unit_status(), state_in)
@@ -24,18 +26,16 @@ class TestCharmCollectUnitStatus(GnbIntegratorUnitTestFixtures):
         )
 
     @pytest.mark.parametrize(
-        "tac,plmns",
+        "snapshot",
         [
-            pytest.param(None, [PLMNConfig(mcc="001", mnc="01", sst=31)], id="tac_is_none"),
-            pytest.param(23, None, id="plmns_is_none"),
-            pytest.param(None, None, id="plmns_and_tac_are_none"),
+            pytest.param(None, id="tac_and_plmns_are_unavailable"),
+            pytest.param(GnbConfigSnapshot(tac=23, plmns=()), id="plmns_are_empty"),
         ],
     )
     def test_fiveg_core_gnb_tac_and_plmns_unavailable_when_collect_unit_status_then_status_is_waiting(  # noqa: E501
-        self, tac, plmns
+        self, snapshot
     ):
-        self.mock_gnb_core_remote_tac.return_value = tac
-        self.mock_gnb_core_remote_plmns.return_value = plmns
+        self.mock_gnb_core_snapshot.return_value = snapshot
         core_gnb_relation = testing.Relation(
                 endpoint="fiveg_core_gnb", interface="fiveg_core_gnb"
             )
@@ -48,8 +48,9 @@ class TestCharmCollectUnitStatus(GnbIntegratorUnitTestFixtures):
     def test_fiveg_core_gnb_gnb_name_unavailable_when_collect_unit_status_then_status_is_blocked(  # noqa: E501
         self,
     ):
-        self.mock_gnb_core_remote_tac.return_value = 1
-        self.mock_gnb_core_remote_plmns.return_value = PLMNConfig(mcc="001", mnc="01", sst=31)
+        self.mock_gnb_core_snapshot.return_value = GnbConfigSnapshot(
+            tac=1, plmns=(PLMN(mcc="001", mnc="01", sst=31),)
+        )
         core_gnb_relation = testing.Relation(
                 endpoint="fiveg_core_gnb", interface="fiveg_core_gnb"
             )
@@ -64,13 +65,29 @@ class TestCharmCollectUnitStatus(GnbIntegratorUnitTestFixtures):
     @pytest.mark.parametrize(
         "tac,plmns",
         [
-            pytest.param(1, [PLMNConfig(mcc="001", mnc="01", sst=31)], id="single_plmn"),
-            pytest.param(2, [PLMNConfig(mcc="001", mnc="01", sst=31), PLMNConfig(mcc="999", mnc="99", sst=12)], id="multiple_plmns"),  # noqa: E501
+            pytest.param(1, (PLMN(mcc="001", mnc="01", sst=31),), id="single_plmn"),
+            pytest.param(2, (PLMN(mcc="001", mnc="01", sst=31), PLMN(mcc="999", mnc="99", sst=12)), id="multiple_plmns"),  # noqa: E501
         ],
     )
     def test_pre_requisites_met_when_collect_unit_status_then_status_is_active(self, tac, plmns):
-        self.mock_gnb_core_remote_tac.return_value = tac
-        self.mock_gnb_core_remote_plmns.return_value = plmns
+        snapshot = GnbConfigSnapshot(tac=tac, plmns=plmns)
+        self.mock_gnb_core_snapshot.return_value = snapshot
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            local_app_data={"gnb-name": "gnb-integrator"},
+        )
+        state_in = testing.State(leader=True, relations=[core_gnb_relation])
+
+        state_out = self.ctx.run(self.ctx.on.collect_unit_status(), state_in)
+
+        assert state_out.unit_status == ActiveStatus(
+            f"PLMNs: {len(plmns)}, TAC: {tac}, digest: {snapshot.digest[:12]}"
+        )
+
+    def test_given_many_plmns_when_collect_unit_status_then_status_message_is_bounded(self):
+        plmns = tuple(PLMN(mcc="001", mnc="01", sst=1, sd=sd) for sd in range(1000))
+        self.mock_gnb_core_snapshot.return_value = GnbConfigSnapshot(tac=1, plmns=plmns)
         core_gnb_relation = testing.Relation(
             endpoint="fiveg_core_gnb",
             interface="fiveg_core_gnb",
@@ -80,6 +97,72 @@ class TestCharmCollectUnitStatus(GnbIntegratorUnitTestFixtures):
 
         state_out = self.ctx.run(self.ctx.on.collect_unit_status(), state_in)
 
+        assert state_out.unit_status.message.startswith("PLMNs: 1000, TAC: 1, digest: ")
+        assert len(state_out.unit_status.message) < 64
+
+    def test_given_unit_is_not_leader_when_collect_unit_status_then_status_is_active(self):
+        snapshot = GnbConfigSnapshot(tac=1, plmns=(PLMN(mcc="001", mnc="01", sst=31),))
+        self.mock_gnb_core_snapshot.return_value = snapshot
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            local_app_data={"gnb-name": "gnb-integrator"},
+        )
+        state_in = testing.State(leader=False, relations=[core_gnb_relation])
+
+        state_out = self.ctx.run(self.ctx.on.collect_unit_status(), state_in)
+
         assert state_out.unit_status == ActiveStatus(
-            f"PLMNs: {','.join([str(plmn.asdict()) for plmn in plmns])}, TAC: {tac}"
+            f"PLMNs: 1, TAC: 1, digest: {snapshot.digest[:12]}"
         )
+
+    @pytest.mark.parametrize(
+        "configured_gnb_names,expected_status",
+        [
+            pytest.param(
+                ["gnb001"],
+                WaitingStatus("Waiting for TAC and PLMNs configuration of 1/2 gNBs"),
+                id="partially_configured",
+            ),
+            pytest.param(["gnb001", "gnb002"], ActiveStatus("2 gNBs configured"), id="configured"),
+        ],
+    )
+    def test_given_fleet_mode_when_collect_unit_status_then_status_reflects_fleet_configs(
+        self, configured_gnb_names, expected_status
+    ):
+        gnb_config = GnbConfigSnapshot(tac=1, plmns=(PLMN(mcc="001", mnc="01", sst=1),))
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            local_app_data={"gnb-name": "gnb001", "gnb-names": '["gnb001", "gnb002"]'},
+        )
+        state_in = testing.State(
+            leader=True, relations=[core_gnb_relation], config={"gnb-names": "gnb001,gnb002"}
+        )
+
+        with patch("charm.FivegCoreGnbRequires.gnb_configs") as mock_gnb_configs:
+            mock_gnb_configs.return_value = dict.fromkeys(configured_gnb_names, gnb_config)
+            state_out = self.ctx.run(self.ctx.on.collect_unit_status(), state_in)
+
+        assert state_out.unit_status == expected_status
+
+    def test_given_single_gnb_fleet_and_nms_without_fleet_support_when_collect_unit_status_then_status_is_active(  # noqa: E501
+        self,
+    ):
+        self.mock_gnb_core_snapshot.return_value = GnbConfigSnapshot(
+            tac=1, plmns=(PLMN(mcc="001", mnc="01", sst=1),)
+        )
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            local_app_data={"gnb-name": "gnb001", "gnb-names": '["gnb001"]'},
+        )
+        state_in = testing.State(
+            leader=True, relations=[core_gnb_relation], config={"gnb-names": "gnb001"}
+        )
+
+        with patch("charm.FivegCoreGnbRequires.gnb_configs") as mock_gnb_configs:
+            mock_gnb_configs.return_value = {}
+            state_out = self.ctx.run(self.ctx.on.collect_unit_status(), state_in)
+
+        assert state_out.unit_status == ActiveStatus("1 gNBs configured")
@@ -1,6 +1,9 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+import hashlib
+import json
+from unittest.mock import patch
 
 from ops import testing
 
@@ -11,8 +14,7 @@ class TestCharmConfigure(GnbIntegratorUnitTestFixtures):
     def test_given_core_gnb_relation_relation_when_configure_then_gnb_information_is_provided(
         self
     ):
-        self.mock_gnb_core_remote_tac.return_value = 1
-        self.mock_gnb_core_remote_plmns.return_value = None
+        self.mock_gnb_core_snapshot.return_value = None
         core_gnb_relation = testing.Relation(
             endpoint="fiveg_core_gnb", interface="fiveg_core_gnb"
         )
@@ -27,3 +29,146 @@ class TestCharmConfigure(GnbIntegratorUnitTestFixtures):
         self.mock_publish_gnb_information.assert_called_once_with(
             gnb_name="my-model-gnb-sdcore-gnb-integrator"
         )
+
+    def test_given_gnb_information_already_published_to_relation_when_configure_then_gnb_information_is_not_published_again(  # noqa: E501
+        self,
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            id=3,
+            local_app_data={"gnb-name": "my-model-gnb-sdcore-gnb-integrator"},
+        )
+        fingerprint = hashlib.sha256(
+            json.dumps({"gnb-name": "my-model-gnb-sdcore-gnb-integrator"}).encode()
+        ).hexdigest()
+        state_in = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            model=testing.Model(name="my-model"),
+            stored_states=[
+                testing.StoredState(
+                    owner_path="SdcoreGnbIntegratorCharm",
+                    content={
+                        "published_gnb_fingerprint": fingerprint,
+                        "published_relation_id": 3,
+                    },
+                )
+            ],
+        )
+
+        self.ctx.run(self.ctx.on.update_status(), state_in)
+
+        self.mock_publish_gnb_information.assert_not_called()
+
+    def test_given_gnb_name_missing_from_relation_data_when_configure_then_gnb_information_is_published_again(  # noqa: E501
+        self,
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb", interface="fiveg_core_gnb", id=3
+        )
+        fingerprint = hashlib.sha256(
+            json.dumps({"gnb-name": "my-model-gnb-sdcore-gnb-integrator"}).encode()
+        ).hexdigest()
+        state_in = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            model=testing.Model(name="my-model"),
+            stored_states=[
+                testing.StoredState(
+                    owner_path="SdcoreGnbIntegratorCharm",
+                    content={
+                        "published_gnb_fingerprint": fingerprint,
+                        "published_relation_id": 3,
+                    },
+                )
+            ],
+        )
+
+        self.ctx.run(self.ctx.on.update_status(), state_in)
+
+        self.mock_publish_gnb_information.assert_called_once_with(
+            gnb_name="my-model-gnb-sdcore-gnb-integrator"
+        )
+
+    def test_given_gnb_information_published_to_another_relation_when_configure_then_gnb_information_is_published(  # noqa: E501
+        self,
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb", interface="fiveg_core_gnb", id=4
+        )
+        fingerprint = hashlib.sha256(
+            json.dumps({"gnb-name": "my-model-gnb-sdcore-gnb-integrator"}).encode()
+        ).hexdigest()
+        state_in = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            model=testing.Model(name="my-model"),
+            stored_states=[
+                testing.StoredState(
+                    owner_path="SdcoreGnbIntegratorCharm",
+                    content={
+                        "published_gnb_fingerprint": fingerprint,
+                        "published_relation_id": 3,
+                    },
+                )
+            ],
+        )
+
+        state_out = self.ctx.run(self.ctx.on.update_status(), state_in)
+
+        self.mock_publish_gnb_information.assert_called_once_with(
+            gnb_name="my-model-gnb-sdcore-gnb-integrator"
+        )
+        stored_state = state_out.get_stored_state("_stored", owner_path="SdcoreGnbIntegratorCharm")
+        assert stored_state.content["published_relation_id"] == 4
+        assert stored_state.content["published_gnb_fingerprint"] == fingerprint
+
+    def test_given_gnb_names_changed_when_config_changed_then_fleet_gnb_information_is_provided(
+        self,
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            local_app_data={"gnb-name": "my-model-gnb-sdcore-gnb-integrator"},
+        )
+        state_in = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            config={"gnb-names": "gnb001,gnb002"},
+        )
+
+        with patch(
+            "charm.FivegCoreGnbRequires.publish_fleet_gnb_information"
+        ) as mock_publish_fleet_gnb_information:
+            self.ctx.run(self.ctx.on.config_changed(), state_in)
+
+        mock_publish_fleet_gnb_information.assert_called_once_with(
+            gnb_names=["gnb001", "gnb002"]
+        )
+
+    def test_given_gnb_names_configured_when_configure_then_fleet_gnb_information_is_provided(
+        self,
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb", interface="fiveg_core_gnb"
+        )
+        state_in = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            config={"gnb-names": "gnb001, gnb002,,gnb003"},
+        )
+
+        with patch(
+            "charm.FivegCoreGnbRequires.publish_fleet_gnb_information"
+        ) as mock_publish_fleet_gnb_information:
+            state_out = self.ctx.run(self.ctx.on.update_status(), state_in)
+
+        mock_publish_fleet_gnb_information.assert_called_once_with(
+            gnb_names=["gnb001", "gnb002", "gnb003"]
+        )
+        self.mock_publish_gnb_information.assert_not_called()
+        stored_state = state_out.get_stored_state("_stored", owner_path="SdcoreGnbIntegratorCharm")
+        assert stored_state.content["published_gnb_fingerprint"] == hashlib.sha256(
+            json.dumps({"gnb-names": ["gnb001", "gnb002", "gnb003"]}).encode()
+        ).hexdigest()
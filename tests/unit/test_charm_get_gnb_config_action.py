@@ -0,0 +1,143 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+from unittest.mock import patch
+
+import pytest
+from charms.sdcore_nms_k8s.v0.fiveg_core_gnb import PLMN, GnbConfigSnapshot
+from ops import testing
+
+from tests.unit.fixtures import VALID_PLMNS, VALID_REMOTE_APP_DATA, CharmRootTestFixtures
+
+SNAPSHOT = GnbConfigSnapshot(tac=1, plmns=tuple(PLMN(**plmn) for plmn in VALID_PLMNS))
+
+
+class TestCharmGetGnbConfigAction(CharmRootTestFixtures):
+    def test_given_valid_remote_data_when_get_gnb_config_then_gnb_config_is_returned(self):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=VALID_REMOTE_APP_DATA,
+        )
+        state_in = testing.State(
+            leader=True, relations=[core_gnb_relation], model=testing.Model(name="my-model")
+        )
+
+        self.ctx.run(self.ctx.on.action("get-gnb-config"), state_in)
+
+        assert self.ctx.action_results == {
+            "gnb-name": "my-model-gnb-sdcore-gnb-integrator",
+            "tac": 1,
+            "plmns": json.dumps(VALID_PLMNS),
+            "plmn-count": 2,
+            "digest": SNAPSHOT.digest,
+            "age-seconds": 0.0,
+        }
+
+    def test_given_validated_remote_data_when_get_gnb_config_then_it_is_not_validated_again(
+        self,
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=VALID_REMOTE_APP_DATA,
+        )
+        state = testing.State(leader=True, relations=[core_gnb_relation])
+        state = self.ctx.run(self.ctx.on.relation_changed(core_gnb_relation, remote_unit=0), state)
+
+        with patch(
+            "charms.sdcore_nms_k8s.v0.fiveg_core_gnb._parse_provider_databag"
+        ) as mock_parse_provider_databag:
+            self.ctx.run(self.ctx.on.action("get-gnb-config"), state)
+
+        mock_parse_provider_databag.assert_not_called()
+        assert self.ctx.action_results is not None
+        assert self.ctx.action_results["digest"] == SNAPSHOT.digest
+
+    def test_given_gnb_config_validated_earlier_when_get_gnb_config_then_its_age_is_returned(
+        self,
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=VALID_REMOTE_APP_DATA,
+        )
+        state_in = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            model=testing.Model(name="my-model"),
+            stored_states=[
+                testing.StoredState(
+                    owner_path="SdcoreGnbIntegratorCharm",
+                    content={
+                        "gnb_config_validated_at": {
+                            "my-model-gnb-sdcore-gnb-integrator": {
+                                "digest": SNAPSHOT.digest,
+                                "timestamp": 1000.0,
+                            }
+                        }
+                    },
+                )
+            ],
+        )
+
+        with patch("charm.time.time", return_value=1060.0):
+            self.ctx.run(self.ctx.on.action("get-gnb-config"), state_in)
+
+        assert self.ctx.action_results is not None
+        assert self.ctx.action_results["age-seconds"] == 60.0
+
+    def test_given_no_valid_remote_data_when_get_gnb_config_then_action_fails(self):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data={"tac": "1"},
+        )
+        state_in = testing.State(
+            leader=True, relations=[core_gnb_relation], model=testing.Model(name="my-model")
+        )
+
+        with pytest.raises(testing.ActionFailed) as e:
+            self.ctx.run(self.ctx.on.action("get-gnb-config"), state_in)
+
+        assert e.value.message == (
+            "TAC and PLMNs of gNB my-model-gnb-sdcore-gnb-integrator are not available"
+        )
+
+    def test_given_fleet_mode_and_no_gnb_name_when_get_gnb_config_then_action_fails(self):
+        state_in = testing.State(leader=True, config={"gnb-names": "gnb001,gnb002"})
+
+        with pytest.raises(testing.ActionFailed) as e:
+            self.ctx.run(self.ctx.on.action("get-gnb-config"), state_in)
+
+        assert e.value.message == (
+            "The gnb-name parameter is required when gnb-names is configured"
+        )
+
+    def test_given_fleet_mode_when_get_gnb_config_then_gnb_config_of_gnb_is_returned(self):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data={
+                "gnb-configs": json.dumps(
+                    {
+                        "gnb001": {"tac": 1, "plmns": VALID_PLMNS},
+                        "gnb002": {"tac": 2, "plmns": VALID_PLMNS[:1]},
+                    }
+                )
+            },
+        )
+        state_in = testing.State(
+            leader=True, relations=[core_gnb_relation], config={"gnb-names": "gnb001,gnb002"}
+        )
+
+        self.ctx.run(
+            self.ctx.on.action("get-gnb-config", params={"gnb-name": "gnb002"}), state_in
+        )
+
+        assert self.ctx.action_results is not None
+        assert self.ctx.action_results["gnb-name"] == "gnb002"
+        assert self.ctx.action_results["tac"] == 2
+        assert json.loads(self.ctx.action_results["plmns"]) == VALID_PLMNS[:1]
+        assert self.ctx.action_results["plmn-count"] == 1
@@ -0,0 +1,610 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import concurrent.futures
+import hashlib
+import json
+from unittest.mock import MagicMock, patch
+
+import ops
+import pytest
+from charms.sdcore_nms_k8s.v0 import fiveg_core_gnb
+from charms.sdcore_nms_k8s.v0.fiveg_core_gnb import (
+    _VALIDATION_CACHE_VERSION,
+    FivegCoreGnbProvides,
+    GnbConfigPublishResult,
+    PLMNConfig,
+    RequirerValidationResult,
+)
+from ops import testing
+
+CORE_GNB_RELATION_NAME = "fiveg_core_gnb"
+METADATA = {
+    "name": "fiveg-core-gnb-provider",
+    "provides": {CORE_GNB_RELATION_NAME: {"interface": "fiveg_core_gnb"}},
+}
+
+
+class DummyFivegCoreGnbProviderCharm(ops.CharmBase):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.fiveg_core_gnb_provider = FivegCoreGnbProvides(self, CORE_GNB_RELATION_NAME)
+
+
+class TestFivegCoreGnbProvides:
+    @pytest.fixture(autouse=True)
+    def context(self):
+        self.ctx = testing.Context(
+            charm_type=DummyFivegCoreGnbProviderCharm,
+            meta=METADATA,
+        )
+
+    def test_given_many_relations_when_publish_gnb_config_bulk_then_config_is_published_to_every_relation(  # noqa: E501
+        self,
+    ):
+        relations = [
+            testing.Relation(endpoint=CORE_GNB_RELATION_NAME, interface="fiveg_core_gnb")
+            for _ in range(3)
+        ]
+        plmns = [PLMNConfig(mcc="001", mnc="01", sst=1, sd=1)]
+        state_in = testing.State(leader=True, relations=relations)
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            report = manager.charm.fiveg_core_gnb_provider.publish_gnb_config_bulk(
+                {relation.id: (1, plmns) for relation in relations}
+            )
+            state_out = manager.run()
+
+        assert report == {relation.id: GnbConfigPublishResult.UPDATED for relation in relations}
+        for relation in relations:
+            assert state_out.get_relation(relation.id).local_app_data == {
+                "tac": "1",
+                "plmns": json.dumps([plmn.asdict() for plmn in plmns]),
+            }
+
+    def test_given_relation_already_has_config_when_publish_gnb_config_bulk_then_relation_is_unchanged(  # noqa: E501
+        self,
+    ):
+        plmns = [PLMNConfig(mcc="001", mnc="01", sst=1, sd=1)]
+        up_to_date_relation = testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            local_app_data={"tac": "1", "plmns": json.dumps([plmn.asdict() for plmn in plmns])},
+        )
+        outdated_relation = testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            local_app_data={"tac": "2", "plmns": json.dumps([plmn.asdict() for plmn in plmns])},
+        )
+        state_in = testing.State(leader=True, relations=[up_to_date_relation, outdated_relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            report = manager.charm.fiveg_core_gnb_provider.publish_gnb_config_bulk(
+                {up_to_date_relation.id: (1, plmns), outdated_relation.id: (1, plmns)}
+            )
+
+        assert report == {
+            up_to_date_relation.id: GnbConfigPublishResult.UNCHANGED,
+            outdated_relation.id: GnbConfigPublishResult.UPDATED,
+        }
+
+    def test_given_invalid_config_and_unknown_relation_when_publish_gnb_config_bulk_then_they_are_reported(  # noqa: E501
+        self,
+    ):
+        relation = testing.Relation(endpoint=CORE_GNB_RELATION_NAME, interface="fiveg_core_gnb")
+        plmns = [PLMNConfig(mcc="001", mnc="01", sst=1, sd=1)]
+        state_in = testing.State(leader=True, relations=[relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            report = manager.charm.fiveg_core_gnb_provider.publish_gnb_config_bulk(
+                {relation.id: (0, plmns), relation.id + 1: (1, plmns)}
+            )
+            state_out = manager.run()
+
+        assert report == {
+            relation.id: GnbConfigPublishResult.INVALID,
+            relation.id + 1: GnbConfigPublishResult.NO_RELATION,
+        }
+        assert state_out.get_relation(relation.id).local_app_data == {}
+
+    def test_given_plmns_which_are_not_plmn_config_when_publish_gnb_config_bulk_then_they_are_reported_invalid(  # noqa: E501
+        self, caplog
+    ):
+        relation = testing.Relation(endpoint=CORE_GNB_RELATION_NAME, interface="fiveg_core_gnb")
+        plmns = [{"mcc": "001", "mnc": "01", "sst": sst} for sst in range(100)]
+        state_in = testing.State(leader=True, relations=[relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            report = manager.charm.fiveg_core_gnb_provider.publish_gnb_config_bulk(
+                {relation.id: (1, plmns)}
+            )
+            state_out = manager.run()
+
+        assert report == {relation.id: GnbConfigPublishResult.INVALID}
+        assert state_out.get_relation(relation.id).local_app_data == {}
+        assert "mcc" not in caplog.text
+
+    def test_given_equal_plmn_lists_when_publish_gnb_config_bulk_then_config_is_validated_once(
+        self,
+    ):
+        relations = [
+            testing.Relation(endpoint=CORE_GNB_RELATION_NAME, interface="fiveg_core_gnb")
+            for _ in range(3)
+        ]
+        state_in = testing.State(leader=True, relations=relations)
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            with patch.object(
+                fiveg_core_gnb,
+                "_provider_data_error",
+                wraps=fiveg_core_gnb._provider_data_error,
+            ) as mock_provider_data_error:
+                report = manager.charm.fiveg_core_gnb_provider.publish_gnb_config_bulk(
+                    {
+                        relation.id: (1, [PLMNConfig(mcc="001", mnc="01", sst=1)])
+                        for relation in relations
+                    }
+                )
+
+        assert set(report.values()) == {GnbConfigPublishResult.UPDATED}
+        mock_provider_data_error.assert_called_once()
+
+    def test_given_same_plmn_list_when_publish_gnb_config_bulk_then_plmns_are_serialized_once(
+        self,
+    ):
+        relations = [
+            testing.Relation(endpoint=CORE_GNB_RELATION_NAME, interface="fiveg_core_gnb")
+            for _ in range(3)
+        ]
+        state_in = testing.State(leader=True, relations=relations)
+        plmns = [PLMNConfig(mcc="001", mnc="01", sst=1)]
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            with patch.object(
+                fiveg_core_gnb, "_plmns_asdict", wraps=fiveg_core_gnb._plmns_asdict
+            ) as mock_plmns_asdict:
+                report = manager.charm.fiveg_core_gnb_provider.publish_gnb_config_bulk(
+                    {relation.id: (1, plmns) for relation in relations}
+                )
+
+        assert set(report.values()) == {GnbConfigPublishResult.UPDATED}
+        mock_plmns_asdict.assert_called_once_with(plmns)
+
+    def test_given_invalid_config_when_publish_gnb_config_bulk_then_plmns_are_not_logged(
+        self, caplog
+    ):
+        relation = testing.Relation(endpoint=CORE_GNB_RELATION_NAME, interface="fiveg_core_gnb")
+        plmns = [PLMNConfig(mcc="001", mnc="01", sst=sst) for sst in range(100)]
+        state_in = testing.State(leader=True, relations=[relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            manager.charm.fiveg_core_gnb_provider.publish_gnb_config_bulk(
+                {relation.id: (0, plmns)}
+            )
+
+        (message,) = [
+            record.getMessage()
+            for record in caplog.records
+            if record.getMessage().startswith("Invalid gNB config for relation")
+        ]
+        assert "100 PLMNs" in message
+        assert "mcc" not in message
+
+    def test_given_same_invalid_config_in_several_hooks_when_publish_gnb_config_bulk_then_it_is_logged_at_error_once(  # noqa: E501
+        self, caplog
+    ):
+        relation = testing.Relation(endpoint=CORE_GNB_RELATION_NAME, interface="fiveg_core_gnb")
+        plmns = [PLMNConfig(mcc="001", mnc="01", sst=1)]
+        state = testing.State(leader=True, relations=[relation])
+
+        for _ in range(3):
+            with self.ctx(self.ctx.on.update_status(), state) as manager:
+                manager.charm.fiveg_core_gnb_provider.publish_gnb_config_bulk(
+                    {relation.id: (0, plmns)}
+                )
+                state = manager.run()
+
+        schema_errors = [
+            record
+            for record in caplog.records
+            if record.getMessage().startswith("Invalid data ")
+        ]
+        assert [record.levelname for record in schema_errors] == ["ERROR", "DEBUG", "DEBUG"]
+        assert schema_errors[-1].getMessage().endswith("seen 3 times")
+        stored_state = state.get_stored_state(
+            "_stored",
+            owner_path=f"DummyFivegCoreGnbProviderCharm/FivegCoreGnbProvides[{CORE_GNB_RELATION_NAME}]",  # noqa: E501
+        )
+        assert list(stored_state.content["invalid_data_log"].values()) == [3]
+
+    def test_given_unit_is_not_leader_when_publish_gnb_config_bulk_then_runtime_error_is_raised(
+        self,
+    ):
+        relation = testing.Relation(endpoint=CORE_GNB_RELATION_NAME, interface="fiveg_core_gnb")
+        state_in = testing.State(leader=False, relations=[relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            with pytest.raises(RuntimeError):
+                manager.charm.fiveg_core_gnb_provider.publish_gnb_config_bulk(
+                    {relation.id: (1, [PLMNConfig(mcc="001", mnc="01", sst=1)])}
+                )
+
+    def test_given_many_relations_when_gnb_registry_then_names_are_indexed_both_ways(self):
+        relation_1 = testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            remote_app_data={"gnb-name": "gnb001"},
+        )
+        relation_2 = testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            remote_app_data={"gnb-name": "gnb002"},
+        )
+        relation_without_name = testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME, interface="fiveg_core_gnb"
+        )
+        state_in = testing.State(
+            leader=True, relations=[relation_1, relation_2, relation_without_name]
+        )
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            registry = manager.charm.fiveg_core_gnb_provider.gnb_registry()
+
+        assert registry.gnb_names == {relation_1.id: "gnb001", relation_2.id: "gnb002"}
+        assert registry.get_relation_id("gnb002") == relation_2.id
+        assert registry.get_gnb_name(relation_without_name.id) is None
+        assert registry.duplicates == {}
+
+    def test_given_name_published_over_several_relations_when_gnb_registry_then_duplicate_is_reported(  # noqa: E501
+        self,
+    ):
+        relations = [
+            testing.Relation(
+                endpoint=CORE_GNB_RELATION_NAME,
+                interface="fiveg_core_gnb",
+                remote_app_data={"gnb-name": "gnb001"},
+            )
+            for _ in range(2)
+        ]
+        state_in = testing.State(leader=True, relations=relations)
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            registry = manager.charm.fiveg_core_gnb_provider.gnb_registry()
+
+        assert registry.duplicates == {"gnb001": tuple(relation.id for relation in relations)}
+        assert registry.get_relation_id("gnb001") is None
+
+    def test_given_names_stored_when_relation_changed_then_only_changed_relation_is_read_again(
+        self,
+    ):
+        unchanged_relation = testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            remote_app_data={"gnb-name": "gnb001"},
+        )
+        changed_relation = testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            remote_app_data={"gnb-name": "new-gnb002"},
+        )
+        stored_state = testing.StoredState(
+            owner_path=f"DummyFivegCoreGnbProviderCharm/FivegCoreGnbProvides[{CORE_GNB_RELATION_NAME}]",  # noqa: E501
+            content={
+                "gnb_names": {
+                    str(unchanged_relation.id): ["stored-gnb001"],
+                    str(changed_relation.id): ["gnb002"],
+                    "999": ["gnb-of-removed-relation"],
+                },
+                "gnb_names_version": _VALIDATION_CACHE_VERSION,
+            },
+        )
+        state_in = testing.State(
+            leader=True,
+            relations=[unchanged_relation, changed_relation],
+            stored_states=[stored_state],
+        )
+
+        with self.ctx(self.ctx.on.relation_changed(changed_relation), state_in) as manager:
+            manager.run()
+            registry = manager.charm.fiveg_core_gnb_provider.gnb_registry()
+
+        assert registry.gnb_names == {
+            unchanged_relation.id: "stored-gnb001",
+            changed_relation.id: "new-gnb002",
+        }
+
+    @pytest.mark.parametrize(
+        "stored_names,stored_version",
+        [
+            pytest.param("gnb001", None, id="unversioned"),
+            pytest.param(["gnb001"], "0.0", id="other_version"),
+        ],
+    )
+    def test_given_names_stored_by_other_library_version_when_gnb_registry_then_every_relation_is_read_again(  # noqa: E501
+        self, stored_names, stored_version
+    ):
+        relation = testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            remote_app_data={
+                "gnb-name": "gnb001",
+                "gnb-names": json.dumps(["gnb001", "gnb002"]),
+            },
+        )
+        stored_state = testing.StoredState(
+            owner_path=f"DummyFivegCoreGnbProviderCharm/FivegCoreGnbProvides[{CORE_GNB_RELATION_NAME}]",  # noqa: E501
+            content={
+                "gnb_names": {str(relation.id): stored_names},
+                **({"gnb_names_version": stored_version} if stored_version else {}),
+            },
+        )
+        state_in = testing.State(leader=True, relations=[relation], stored_states=[stored_state])
+
+        with self.ctx(self.ctx.on.upgrade_charm(), state_in) as manager:
+            registry = manager.charm.fiveg_core_gnb_provider.gnb_registry()
+            state_out = manager.run()
+
+        assert registry.get_gnb_names(relation.id) == ("gnb001", "gnb002")
+        assert registry.get_relation_id("gnb002") == relation.id
+        assert state_out.get_stored_state(
+            "_stored",
+            owner_path=f"DummyFivegCoreGnbProviderCharm/FivegCoreGnbProvides[{CORE_GNB_RELATION_NAME}]",  # noqa: E501
+        ).content["gnb_names_version"] == _VALIDATION_CACHE_VERSION
+
+    def test_given_invalid_requirer_data_when_get_gnb_name_then_none_is_returned(self):
+        relation = testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            remote_app_data={"gnb_name": "gnb001"},
+        )
+        state_in = testing.State(leader=True, relations=[relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            assert manager.charm.fiveg_core_gnb_provider.get_gnb_name(relation.id) is None
+
+    def test_given_relation_serving_a_fleet_when_gnb_registry_then_every_name_is_indexed(self):
+        fleet_relation = testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            remote_app_data={
+                "gnb-name": "gnb001",
+                "gnb-names": json.dumps(["gnb001", "gnb002", "gnb003"]),
+            },
+        )
+        single_relation = testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            remote_app_data={"gnb-name": "gnb004"},
+        )
+        state_in = testing.State(leader=True, relations=[fleet_relation, single_relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            registry = manager.charm.fiveg_core_gnb_provider.gnb_registry()
+
+        assert registry.gnb_names == {fleet_relation.id: "gnb001", single_relation.id: "gnb004"}
+        assert registry.get_gnb_names(fleet_relation.id) == ("gnb001", "gnb002", "gnb003")
+        assert registry.get_gnb_names(single_relation.id) == ("gnb004",)
+        assert registry.get_relation_id("gnb003") == fleet_relation.id
+        assert registry.fleet_gnb_names == {fleet_relation.id: ("gnb001", "gnb002", "gnb003")}
+
+    def test_given_fleet_configs_when_publish_fleet_gnb_config_then_configs_are_published_once(
+        self,
+    ):
+        relation = testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            remote_app_data={"gnb-name": "gnb001", "gnb-names": json.dumps(["gnb001", "gnb002"])},
+        )
+        plmns = [PLMNConfig(mcc="001", mnc="01", sst=1, sd=1)]
+        gnb_configs = {"gnb001": (1, plmns), "gnb002": (2, plmns)}
+        state_in = testing.State(leader=True, relations=[relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            provider = manager.charm.fiveg_core_gnb_provider
+            first_result = provider.publish_fleet_gnb_config(relation.id, gnb_configs)
+            second_result = provider.publish_fleet_gnb_config(relation.id, gnb_configs)
+            state_out = manager.run()
+
+        assert first_result == GnbConfigPublishResult.UPDATED
+        assert second_result == GnbConfigPublishResult.UNCHANGED
+        plmns_data = [plmn.asdict() for plmn in plmns]
+        assert state_out.get_relation(relation.id).local_app_data == {
+            "tac": "1",
+            "plmns": json.dumps(plmns_data),
+            "gnb-configs": json.dumps(
+                {
+                    "gnb001": {"tac": 1, "plmns": plmns_data},
+                    "gnb002": {"tac": 2, "plmns": plmns_data},
+                },
+                sort_keys=True,
+            ),
+        }
+
+    def test_given_invalid_fleet_config_when_publish_fleet_gnb_config_then_nothing_is_published(
+        self,
+    ):
+        relation = testing.Relation(endpoint=CORE_GNB_RELATION_NAME, interface="fiveg_core_gnb")
+        plmns = [PLMNConfig(mcc="001", mnc="01", sst=1)]
+        state_in = testing.State(leader=True, relations=[relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            result = manager.charm.fiveg_core_gnb_provider.publish_fleet_gnb_config(
+                relation.id, {"gnb001": (1, plmns), "gnb002": (0, plmns)}
+            )
+            state_out = manager.run()
+
+        assert result == GnbConfigPublishResult.INVALID
+        assert state_out.get_relation(relation.id).local_app_data == {}
+
+    def test_given_sharded_plmns_when_publish_fleet_gnb_config_then_shards_are_removed(self):
+        relation = testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            remote_app_data={"gnb-name": "gnb001", "gnb-names": json.dumps(["gnb001", "gnb002"])},
+        )
+        sharded_plmns = [PLMNConfig(mcc="001", mnc="01", sst=sst) for sst in range(4)]
+        plmns = [PLMNConfig(mcc="001", mnc="01", sst=1, sd=1)]
+        state_in = testing.State(leader=True, relations=[relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            provider = manager.charm.fiveg_core_gnb_provider
+            provider.publish_gnb_config_information(
+                relation_id=relation.id, tac=1, plmns=sharded_plmns, shard_size=2
+            )
+            result = provider.publish_fleet_gnb_config(
+                relation.id, {"gnb001": (5, plmns), "gnb002": (6, plmns)}
+            )
+            state_out = manager.run()
+
+        assert result == GnbConfigPublishResult.UPDATED
+        local_app_data = state_out.get_relation(relation.id).local_app_data
+        assert set(local_app_data) == {"tac", "plmns", "gnb-configs"}
+        assert local_app_data["tac"] == "5"
+        assert json.loads(local_app_data["plmns"]) == [plmn.asdict() for plmn in plmns]
+
+    def test_given_sharded_databag_when_validated_against_provider_schema_then_it_is_valid(self):
+        shard = [{"mcc": "001", "mnc": "01", "sst": 1, "sd": 1}]
+
+        fiveg_core_gnb.ProviderSchema.model_validate(
+            {
+                "app_data": {
+                    "tac": 1,
+                    "plmns.0": shard,
+                    "plmns-manifest": [hashlib.sha256(json.dumps(shard).encode()).hexdigest()],
+                }
+            }
+        )
+
+    def test_given_databag_without_plmns_when_validated_against_provider_schema_then_it_is_invalid(  # noqa: E501
+        self,
+    ):
+        with pytest.raises(ValueError):
+            fiveg_core_gnb.ProviderSchema.model_validate({"app_data": {"tac": 1}})
+
+    def test_given_shard_size_when_publish_gnb_config_information_then_plmns_are_sharded(self):
+        relation = testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            local_app_data={"tac": "1", "plmns": "[]"},
+        )
+        plmns = [PLMNConfig(mcc="001", mnc="01", sst=sst) for sst in range(5)]
+        state_in = testing.State(leader=True, relations=[relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            manager.charm.fiveg_core_gnb_provider.publish_gnb_config_information(
+                relation_id=relation.id, tac=1, plmns=plmns, shard_size=2
+            )
+            state_out = manager.run()
+
+        shards = [
+            json.dumps([plmn.asdict() for plmn in plmns[start:start + 2]])
+            for start in range(0, 5, 2)
+        ]
+        assert state_out.get_relation(relation.id).local_app_data == {
+            "tac": "1",
+            "plmns.0": shards[0],
+            "plmns.1": shards[1],
+            "plmns.2": shards[2],
+            "plmns-manifest": json.dumps(
+                [hashlib.sha256(shard.encode()).hexdigest() for shard in shards]
+            ),
+        }
+
+    def test_given_sharded_plmns_when_one_plmn_changes_then_only_its_shard_is_rewritten(self):
+        plmns = [PLMNConfig(mcc="001", mnc="01", sst=sst) for sst in range(6)]
+        relation = testing.Relation(endpoint=CORE_GNB_RELATION_NAME, interface="fiveg_core_gnb")
+        state_in = testing.State(leader=True, relations=[relation])
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            manager.charm.fiveg_core_gnb_provider.publish_gnb_config_information(
+                relation_id=relation.id, tac=1, plmns=plmns, shard_size=2
+            )
+            state_in = manager.run()
+
+        changed_plmns = [*plmns[:5], PLMNConfig(mcc="001", mnc="01", sst=42)]
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            backend = manager.charm.model._backend
+            with patch.object(
+                backend, "relation_set", wraps=backend.relation_set
+            ) as mock_relation_set:
+                manager.charm.fiveg_core_gnb_provider.publish_gnb_config_information(
+                    relation_id=relation.id, tac=1, plmns=changed_plmns, shard_size=2
+                )
+
+        written_keys = {
+            key for call in mock_relation_set.call_args_list for key in call.kwargs["data"]
+        }
+        assert written_keys == {"plmns.2", "plmns-manifest"}
+
+    def test_given_sharded_plmns_when_publish_gnb_config_information_without_shards_then_shards_are_removed(  # noqa: E501
+        self,
+    ):
+        plmns = [PLMNConfig(mcc="001", mnc="01", sst=1)]
+        relation = testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            local_app_data={"tac": "1", "plmns.0": "[]", "plmns.1": "[]", "plmns-manifest": "[]"},
+        )
+        state_in = testing.State(leader=True, relations=[relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            manager.charm.fiveg_core_gnb_provider.publish_gnb_config_information(
+                relation_id=relation.id, tac=1, plmns=plmns
+            )
+            state_out = manager.run()
+
+        assert state_out.get_relation(relation.id).local_app_data == {
+            "tac": "1",
+            "plmns": json.dumps([plmn.asdict() for plmn in plmns]),
+        }
+
+    def test_given_many_requirers_when_validate_all_requirers_on_executor_then_results_match_serial_validation(  # noqa: E501
+        self,
+    ):
+        relations = [
+            testing.Relation(
+                endpoint=CORE_GNB_RELATION_NAME,
+                interface="fiveg_core_gnb",
+                remote_app_data={"gnb-name": f"gnb{index:03d}"},
+            )
+            for index in range(5)
+        ]
+        invalid_relation = testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            remote_app_data={"gnb-names": "not json"},
+        )
+        state_in = testing.State(leader=True, relations=[*relations, invalid_relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            provider = manager.charm.fiveg_core_gnb_provider
+            serial_results = provider.validate_all_requirers()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+                results = provider.validate_all_requirers(executor=executor, batch_size=2)
+            registry = provider.gnb_registry()
+
+        assert results == serial_results
+        assert list(results) == sorted(results)
+        for index, relation in enumerate(relations):
+            assert results[relation.id] == RequirerValidationResult(gnb_names=(f"gnb{index:03d}",))
+        assert results[invalid_relation.id].gnb_name is None
+        assert results[invalid_relation.id].error
+        assert registry.gnb_names == {
+            relation.id: f"gnb{index:03d}" for index, relation in enumerate(relations)
+        }
+
+    def test_given_single_batch_when_validate_all_requirers_then_executor_is_not_used(self):
+        relation = testing.Relation(
+            endpoint=CORE_GNB_RELATION_NAME,
+            interface="fiveg_core_gnb",
+            remote_app_data={"gnb-name": "gnb001", "gnb-names": json.dumps(["gnb001", "gnb002"])},
+        )
+        state_in = testing.State(leader=True, relations=[relation])
+        executor = MagicMock(spec=concurrent.futures.Executor)
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            results = manager.charm.fiveg_core_gnb_provider.validate_all_requirers(
+                executor=executor
+            )
+
+        executor.map.assert_not_called()
+        assert results == {relation.id: RequirerValidationResult(gnb_names=("gnb001", "gnb002"))}
@@ -0,0 +1,1041 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import dataclasses
+import hashlib
+import json
+import pickle
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+from charms.sdcore_nms_k8s.v0 import fiveg_core_gnb
+from charms.sdcore_nms_k8s.v0.fiveg_core_gnb import (
+    _VALIDATION_CACHE_VERSION,
+    PLMN,
+    FivegCoreGnbRequires,
+    GnbConfigChangedEvent,
+    GnbConfigSnapshot,
+    PLMNAddedEvent,
+    PLMNDecodeError,
+    PLMNRemovedEvent,
+    PLMNTable,
+    TACChangedEvent,
+    ValidationFailureReason,
+    _raw_provider_data_digest,
+    iter_plmns,
+    unpack_plmns,
+    validate_plmns,
+)
+from ops import testing
+
+from charm import SdcoreGnbIntegratorCharm
+
+VALID_REMOTE_APP_DATA = {
+    "tac": "1",
+    "plmns": json.dumps([{"mcc": "001", "mnc": "01", "sst": 1, "sd": 1056816}]),
+}
+
+
+def sharded_remote_app_data(shards: list) -> dict:
+    """Return provider data with the given PLMN shards, as published by the provider."""
+    raw_shards = [json.dumps(shard) for shard in shards]
+    return {
+        "tac": "1",
+        **{f"plmns.{index}": raw_shard for index, raw_shard in enumerate(raw_shards)},
+        "plmns-manifest": json.dumps(
+            [hashlib.sha256(raw_shard.encode()).hexdigest() for raw_shard in raw_shards]
+        ),
+    }
+
+
+class TestFivegCoreGnbRequires:
+    @pytest.fixture(autouse=True)
+    def context(self):
+        self.ctx = testing.Context(
+            charm_type=SdcoreGnbIntegratorCharm,
+        )
+
+    def test_given_valid_remote_data_when_snapshot_then_tac_and_plmns_are_returned(self):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=VALID_REMOTE_APP_DATA,
+        )
+        state_in = testing.State(leader=True, relations=[core_gnb_relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            snapshot = manager.charm._core_gnb_requirer.snapshot()
+
+        assert snapshot is not None
+        assert snapshot.tac == 1
+        assert snapshot.plmns == (PLMN(mcc="001", mnc="01", sst=1, sd=1056816),)
+
+    def test_given_valid_remote_data_when_plmns_then_plmn_configs_are_returned(self):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=VALID_REMOTE_APP_DATA,
+        )
+        state_in = testing.State(leader=True, relations=[core_gnb_relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            plmns = manager.charm._core_gnb_requirer.plmns
+
+        assert plmns == [fiveg_core_gnb.PLMNConfig(mcc="001", mnc="01", sst=1, sd=1056816)]
+        assert all(isinstance(plmn, fiveg_core_gnb.PLMNConfig) for plmn in plmns)
+
+    def test_given_remote_data_with_reserved_sd_when_snapshot_then_plmn_has_no_sd(self):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data={
+                "tac": "1",
+                "plmns": json.dumps([{"mcc": "001", "mnc": "01", "sst": 1, "sd": 0xFFFFFF}]),
+            },
+        )
+        state_in = testing.State(leader=True, relations=[core_gnb_relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            snapshot = manager.charm._core_gnb_requirer.snapshot()
+
+        assert snapshot is not None
+        assert [plmn.sd for plmn in snapshot.plmns] == [None]
+
+    def test_given_valid_remote_data_when_tac_and_plmns_read_multiple_times_then_data_is_parsed_once(  # noqa: E501
+        self,
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=VALID_REMOTE_APP_DATA,
+        )
+        state_in = testing.State(leader=True, relations=[core_gnb_relation])
+
+        with patch.object(
+            FivegCoreGnbRequires,
+            "_get_remote_app_relation_data",
+            autospec=True,
+            side_effect=FivegCoreGnbRequires._get_remote_app_relation_data,
+        ) as mock_get_remote_app_relation_data:
+            with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+                requirer = manager.charm._core_gnb_requirer
+                _ = requirer.tac, requirer.plmns, requirer.plmns
+
+        mock_get_remote_app_relation_data.assert_called_once()
+
+    def test_given_snapshot_memoized_when_relation_changed_then_snapshot_is_invalidated(self):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=VALID_REMOTE_APP_DATA,
+        )
+        state_in = testing.State(leader=True, relations=[core_gnb_relation])
+
+        with self.ctx(self.ctx.on.relation_changed(core_gnb_relation), state_in) as manager:
+            requirer = manager.charm._core_gnb_requirer
+            requirer._snapshot = None
+
+            manager.run()
+
+            assert requirer.tac == 1
+
+    @pytest.mark.parametrize(
+        "remote_app_data",
+        [
+            pytest.param({}, id="empty_databag"),
+            pytest.param({"tac": "1", "plmns": "not json"}, id="invalid_json"),
+            pytest.param({"tac": "0", "plmns": VALID_REMOTE_APP_DATA["plmns"]}, id="invalid_tac"),
+            pytest.param({"tac": "1", "plmns": "[]"}, id="empty_plmns"),
+            pytest.param(
+                {"tac": "1", "plmns": json.dumps([{"mcc": "001", "mnc": "01", "sst": "1"}])},
+                id="non_strict_sst",
+            ),
+            pytest.param(
+                {"tac": "1", "plmns": json.dumps([{"mcc": "01", "mnc": "01", "sst": 1}])},
+                id="invalid_mcc",
+            ),
+        ],
+    )
+    def test_given_invalid_remote_data_when_snapshot_then_none_is_returned(
+        self, remote_app_data
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=remote_app_data,
+        )
+        state_in = testing.State(leader=True, relations=[core_gnb_relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            requirer = manager.charm._core_gnb_requirer
+
+            assert requirer.snapshot() is None
+            assert requirer.tac is None
+            assert requirer.plmns is None
+
+    def test_given_new_remote_data_when_relation_changed_then_gnb_config_changed_is_emitted(self):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=VALID_REMOTE_APP_DATA,
+        )
+        state_in = testing.State(leader=True, relations=[core_gnb_relation])
+
+        with self.ctx(self.ctx.on.relation_changed(core_gnb_relation), state_in) as manager:
+            expected_digest = manager.charm._core_gnb_requirer.snapshot().digest
+            state_out = manager.run()
+
+        gnb_config_changed_events = [
+            event for event in self.ctx.emitted_events if isinstance(event, GnbConfigChangedEvent)
+        ]
+        assert len(gnb_config_changed_events) == 1
+        assert gnb_config_changed_events[0].digest == expected_digest
+        stored_state = state_out.get_stored_state(
+            "_stored", owner_path="SdcoreGnbIntegratorCharm/FivegCoreGnbRequires[fiveg_core_gnb]"
+        )
+        assert stored_state.content["gnb_config_digest"] == expected_digest
+
+    def test_given_remote_data_rewritten_with_reordered_plmns_when_relation_changed_then_gnb_config_changed_is_not_emitted(  # noqa: E501
+        self,
+    ):
+        plmns = [
+            {"mcc": "001", "mnc": "01", "sst": 1, "sd": 1056816},
+            {"mcc": "001", "mnc": "02", "sst": 2},
+        ]
+        seen_digest = GnbConfigSnapshot(
+            tac=1, plmns=tuple(PLMN(**plmn) for plmn in plmns)
+        ).digest
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data={"tac": "1", "plmns": json.dumps(list(reversed(plmns)))},
+        )
+        state_in = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            stored_states=[
+                testing.StoredState(
+                    owner_path="SdcoreGnbIntegratorCharm/FivegCoreGnbRequires[fiveg_core_gnb]",
+                    content={"gnb_config_digest": seen_digest},
+                )
+            ],
+        )
+
+        self.ctx.run(self.ctx.on.relation_changed(core_gnb_relation), state_in)
+
+        assert not [
+            event for event in self.ctx.emitted_events if isinstance(event, GnbConfigChangedEvent)
+        ]
+
+    def test_given_gnb_config_seen_when_relation_broken_then_gnb_config_changed_is_emitted_with_empty_digest(  # noqa: E501
+        self,
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=VALID_REMOTE_APP_DATA,
+        )
+        state_in = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            stored_states=[
+                testing.StoredState(
+                    owner_path="SdcoreGnbIntegratorCharm/FivegCoreGnbRequires[fiveg_core_gnb]",
+                    content={"gnb_config_digest": "some-digest"},
+                )
+            ],
+        )
+
+        self.ctx.run(self.ctx.on.relation_broken(core_gnb_relation), state_in)
+
+        gnb_config_changed_events = [
+            event for event in self.ctx.emitted_events if isinstance(event, GnbConfigChangedEvent)
+        ]
+        assert len(gnb_config_changed_events) == 1
+        assert gnb_config_changed_events[0].digest == ""
+
+    def test_given_plmns_and_tac_seen_when_relation_changed_then_only_deltas_are_emitted(self):
+        plmn_a = {"mcc": "001", "mnc": "01", "sst": 1, "sd": 1}
+        plmn_b = {"mcc": "001", "mnc": "01", "sst": 1, "sd": None}
+        plmn_c = {"mcc": "208", "mnc": "93", "sst": 2, "sd": 2}
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data={"tac": "2", "plmns": json.dumps([plmn_b, plmn_c])},
+        )
+        state_in = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            stored_states=[
+                testing.StoredState(
+                    owner_path="SdcoreGnbIntegratorCharm/FivegCoreGnbRequires[fiveg_core_gnb]",
+                    content={
+                        "gnb_config_digest": "some-digest",
+                        "tac": 1,
+                        "validation_cache": {
+                            "version": _VALIDATION_CACHE_VERSION,
+                            "raw_digest": "other-digest",
+                            "tac": 1,
+                            "plmns": json.dumps([plmn_a, plmn_b]),
+                            "digest": "some-digest",
+                        },
+                    },
+                )
+            ],
+        )
+
+        state_out = self.ctx.run(self.ctx.on.relation_changed(core_gnb_relation), state_in)
+
+        emitted_events = {
+            type(event): event
+            for event in self.ctx.emitted_events
+            if isinstance(event, (PLMNAddedEvent, PLMNRemovedEvent, TACChangedEvent))
+        }
+        assert emitted_events[PLMNAddedEvent].plmns == [plmn_c]
+        assert emitted_events[PLMNRemovedEvent].plmns == [plmn_a]
+        assert emitted_events[TACChangedEvent].previous_tac == 1
+        assert emitted_events[TACChangedEvent].tac == 2
+        stored_state = state_out.get_stored_state(
+            "_stored", owner_path="SdcoreGnbIntegratorCharm/FivegCoreGnbRequires[fiveg_core_gnb]"
+        )
+        assert stored_state.content["tac"] == 2
+        assert json.loads(stored_state.content["validation_cache"]["plmns"]) == [plmn_b, plmn_c]
+        assert "announced_plmns" not in stored_state.content["validation_cache"]
+
+    def test_given_plmns_validated_by_another_hook_when_relation_changed_then_deltas_are_emitted(  # noqa: E501
+        self,
+    ):
+        plmn_a = {"mcc": "001", "mnc": "01", "sst": 1, "sd": 1}
+        plmn_b = {"mcc": "208", "mnc": "93", "sst": 2, "sd": 2}
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data={"tac": "1", "plmns": json.dumps([plmn_b])},
+        )
+        announced_digest = GnbConfigSnapshot(tac=1, plmns=(PLMN(**plmn_a),)).digest
+        state = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            stored_states=[
+                testing.StoredState(
+                    owner_path="SdcoreGnbIntegratorCharm/FivegCoreGnbRequires[fiveg_core_gnb]",
+                    content={
+                        "gnb_config_digest": announced_digest,
+                        "tac": 1,
+                        "validation_cache": {
+                            "version": _VALIDATION_CACHE_VERSION,
+                            "raw_digest": "other-digest",
+                            "tac": 1,
+                            "plmns": json.dumps([plmn_a]),
+                            "digest": announced_digest,
+                        },
+                    },
+                )
+            ],
+        )
+
+        state = self.ctx.run(self.ctx.on.update_status(), state)
+        self.ctx.run(
+            self.ctx.on.relation_changed(state.get_relation(core_gnb_relation.id)), state
+        )
+
+        emitted_events = {
+            type(event): event
+            for event in self.ctx.emitted_events
+            if isinstance(event, (PLMNAddedEvent, PLMNRemovedEvent))
+        }
+        assert emitted_events[PLMNAddedEvent].plmns == [plmn_b]
+        assert emitted_events[PLMNRemovedEvent].plmns == [plmn_a]
+
+    def test_given_only_plmns_changed_when_relation_changed_then_tac_changed_is_not_emitted(self):
+        plmn_a = {"mcc": "001", "mnc": "01", "sst": 1, "sd": 1}
+        plmn_b = {"mcc": "001", "mnc": "01", "sst": 1, "sd": None}
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data={"tac": "1", "plmns": json.dumps([plmn_a, plmn_b])},
+        )
+        state_in = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            stored_states=[
+                testing.StoredState(
+                    owner_path="SdcoreGnbIntegratorCharm/FivegCoreGnbRequires[fiveg_core_gnb]",
+                    content={
+                        "gnb_config_digest": "some-digest",
+                        "tac": 1,
+                        "validation_cache": {
+                            "version": _VALIDATION_CACHE_VERSION,
+                            "raw_digest": "other-digest",
+                            "tac": 1,
+                            "plmns": json.dumps([plmn_a]),
+                            "digest": "some-digest",
+                        },
+                    },
+                )
+            ],
+        )
+
+        self.ctx.run(self.ctx.on.relation_changed(core_gnb_relation), state_in)
+
+        emitted_event_types = [type(event) for event in self.ctx.emitted_events]
+        assert PLMNAddedEvent in emitted_event_types
+        assert PLMNRemovedEvent not in emitted_event_types
+        assert TACChangedEvent not in emitted_event_types
+
+    def test_given_raw_data_already_validated_when_snapshot_then_cached_result_is_returned_without_validation(  # noqa: E501
+        self,
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=VALID_REMOTE_APP_DATA,
+        )
+        cached_plmn = {"mcc": "001", "mnc": "01", "sst": 1, "sd": 1056816}
+        state_in = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            stored_states=[
+                testing.StoredState(
+                    owner_path="SdcoreGnbIntegratorCharm/FivegCoreGnbRequires[fiveg_core_gnb]",
+                    content={
+                        "validation_cache": {
+                            "version": _VALIDATION_CACHE_VERSION,
+                            "raw_digest": _raw_provider_data_digest(VALID_REMOTE_APP_DATA),
+                            "max_plmns": None,
+                            "tac": 1,
+                            "plmns": json.dumps([cached_plmn]),
+                        }
+                    },
+                )
+            ],
+        )
+
+        with patch(
+            "charms.sdcore_nms_k8s.v0.fiveg_core_gnb._parse_provider_databag"
+        ) as mock_parse_provider_databag:
+            with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+                snapshot = manager.charm._core_gnb_requirer.snapshot()
+
+        mock_parse_provider_databag.assert_not_called()
+        assert snapshot is not None
+        assert snapshot.tac == 1
+        assert snapshot.plmns == (PLMN(**cached_plmn),)
+
+    @pytest.mark.parametrize(
+        "version,raw_digest",
+        [
+            pytest.param("0.0", _raw_provider_data_digest(VALID_REMOTE_APP_DATA), id="old_version"),  # noqa: E501
+            pytest.param(_VALIDATION_CACHE_VERSION, "other-digest", id="other_raw_data"),
+        ],
+    )
+    def test_given_cached_result_not_matching_when_snapshot_then_data_is_validated_and_cached(
+        self, version, raw_digest
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=VALID_REMOTE_APP_DATA,
+        )
+        state_in = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            stored_states=[
+                testing.StoredState(
+                    owner_path="SdcoreGnbIntegratorCharm/FivegCoreGnbRequires[fiveg_core_gnb]",
+                    content={
+                        "validation_cache": {
+                            "version": version,
+                            "raw_digest": raw_digest,
+                            "tac": 2,
+                            "plmns": "[]",
+                        }
+                    },
+                )
+            ],
+        )
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            assert manager.charm._core_gnb_requirer.tac == 1
+            state_out = manager.run()
+
+        stored_state = state_out.get_stored_state(
+            "_stored", owner_path="SdcoreGnbIntegratorCharm/FivegCoreGnbRequires[fiveg_core_gnb]"
+        )
+        assert stored_state.content["validation_cache"] == {
+            "version": _VALIDATION_CACHE_VERSION,
+            "raw_digest": _raw_provider_data_digest(VALID_REMOTE_APP_DATA),
+            "max_plmns": None,
+            "tac": 1,
+            "plmns": json.dumps([{"mcc": "001", "mnc": "01", "sst": 1, "sd": 1056816}]),
+            "digest": manager.charm._core_gnb_requirer.snapshot().digest,
+            "reason": None,
+        }
+
+    def test_given_same_invalid_remote_data_when_several_hooks_then_it_is_logged_once(
+        self, caplog
+    ):
+        remote_app_data = {
+            "tac": "1",
+            "plmns": json.dumps([{"mcc": "001", "mnc": "01", "sst": 1}] * 500 + [{"mcc": "1"}]),
+        }
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=remote_app_data,
+        )
+        state = testing.State(leader=True, relations=[core_gnb_relation])
+
+        for _ in range(3):
+            state = self.ctx.run(self.ctx.on.update_status(), state)
+
+        errors = [
+            record for record in caplog.records
+            if record.levelname == "ERROR" and record.name == fiveg_core_gnb.__name__
+        ]
+        assert len(errors) == 1
+        assert remote_app_data["plmns"] not in errors[0].getMessage()
+        stored_state = state.get_stored_state(
+            "_stored", owner_path="SdcoreGnbIntegratorCharm/FivegCoreGnbRequires[fiveg_core_gnb]"
+        )
+        (entry,) = stored_state.content["invalid_data_log"].values()
+        assert entry["reason"] == "schema"
+        assert entry["suppressed"] == 2
+
+    def test_given_invalid_remote_data_logged_long_ago_when_update_status_then_summary_is_logged(
+        self, caplog
+    ):
+        remote_app_data = {"tac": "1", "plmns": "[{"}
+        raw_digest = _raw_provider_data_digest(remote_app_data)
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=remote_app_data,
+        )
+        state_in = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            stored_states=[
+                testing.StoredState(
+                    owner_path="SdcoreGnbIntegratorCharm/FivegCoreGnbRequires[fiveg_core_gnb]",
+                    content={
+                        "validation_cache": {
+                            "version": _VALIDATION_CACHE_VERSION,
+                            "raw_digest": raw_digest,
+                            "max_plmns": None,
+                            "tac": None,
+                            "plmns": "[]",
+                            "reason": "json-decode",
+                        },
+                        "invalid_data_log": {
+                            raw_digest: {
+                                "reason": "json-decode",
+                                "logged_at": 0.0,
+                                "suppressed": 41,
+                            }
+                        },
+                    },
+                )
+            ],
+        )
+
+        state_out = self.ctx.run(self.ctx.on.update_status(), state_in)
+
+        warnings = [
+            record.getMessage() for record in caplog.records
+            if record.levelname == "WARNING" and record.name == fiveg_core_gnb.__name__
+        ]
+        assert warnings == [
+            f"Data in relation fiveg_core_gnb:{core_gnb_relation.id} (digest {raw_digest[:12]}, "
+            "json-decode) is still invalid, seen 42 more times"
+        ]
+        stored_state = state_out.get_stored_state(
+            "_stored", owner_path="SdcoreGnbIntegratorCharm/FivegCoreGnbRequires[fiveg_core_gnb]"
+        )
+        assert stored_state.content["invalid_data_log"][raw_digest]["suppressed"] == 0
+
+    def test_given_same_invalid_data_when_data_matches_provider_schema_then_it_is_logged_once(
+        self, caplog
+    ):
+        plmn = {"mcc": "001", "mnc": "01", "sst": 1}
+        plmns = [plmn] * 500 + [{**plmn, "mcc": "1"}]
+        data = {"tac": 1, "plmns": plmns}
+
+        assert not fiveg_core_gnb.data_matches_provider_schema(data)
+        assert not fiveg_core_gnb.data_matches_provider_schema(data)
+
+        errors = [record for record in caplog.records if record.levelname == "ERROR"]
+        assert len(errors) == 1
+        assert len(errors[0].getMessage()) < 512
+
+    def test_given_valid_remote_data_when_plmn_table_then_plmns_are_returned_as_columns(self):
+        plmns = [
+            {"mcc": "001", "mnc": "01", "sst": 1, "sd": 1056816},
+            {"mcc": "208", "mnc": "093", "sst": 2, "sd": None},
+        ]
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data={"tac": "1", "plmns": json.dumps(plmns)},
+        )
+        state_in = testing.State(leader=True, relations=[core_gnb_relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            plmn_table = manager.charm._core_gnb_requirer.plmn_table
+
+        assert isinstance(plmn_table, PLMNTable)
+        assert len(plmn_table) == 2
+        assert plmn_table.mcc == ("001", "208")
+        assert plmn_table.mnc == ("01", "093")
+        assert plmn_table.sst == (1, 2)
+        assert plmn_table.sd == (1056816, None)
+        assert list(plmn_table) == [PLMN(**plmn) for plmn in plmns]
+        assert plmn_table[1] == PLMN(**plmns[1])
+
+
+    def test_given_fleet_gnb_names_when_publish_fleet_gnb_information_then_names_are_published(
+        self,
+    ):
+        core_gnb_relation = testing.Relation(endpoint="fiveg_core_gnb", interface="fiveg_core_gnb")
+        state_in = testing.State(
+            leader=True, relations=[core_gnb_relation], config={"gnb-names": "gnb001,gnb002"}
+        )
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            manager.charm._core_gnb_requirer.publish_fleet_gnb_information(
+                gnb_names=["gnb001", "gnb002"]
+            )
+            state_out = manager.run()
+
+        assert state_out.get_relation(core_gnb_relation.id).local_app_data == {
+            "gnb-name": "gnb001",
+            "gnb-names": json.dumps(["gnb001", "gnb002"]),
+        }
+
+    @pytest.mark.parametrize(
+        "gnb_names",
+        [
+            pytest.param([], id="no_names"),
+            pytest.param(["gnb001", "gnb001"], id="duplicated_names"),
+        ],
+    )
+    def test_given_invalid_fleet_gnb_names_when_publish_fleet_gnb_information_then_value_error_is_raised(  # noqa: E501
+        self, gnb_names
+    ):
+        core_gnb_relation = testing.Relation(endpoint="fiveg_core_gnb", interface="fiveg_core_gnb")
+        state_in = testing.State(leader=True, relations=[core_gnb_relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            with pytest.raises(ValueError):
+                manager.charm._core_gnb_requirer.publish_fleet_gnb_information(
+                    gnb_names=gnb_names
+                )
+
+    def test_given_fleet_configs_when_gnb_configs_then_valid_configs_are_returned(self):
+        plmn = {"mcc": "001", "mnc": "01", "sst": 1, "sd": 1056816}
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data={
+                "gnb-configs": json.dumps(
+                    {
+                        "gnb001": {"tac": 1, "plmns": [plmn]},
+                        "gnb002": {"tac": 2, "plmns": [{**plmn, "sd": None}]},
+                        "invalid-tac": {"tac": 0, "plmns": [plmn]},
+                        "invalid-plmn": {"tac": 3, "plmns": [{**plmn, "mcc": "1"}]},
+                        "no-plmns": {"tac": 4, "plmns": []},
+                    }
+                )
+            },
+        )
+        state_in = testing.State(leader=True, relations=[core_gnb_relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            gnb_configs = manager.charm._core_gnb_requirer.gnb_configs()
+            state_out = manager.run()
+
+        assert gnb_configs == {
+            "gnb001": GnbConfigSnapshot(tac=1, plmns=(PLMN(**plmn),)),
+            "gnb002": GnbConfigSnapshot(tac=2, plmns=(PLMN(**{**plmn, "sd": None}),)),
+        }
+        stored_state = state_out.get_stored_state(
+            "_stored", owner_path="SdcoreGnbIntegratorCharm/FivegCoreGnbRequires[fiveg_core_gnb]"
+        )
+        assert stored_state.content["fleet_validation_cache"]["gnb_names"] == ["gnb001", "gnb002"]
+
+    def test_given_fleet_configs_already_validated_when_gnb_configs_then_they_are_not_validated_again(  # noqa: E501
+        self,
+    ):
+        plmn = {"mcc": "001", "mnc": "01", "sst": 1, "sd": 1056816}
+        raw_gnb_configs = json.dumps(
+            {"gnb001": {"tac": 1, "plmns": [plmn]}, "invalid": {"tac": 0, "plmns": [plmn]}}
+        )
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data={"gnb-configs": raw_gnb_configs},
+        )
+        state_in = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            stored_states=[
+                testing.StoredState(
+                    owner_path="SdcoreGnbIntegratorCharm/FivegCoreGnbRequires[fiveg_core_gnb]",
+                    content={
+                        "fleet_validation_cache": {
+                            "version": _VALIDATION_CACHE_VERSION,
+                            "raw_digest": hashlib.sha256(raw_gnb_configs.encode()).hexdigest(),
+                            "gnb_names": ["gnb001"],
+                        }
+                    },
+                )
+            ],
+        )
+
+        with patch(
+            "charms.sdcore_nms_k8s.v0.fiveg_core_gnb._parse_fleet_gnb_config"
+        ) as mock_parse_fleet_gnb_config:
+            with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+                gnb_configs = manager.charm._core_gnb_requirer.gnb_configs()
+
+        mock_parse_fleet_gnb_config.assert_not_called()
+        assert gnb_configs == {"gnb001": GnbConfigSnapshot(tac=1, plmns=(PLMN(**plmn),))}
+
+
+    def test_given_fleet_gnb_names_published_when_publish_gnb_information_then_fleet_names_are_removed(  # noqa: E501
+        self,
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            local_app_data={"gnb-name": "gnb001", "gnb-names": json.dumps(["gnb001", "gnb002"])},
+        )
+        state_in = testing.State(leader=True, relations=[core_gnb_relation])
+
+        state_out = self.ctx.run(self.ctx.on.update_status(), state_in)
+
+        assert state_out.get_relation(core_gnb_relation.id).local_app_data == {
+            "gnb-name": f"{state_in.model.name}-gnb-sdcore-gnb-integrator",
+        }
+
+
+    def test_given_sharded_plmns_when_snapshot_then_plmns_of_every_shard_are_returned(self):
+        shards = [[{"mcc": "001", "mnc": "01", "sst": sst}] for sst in range(3)]
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=sharded_remote_app_data(shards),
+        )
+        state_in = testing.State(leader=True, relations=[core_gnb_relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            snapshot = manager.charm._core_gnb_requirer.snapshot()
+
+        assert snapshot is not None
+        assert snapshot.plmns == tuple(PLMN(**plmn) for shard in shards for plmn in shard)
+
+    def test_given_one_shard_changed_when_snapshot_then_only_changed_shard_is_decoded(self):
+        shards = [[{"mcc": "001", "mnc": "01", "sst": sst}] for sst in range(3)]
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=sharded_remote_app_data(shards),
+        )
+        state = self.ctx.run(
+            self.ctx.on.update_status(), testing.State(leader=True, relations=[core_gnb_relation])
+        )
+        shards[1] = [{"mcc": "001", "mnc": "01", "sst": 42}]
+        changed_relation = dataclasses.replace(
+            state.get_relation(core_gnb_relation.id),
+            remote_app_data=sharded_remote_app_data(shards),
+        )
+        state = dataclasses.replace(state, relations=[changed_relation])
+
+        with patch(
+            "charms.sdcore_nms_k8s.v0.fiveg_core_gnb.iter_plmns", wraps=fiveg_core_gnb.iter_plmns
+        ) as mock_iter_plmns:
+            with self.ctx(self.ctx.on.update_status(), state) as manager:
+                snapshot = manager.charm._core_gnb_requirer.snapshot()
+
+        mock_iter_plmns.assert_called_once_with(json.dumps(shards[1]), max_length=None)
+        assert snapshot is not None
+        assert snapshot.plmns == tuple(PLMN(**plmn) for shard in shards for plmn in shard)
+
+    @pytest.mark.parametrize(
+        "remote_app_data,reason",
+        [
+            pytest.param(
+                {**sharded_remote_app_data([[{"mcc": "001", "mnc": "01", "sst": 1}]]),
+                 "plmns.0": json.dumps([{"mcc": "001", "mnc": "01", "sst": 2}])},
+                "schema",
+                id="digest_mismatch",
+            ),
+            pytest.param(
+                {
+                    key: value
+                    for key, value in sharded_remote_app_data(
+                        [[{"mcc": "001", "mnc": "01", "sst": 1}]] * 2
+                    ).items()
+                    if key != "plmns.1"
+                },
+                "missing-keys",
+                id="missing_shard",
+            ),
+            pytest.param(
+                sharded_remote_app_data([[{"mcc": "01", "mnc": "01", "sst": 1}]]),
+                "schema",
+                id="invalid_plmn",
+            ),
+            pytest.param(
+                {"tac": "1", "plmns-manifest": "not json"}, "json-decode", id="invalid_manifest"
+            ),
+        ],
+    )
+    def test_given_invalid_sharded_plmns_when_snapshot_then_none_is_returned(
+        self, remote_app_data, reason
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=remote_app_data,
+        )
+        state_in = testing.State(leader=True, relations=[core_gnb_relation])
+
+        with self.ctx(self.ctx.on.update_status(), state_in) as manager:
+            requirer = manager.charm._core_gnb_requirer
+            assert requirer.snapshot() is None
+            assert requirer.validation_failures[ValidationFailureReason(reason)] == 1
+
+
+class TestPLMN:
+    def test_given_plmn_when_modified_then_attribute_error_is_raised(self):
+        plmn = PLMN(mcc="001", mnc="01", sst=1, sd=1)
+
+        with pytest.raises(AttributeError):
+            plmn.sst = 2  # type: ignore[misc]
+
+    def test_given_equal_plmns_when_hashed_then_they_are_deduplicated(self):
+        plmns = {PLMN(mcc="001", mnc="01", sst=1), PLMN(mcc="001", mnc="01", sst=1, sd=None)}
+
+        assert plmns == {PLMN(mcc="001", mnc="01", sst=1)}
+
+    def test_given_plmn_when_pickled_then_it_is_restored(self):
+        plmn = PLMN(mcc="001", mnc="01", sst=1, sd=1)
+
+        assert pickle.loads(pickle.dumps(plmn)) == plmn
+
+    def test_given_plmn_when_asdict_then_fields_are_returned(self):
+        plmn = PLMN(mcc="001", mnc="01", sst=1, sd=1)
+
+        assert plmn.asdict() == {"mcc": "001", "mnc": "01", "sst": 1, "sd": 1}
+
+    def test_given_plmn_config_with_same_fields_when_compared_then_plmn_is_equal(self):
+        plmn = PLMN(mcc="001", mnc="01", sst=1, sd=1)
+
+        assert plmn == fiveg_core_gnb.PLMNConfig(mcc="001", mnc="01", sst=1, sd=1)
+        assert fiveg_core_gnb.PLMNConfig(mcc="001", mnc="01", sst=1, sd=1) == plmn
+        assert plmn != fiveg_core_gnb.PLMNConfig(mcc="001", mnc="01", sst=1, sd=2)
+        assert [plmn] == [fiveg_core_gnb.PLMNConfig(mcc="001", mnc="01", sst=1, sd=1)]
+
+    @pytest.mark.parametrize(
+        "mcc,mnc,plmn_id_hex",
+        [
+            pytest.param("001", "01", "00f110", id="2_digits_mnc"),
+            pytest.param("208", "93", "02f839", id="2_digits_mnc_nonzero"),
+            pytest.param("310", "410", "130014", id="3_digits_mnc"),
+            pytest.param("208", "093", "023890", id="3_digits_mnc_leading_zero"),
+        ],
+    )
+    def test_given_plmn_when_encoded_then_bcd_plmn_id_round_trips(self, mcc, mnc, plmn_id_hex):
+        plmn = PLMN(mcc=mcc, mnc=mnc, sst=1, sd=0x102030)
+
+        assert plmn.plmn_id_hex == plmn_id_hex
+        assert plmn.plmn_id == bytes.fromhex(plmn_id_hex)
+        assert PLMN.from_encoded(plmn.plmn_id, plmn.snssai) == plmn
+
+    @pytest.mark.parametrize(
+        "sd,snssai_hex",
+        [
+            pytest.param(0x102030, "01102030", id="with_sd"),
+            pytest.param(None, "01", id="without_sd"),
+        ],
+    )
+    def test_given_plmn_when_encoded_then_snssai_round_trips(self, sd, snssai_hex):
+        plmn = PLMN(mcc="001", mnc="01", sst=1, sd=sd)
+
+        assert plmn.snssai_hex == snssai_hex
+        assert PLMN.from_encoded(plmn.plmn_id, plmn.snssai) == plmn
+
+    @pytest.mark.parametrize(
+        "plmn_id,snssai",
+        [
+            pytest.param(b"\x00\xf1", b"\x01", id="short_plmn_id"),
+            pytest.param(b"\x00\xfa\x10", b"\x01", id="non_bcd_digit"),
+            pytest.param(b"\x00\xf1\x10", b"\x01\x10", id="truncated_sd"),
+        ],
+    )
+    def test_given_invalid_encoding_when_from_encoded_then_value_error_is_raised(
+        self, plmn_id, snssai
+    ):
+        with pytest.raises(ValueError):
+            PLMN.from_encoded(plmn_id, snssai)
+
+    def test_given_plmns_when_packed_then_they_are_unpacked_in_order(self):
+        plmns = (
+            PLMN(mcc="001", mnc="01", sst=1, sd=0x102030),
+            PLMN(mcc="310", mnc="410", sst=2),
+        )
+        snapshot = GnbConfigSnapshot(tac=1, plmns=plmns)
+
+        packed = snapshot.packed_plmns
+
+        assert packed == bytes.fromhex("00f11001102030" "13001402ffffff")
+        assert unpack_plmns(packed) == plmns
+
+    def test_given_largest_valid_sd_when_packed_then_it_is_unpacked_unchanged(self):
+        plmns = (PLMN(mcc="001", mnc="01", sst=1, sd=0xFFFFFE),)
+
+        assert unpack_plmns(GnbConfigSnapshot(tac=1, plmns=plmns).packed_plmns) == plmns
+
+    def test_given_reserved_sd_when_plmn_then_plmn_has_no_sd(self):
+        plmn = PLMN(mcc="001", mnc="01", sst=1, sd=0xFFFFFF)
+
+        assert plmn == PLMN(mcc="001", mnc="01", sst=1)
+        assert plmn == fiveg_core_gnb.PLMNConfig(mcc="001", mnc="01", sst=1, sd=0xFFFFFF)
+        assert plmn.snssai_hex == "01"
+        assert unpack_plmns(GnbConfigSnapshot(tac=1, plmns=(plmn,)).packed_plmns) == (plmn,)
+
+    def test_given_truncated_packed_plmns_when_unpacked_then_value_error_is_raised(self):
+        packed = GnbConfigSnapshot(tac=1, plmns=(PLMN(mcc="001", mnc="01", sst=1),)).packed_plmns
+
+        with pytest.raises(ValueError):
+            unpack_plmns(packed[:-1])
+
+
+class TestIterPLMNs:
+    def test_given_valid_plmns_when_iter_plmns_then_plmns_are_yielded_in_order(self):
+        raw = (
+            ' [ {"mcc": "001", "mnc": "01", "sst": 1, "sd": 1} ,\n'
+            '{"mcc": "208", "mnc": "093", "sst": 2} ] '
+        )
+
+        assert list(iter_plmns(raw)) == [
+            PLMN(mcc="001", mnc="01", sst=1, sd=1),
+            PLMN(mcc="208", mnc="093", sst=2),
+        ]
+
+    def test_given_invalid_plmn_when_iter_plmns_then_decoding_stops_at_its_index(self):
+        raw = (
+            '[{"mcc": "001", "mnc": "01", "sst": 1}, {"mcc": "1", "mnc": "01", "sst": 1}, '
+            "not even json"
+        )
+        plmns = iter_plmns(raw)
+
+        assert next(plmns) == PLMN(mcc="001", mnc="01", sst=1)
+        with pytest.raises(PLMNDecodeError) as e:
+            next(plmns)
+        assert e.value.index == 1
+
+    def test_given_more_plmns_than_max_length_when_iter_plmns_then_error_is_raised(self):
+        raw = json.dumps([{"mcc": "001", "mnc": "01", "sst": sst} for sst in range(3)])
+
+        with pytest.raises(PLMNDecodeError) as e:
+            list(iter_plmns(raw, max_length=2))
+
+        assert e.value.index == 2
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            pytest.param("", id="empty_string"),
+            pytest.param('{"mcc": "001", "mnc": "01", "sst": 1}', id="not_a_list"),
+            pytest.param("[]", id="empty_list"),
+            pytest.param('[{"mcc": "001", "mnc": "01", "sst": 1}] []', id="trailing_data"),
+        ],
+    )
+    def test_given_malformed_list_when_iter_plmns_then_error_is_raised_without_index(self, raw):
+        with pytest.raises(PLMNDecodeError) as e:
+            list(iter_plmns(raw))
+
+        assert e.value.index is None
+
+    def test_given_many_plmns_when_iter_plmns_then_peak_memory_is_below_decoding_the_whole_list(
+        self,
+    ):
+        raw = json.dumps(
+            [{"mcc": "001", "mnc": "01", "sst": 1, "sd": sd} for sd in range(10_000)]
+        )
+        next(iter_plmns(raw))
+
+        tracemalloc.start()
+        json.loads(raw)
+        _, json_loads_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in iter_plmns(raw):
+            pass
+        _, iter_plmns_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert iter_plmns_peak < json_loads_peak / 10
+
+
+class TestValidatePLMNs:
+    def test_given_valid_plmns_when_validate_plmns_then_plmns_are_returned_in_order(self):
+        plmns = [
+            {"mcc": "001", "mnc": "01", "sst": 1, "sd": 1},
+            {"mcc": "208", "mnc": "093", "sst": 255, "sd": None},
+            {"mcc": "302", "mnc": "720", "sst": 0},
+        ]
+
+        assert validate_plmns(plmns) == tuple(
+            PLMN(plmn["mcc"], plmn["mnc"], plmn["sst"], plmn.get("sd")) for plmn in plmns
+        )
+
+    def test_given_invalid_plmn_when_validate_plmns_then_pydantic_error_is_reported_with_index(
+        self,
+    ):
+        plmns = [{"mcc": "001", "mnc": "01", "sst": 1}, {"mcc": "001", "mnc": "01", "sst": 256}]
+
+        with pytest.raises(PLMNDecodeError) as e:
+            validate_plmns(plmns)
+
+        assert e.value.index == 1
+        assert "less than or equal to 255" in str(e.value)
+
+    def test_given_plmn_with_unknown_field_when_validate_plmns_then_field_is_ignored(self):
+        plmns = [{"mcc": "001", "mnc": "01", "sst": 1, "new-field": 1}]
+
+        assert validate_plmns(plmns) == (PLMN(mcc="001", mnc="01", sst=1),)
+
+    @pytest.mark.parametrize(
+        "plmn",
+        [
+            pytest.param({"mcc": "001\n", "mnc": "01", "sst": 1}, id="trailing_newline"),
+            pytest.param({"mcc": "0001", "mnc": "01", "sst": 1}, id="long_mcc"),
+            pytest.param({"mcc": "001", "mnc": "1", "sst": 1}, id="short_mnc"),
+            pytest.param({"mcc": "001", "mnc": "01", "sst": True}, id="boolean_sst"),
+            pytest.param({"mcc": "001", "mnc": "01", "sst": 1.0}, id="float_sst"),
+            pytest.param({"mcc": "001", "mnc": "01", "sst": -1}, id="negative_sst"),
+            pytest.param({"mcc": "001", "mnc": "01", "sst": 1, "sd": "1"}, id="string_sd"),
+            pytest.param({"mcc": "001", "mnc": "01", "sst": 1, "sd": 16777216}, id="large_sd"),
+            pytest.param({"mcc": "001", "mnc": "01", "sst": 1, "sd": 0xFFFFFF}, id="reserved_sd"),
+            pytest.param({"mcc": "001", "mnc": "01", "sst": 1, "sd": 0xFFFFFE}, id="max_sd"),
+            pytest.param({"mcc": "001", "mnc": "01"}, id="missing_sst"),
+            pytest.param(["001", "01", 1], id="not_an_object"),
+        ],
+    )
+    def test_given_edge_case_plmn_when_validate_plmns_then_result_matches_pydantic(self, plmn):
+        try:
+            fiveg_core_gnb.FivegCoreGnbProviderAppData(tac=1, plmns=[plmn])
+            expected_valid = True
+        except (TypeError, ValueError):
+            expected_valid = False
+
+        try:
+            validate_plmns([plmn])
+            valid = True
+        except PLMNDecodeError:
+            valid = False
+
+        assert valid == expected_valid
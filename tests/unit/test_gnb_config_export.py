@@ -0,0 +1,152 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import dataclasses
+import json
+
+import pytest
+from ops import testing
+
+from tests.unit.fixtures import VALID_PLMNS, VALID_REMOTE_APP_DATA, CharmRootTestFixtures
+
+PLMN = VALID_PLMNS[0]
+EXPORTED_PLMNS = [
+    {**VALID_PLMNS[0], "plmn_id": "00f110", "snssai": "01102030"},
+    {**VALID_PLMNS[1], "plmn_id": "00f110", "snssai": "02"},
+]
+EXPORTED_PLMN = EXPORTED_PLMNS[0]
+
+
+class TestGnbConfigExport(CharmRootTestFixtures):
+    @pytest.fixture(autouse=True)
+    def gnb_config_path(self, tmp_path):
+        self.gnb_config_path = tmp_path / "gnb-config.json"
+
+    def run_relation_changed(self, state: testing.State) -> testing.State:
+        (relation,) = state.relations
+        return self.ctx.run(self.ctx.on.relation_changed(relation, remote_unit=0), state)
+
+    def test_given_valid_remote_data_when_relation_changed_then_gnb_config_is_exported(self):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=VALID_REMOTE_APP_DATA,
+        )
+        state_in = testing.State(
+            leader=True,
+            model=testing.Model(name="whatever"),
+            relations=[core_gnb_relation],
+            config={"gnb-config-path": str(self.gnb_config_path)},
+        )
+
+        self.run_relation_changed(state_in)
+
+        gnb_config = json.loads(self.gnb_config_path.read_text())
+        assert gnb_config["generation"] == 1
+        assert gnb_config["gnbs"] == {
+            "whatever-gnb-sdcore-gnb-integrator": {"tac": 1, "plmns": EXPORTED_PLMNS},
+        }
+        assert len(gnb_config["digest"]) == 64
+        assert not list(self.gnb_config_path.parent.glob(".*.tmp"))
+
+    def test_given_unchanged_remote_data_when_relation_changed_then_gnb_config_is_not_rewritten(
+        self,
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=VALID_REMOTE_APP_DATA,
+        )
+        state = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            config={"gnb-config-path": str(self.gnb_config_path)},
+        )
+        state = self.run_relation_changed(state)
+        modified_time = self.gnb_config_path.stat().st_mtime_ns
+
+        self.run_relation_changed(state)
+
+        assert self.gnb_config_path.stat().st_mtime_ns == modified_time
+        assert json.loads(self.gnb_config_path.read_text())["generation"] == 1
+
+    def test_given_changed_remote_data_when_relation_changed_then_generation_is_incremented(
+        self,
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=VALID_REMOTE_APP_DATA,
+        )
+        state = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            config={"gnb-config-path": str(self.gnb_config_path)},
+        )
+        state = self.run_relation_changed(state)
+        (relation,) = state.relations
+        state = dataclasses.replace(
+            state,
+            relations=[
+                dataclasses.replace(
+                    relation, remote_app_data={**VALID_REMOTE_APP_DATA, "tac": "2"}
+                )
+            ],
+        )
+
+        self.run_relation_changed(state)
+
+        gnb_config = json.loads(self.gnb_config_path.read_text())
+        assert gnb_config["generation"] == 2
+        assert [gnb["tac"] for gnb in gnb_config["gnbs"].values()] == [2]
+
+    def test_given_deleted_gnb_config_when_update_status_then_gnb_config_is_exported_again(self):
+        state = testing.State(leader=True, config={"gnb-config-path": str(self.gnb_config_path)})
+        state = self.ctx.run(self.ctx.on.update_status(), state)
+        self.gnb_config_path.unlink()
+
+        self.ctx.run(self.ctx.on.update_status(), state)
+
+        gnb_config = json.loads(self.gnb_config_path.read_text())
+        assert gnb_config["generation"] == 2
+        assert gnb_config["gnbs"] == {}
+
+    def test_given_fleet_mode_when_relation_changed_then_configured_gnbs_are_exported(self):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data={
+                "gnb-configs": json.dumps(
+                    {
+                        "gnb001": {"tac": 1, "plmns": [PLMN]},
+                        "gnb002": {"tac": 2, "plmns": [{**PLMN, "sd": None}]},
+                        "not-served": {"tac": 3, "plmns": [PLMN]},
+                    }
+                )
+            },
+        )
+        state_in = testing.State(
+            leader=False,
+            relations=[core_gnb_relation],
+            config={
+                "gnb-config-path": str(self.gnb_config_path),
+                "gnb-names": "gnb001,gnb002,gnb003",
+            },
+        )
+
+        self.run_relation_changed(state_in)
+
+        assert json.loads(self.gnb_config_path.read_text())["gnbs"] == {
+            "gnb001": {"tac": 1, "plmns": [EXPORTED_PLMN]},
+            "gnb002": {
+                "tac": 2,
+                "plmns": [{**EXPORTED_PLMN, "sd": None, "snssai": "01"}],
+            },
+        }
+
+    def test_given_no_gnb_config_path_when_update_status_then_nothing_is_exported(
+        self, tmp_path
+    ):
+        self.ctx.run(self.ctx.on.update_status(), testing.State(leader=True))
+
+        assert not list(tmp_path.glob("*gnb*"))
@@ -0,0 +1,94 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import dataclasses
+import json
+from unittest.mock import patch
+
+import pytest
+from ops import testing
+
+from hook_tools import HOOK_TOOL_CALL_BUDGET_ENV, HookToolBudgetExceededError
+from tests.unit.fixtures import VALID_REMOTE_APP_DATA, CharmRootTestFixtures
+
+# Hook tool calls allowed per hook once the gNB name is published. `is-leader` is not budgeted,
+# as ops caches the leadership.
+HOOK_TOOL_CALL_BUDGETS = {
+    "relation_changed": {"relation-get": 2, "relation-set": 0, "relation-ids": 1},
+    "update_status": {"relation-get": 2, "relation-set": 0, "relation-ids": 1},
+    "collect_unit_status": {"relation-get": 2, "relation-set": 0, "relation-ids": 1},
+}
+
+
+class TestHookToolAccounting(CharmRootTestFixtures):
+    @pytest.fixture(autouse=True)
+    def gnb_name_published(self, context):
+        self.relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=VALID_REMOTE_APP_DATA,
+        )
+        self.state = self.ctx.run(
+            self.ctx.on.relation_changed(self.relation, remote_unit=0),
+            testing.State(leader=True, relations=[self.relation]),
+        )
+
+    @pytest.fixture()
+    def set_budget(self, monkeypatch):
+        def set_budget(budget: dict) -> None:
+            monkeypatch.setenv(HOOK_TOOL_CALL_BUDGET_ENV, json.dumps(budget))
+
+        return set_budget
+
+    def _event(self, event_name: str):
+        if event_name == "relation_changed":
+            relation = self.state.get_relation(self.relation.id)
+            return self.ctx.on.relation_changed(relation, remote_unit=0)
+        return getattr(self.ctx.on, event_name)()
+
+    @pytest.mark.parametrize("event_name", list(HOOK_TOOL_CALL_BUDGETS))
+    def test_given_gnb_name_published_when_hook_runs_then_hook_tool_calls_are_within_budget(
+        self, event_name, set_budget
+    ):
+        set_budget(HOOK_TOOL_CALL_BUDGETS[event_name])
+
+        self.ctx.run(self._event(event_name), self.state)
+
+    def test_given_gnb_name_not_published_when_relation_changed_then_relation_is_read_once(
+        self, set_budget
+    ):
+        state_in = testing.State(leader=True, relations=[self.relation])
+        set_budget({"relation-get": 2, "relation-set": 1, "relation-ids": 1})
+
+        self.ctx.run(self.ctx.on.relation_changed(self.relation, remote_unit=0), state_in)
+
+    def test_given_budget_exceeded_when_hook_runs_then_hook_fails(self, set_budget):
+        set_budget({"relation-get": 1})
+
+        with pytest.raises(testing.errors.UncaughtCharmError) as e:
+            self.ctx.run(self.ctx.on.update_status(), self.state)
+
+        assert isinstance(e.value.__cause__, HookToolBudgetExceededError)
+
+    def test_given_stats_path_when_hook_runs_then_hook_tool_calls_are_written_to_file(self):
+        stats_path = self.charm_root / "hook-tool-calls.json"
+        state_in = dataclasses.replace(
+            self.state, config={"hook-tool-stats-path": str(stats_path)}
+        )
+
+        self.ctx.run(self.ctx.on.update_status(), state_in)
+
+        summary = json.loads(stats_path.read_text())
+        assert summary["hook"] == "hooks/update-status"
+        assert summary["calls"]["relation-get"]["count"] == 2
+        assert summary["calls"]["relation-set"]["count"] == 0
+        assert summary["calls"]["relation-get"]["total_ms"] >= 0
+
+    def test_given_no_stats_path_nor_budget_when_hook_runs_then_hook_tools_are_not_accounted(
+        self,
+    ):
+        with patch("charm.HookToolAccounting") as mock_hook_tool_accounting:
+            self.ctx.run(self.ctx.on.update_status(), self.state)
+
+        mock_hook_tool_accounting.assert_not_called()
+        assert not list(self.charm_root.glob("*hook-tool*"))
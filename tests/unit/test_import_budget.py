@@ -0,0 +1,70 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+import os
+import subprocess
+import sys
+
+# Import time of the `charm` module, on top of the import of `ops`, relative to the import time
+# of `ops` in the same process. Every hook is a fresh Python process, so this is paid by every
+# single hook execution. It is about 0.5 when validation dependencies are imported lazily.
+CHARM_IMPORT_TIME_BUDGET_RELATIVE_TO_OPS = 1.0
+
+# Modules that must only be imported when relation data is actually validated.
+LAZILY_IMPORTED_MODULES = ("pydantic", "pydantic_core", "interface_tester")
+
+
+def _run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    )
+
+
+class TestImportBudget:
+    def test_when_charm_is_imported_then_validation_dependencies_are_not_imported(self):
+        process = _run_python("import json, sys, charm; print(json.dumps(sorted(sys.modules)))")
+
+        imported_modules = json.loads(process.stdout)
+
+        assert not [
+            module
+            for module in imported_modules
+            if module.split(".")[0] in LAZILY_IMPORTED_MODULES
+        ]
+
+    def test_when_charm_is_imported_then_import_time_is_within_budget(self):
+        process = _run_python("import charm", "-X", "importtime")
+
+        cumulative_import_times_us = {
+            line.split("|")[-1].strip(): int(line.split("|")[1])
+            for line in process.stderr.splitlines()[1:]
+        }
+        ops_import_time_us = cumulative_import_times_us["ops"]
+        charm_import_time_us = cumulative_import_times_us["charm"] - ops_import_time_us
+
+        assert charm_import_time_us < ops_import_time_us * CHARM_IMPORT_TIME_BUDGET_RELATIVE_TO_OPS
+
+    def test_given_valid_plmns_when_validated_then_validation_dependencies_are_not_imported(self):
+        process = _run_python(
+            "import sys, charm; "
+            "from charms.sdcore_nms_k8s.v0.fiveg_core_gnb import iter_plmns; "
+            "list(iter_plmns('[{\"mcc\": \"001\", \"mnc\": \"01\", \"sst\": 1}]')); "
+            "print('pydantic' in sys.modules)"
+        )
+
+        assert process.stdout.strip() == "False"
+
+    def test_given_charm_imported_when_validation_models_accessed_then_they_are_loaded(self):
+        process = _run_python(
+            "import sys, charm; "
+            "from charms.sdcore_nms_k8s.v0.fiveg_core_gnb import PLMNConfig; "
+            "PLMNConfig(mcc='001', mnc='01', sst=1); "
+            "print('pydantic' in sys.modules)"
+        )
+
+        assert process.stdout.strip() == "True"
@@ -0,0 +1,113 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+from pathlib import Path
+
+import pytest
+from ops import testing
+
+from tests.unit.fixtures import VALID_REMOTE_APP_DATA, CharmRootTestFixtures
+
+
+def scrape(path: Path) -> dict:
+    """Return the samples of a metrics file in the Prometheus text exposition format."""
+    samples = {}
+    for line in path.read_text().splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+class TestMetrics(CharmRootTestFixtures):
+    @pytest.fixture(autouse=True)
+    def metrics_path(self, tmp_path):
+        self.metrics_path = tmp_path / "metrics.prom"
+        self.config = {"metrics-path": str(self.metrics_path)}
+
+    def test_given_valid_remote_data_when_relation_changed_then_gnb_config_metrics_are_written(
+        self,
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=VALID_REMOTE_APP_DATA,
+        )
+        state_in = testing.State(
+            leader=True, relations=[core_gnb_relation], config=self.config
+        )
+
+        self.ctx.run(self.ctx.on.relation_changed(core_gnb_relation, remote_unit=0), state_in)
+
+        samples = scrape(self.metrics_path)
+        assert samples["gnb_integrator_gnb_config_valid"] == 1
+        assert samples["gnb_integrator_plmns"] == 2
+        assert samples["gnb_integrator_tac"] == 1
+        assert samples["gnb_integrator_last_publish_timestamp_seconds"] > 0
+        assert samples['gnb_integrator_validation_failures_total{reason="schema"}'] == 0
+
+    @pytest.mark.parametrize(
+        "remote_app_data,reason",
+        [
+            pytest.param({"tac": "1", "plmns": "[{"}, "json-decode", id="json_decode"),
+            pytest.param(
+                {"tac": "1", "plmns": json.dumps([{"mcc": "1", "mnc": "01", "sst": 1}])},
+                "schema",
+                id="schema",
+            ),
+            pytest.param({"tac": "1"}, "missing-keys", id="missing_keys"),
+        ],
+    )
+    def test_given_invalid_remote_data_when_relation_changed_then_validation_failure_is_counted(
+        self, remote_app_data, reason
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=remote_app_data,
+        )
+        state_in = testing.State(
+            leader=True, relations=[core_gnb_relation], config=self.config
+        )
+
+        self.ctx.run(self.ctx.on.relation_changed(core_gnb_relation, remote_unit=0), state_in)
+
+        samples = scrape(self.metrics_path)
+        assert samples["gnb_integrator_gnb_config_valid"] == 0
+        assert samples["gnb_integrator_plmns"] == 0
+        assert samples[f'gnb_integrator_validation_failures_total{{reason="{reason}"}}'] == 1
+
+    def test_given_several_hooks_when_update_status_then_hook_durations_are_accumulated(self):
+        state = testing.State(leader=True, config=self.config)
+
+        for _ in range(2):
+            state = self.ctx.run(self.ctx.on.update_status(), state)
+
+        samples = scrape(self.metrics_path)
+        assert samples['gnb_integrator_hook_duration_seconds_count{event="update-status"}'] == 2
+        assert samples[
+            'gnb_integrator_hook_duration_seconds_bucket{event="update-status",le="+Inf"}'
+        ] == 2
+        assert samples['gnb_integrator_hook_duration_seconds_sum{event="update-status"}'] > 0
+
+    def test_given_metrics_path_configured_when_update_status_then_metrics_are_written_to_it(
+        self, tmp_path
+    ):
+        metrics_path = tmp_path / "textfile-collector" / "gnb-integrator.prom"
+        metrics_path.parent.mkdir()
+        state_in = testing.State(leader=True, config={"metrics-path": str(metrics_path)})
+
+        self.ctx.run(self.ctx.on.update_status(), state_in)
+
+        assert "gnb_integrator_gnb_config_valid" in scrape(metrics_path)
+        assert not self.metrics_path.exists()
+
+    def test_given_no_metrics_path_when_update_status_then_metrics_are_not_recorded(self):
+        state_out = self.ctx.run(self.ctx.on.update_status(), testing.State(leader=True))
+
+        assert list(self.charm_root.rglob("*.prom")) == []
+        stored_state = state_out.get_stored_state(
+            "_stored", owner_path="SdcoreGnbIntegratorCharm"
+        )
+        assert not stored_state.content.get("hook_durations")
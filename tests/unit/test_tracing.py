@@ -0,0 +1,112 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import socket
+import time
+from unittest.mock import patch
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.util._once import Once
+from ops import testing
+
+from tests.unit.fixtures import VALID_REMOTE_APP_DATA, CharmRootTestFixtures
+from tracing import EXPORT_TIMEOUT_SECONDS
+
+TRACING_ENDPOINT = "http://otel-collector:4318/v1/traces"
+
+
+class TestTracing(CharmRootTestFixtures):
+    @pytest.fixture(autouse=True)
+    def tracer_provider(self):
+        """Let every test set the global tracer provider, which can only be set once."""
+        trace._TRACER_PROVIDER_SET_ONCE = Once()
+        trace._TRACER_PROVIDER = None
+        yield
+        trace._TRACER_PROVIDER_SET_ONCE = Once()
+        trace._TRACER_PROVIDER = None
+
+    @pytest.fixture()
+    def span_exporter(self):
+        self.span_exporter = InMemorySpanExporter()
+        with patch(
+            "opentelemetry.exporter.otlp.proto.http.trace_exporter.OTLPSpanExporter",
+            return_value=self.span_exporter,
+        ) as mock_otlp_span_exporter:
+            self.mock_otlp_span_exporter = mock_otlp_span_exporter
+            yield
+
+    def spans(self) -> dict:
+        """Return the exported spans, by name."""
+        spans = {}
+        for span in self.span_exporter.get_finished_spans():
+            spans.setdefault(span.name, []).append(span)
+        return spans
+
+    def test_given_relation_changed_when_hook_runs_then_charm_and_library_spans_are_exported(
+        self, span_exporter
+    ):
+        core_gnb_relation = testing.Relation(
+            endpoint="fiveg_core_gnb",
+            interface="fiveg_core_gnb",
+            remote_app_data=VALID_REMOTE_APP_DATA,
+        )
+        state_in = testing.State(
+            leader=True,
+            relations=[core_gnb_relation],
+            config={"tracing-endpoint": TRACING_ENDPOINT},
+        )
+
+        self.ctx.run(self.ctx.on.relation_changed(core_gnb_relation, remote_unit=0), state_in)
+
+        spans = self.spans()
+        (root,) = [span for named in spans.values() for span in named if span.parent is None]
+        assert root.attributes["juju.dispatch_path"] == root.name
+        assert root.attributes["process.startup_cpu_seconds"] > 0
+        assert root.resource.attributes["service.name"] == "sdcore-gnb-integrator"
+        (configure,) = spans["SdcoreGnbIntegratorCharm._configure"]
+        assert configure.context.trace_id == root.context.trace_id
+        assert configure.attributes["fiveg_core_gnb.relation_id"] == core_gnb_relation.id
+        assert configure.attributes["gnb_integrator.published"] is True
+        assert "fiveg_core_gnb.publish_gnb_information" in spans
+        assert "fiveg_core_gnb.parse_provider_databag" in spans
+        cache_lookups = [
+            span.attributes["fiveg_core_gnb.validation_cache"]
+            for span in spans["fiveg_core_gnb.get_remote_app_relation_data"]
+        ]
+        assert cache_lookups[0] == "miss"
+        assert set(cache_lookups[1:]) <= {"hit"}
+
+    def test_given_tracing_endpoint_when_hook_runs_then_spans_are_exported_to_it(
+        self, span_exporter
+    ):
+        state_in = testing.State(leader=True, config={"tracing-endpoint": TRACING_ENDPOINT})
+
+        self.ctx.run(self.ctx.on.update_status(), state_in)
+
+        self.mock_otlp_span_exporter.assert_called_once_with(
+            endpoint=TRACING_ENDPOINT, timeout=EXPORT_TIMEOUT_SECONDS
+        )
+
+    def test_given_no_tracing_endpoint_when_hook_runs_then_spans_are_not_exported(
+        self, span_exporter
+    ):
+        self.ctx.run(self.ctx.on.update_status(), testing.State(leader=True))
+
+        self.mock_otlp_span_exporter.assert_not_called()
+
+    def test_given_unresponsive_collector_when_hook_runs_then_hook_is_not_held_back(self):
+        with socket.socket() as collector:
+            # Accepts connections in its backlog but never answers.
+            collector.bind(("127.0.0.1", 0))
+            collector.listen()
+            port = collector.getsockname()[1]
+            state_in = testing.State(
+                leader=True, config={"tracing-endpoint": f"http://127.0.0.1:{port}/v1/traces"}
+            )
+
+            start = time.monotonic()
+            self.ctx.run(self.ctx.on.update_status(), state_in)
+
+            assert time.monotonic() - start < EXPORT_TIMEOUT_SECONDS